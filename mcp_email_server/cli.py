@@ -1,14 +1,18 @@
 import enum
 import os
+from typing import TYPE_CHECKING
 
 import typer
-from mcp.server.transport_security import TransportSecuritySettings
+
 from mcp_email_server import keyring_store
-import uvicorn
-from mcp_email_server.app import mcp
 from mcp_email_server.config import Settings, delete_settings
 
-from mcp_email_server.server_utils import create_starlette
+if TYPE_CHECKING:
+    from mcp.server.transport_security import TransportSecuritySettings
+
+# The MCP server (and its FastMCP/uvicorn dependency trees) are imported inside
+# the transport commands: stdio is spawned per client connection, and commands
+# like `reset` or `migrate-credentials` never need them at all.
 
 app = typer.Typer()
 
@@ -101,7 +105,9 @@ def _default_allowed_origins(host: str, port: int) -> list[str]:
     return allowed_origins
 
 
-def _build_transport_security_settings(host: str, port: int) -> TransportSecuritySettings:
+def _build_transport_security_settings(host: str, port: int) -> "TransportSecuritySettings":
+    from mcp.server.transport_security import TransportSecuritySettings
+
     allowed_hosts = _split_csv(os.environ.get("MCP_ALLOWED_HOSTS"))
     allowed_origins = _split_csv(os.environ.get("MCP_ALLOWED_ORIGINS"))
 
@@ -118,6 +124,8 @@ def _build_transport_security_settings(host: str, port: int) -> TransportSecurit
 
 
 def _configure_http_transport(host: str, port: int) -> None:
+    from mcp_email_server.app import mcp
+
     mcp.settings.host = host
     mcp.settings.port = port
     mcp.settings.transport_security = _build_transport_security_settings(host, port)
@@ -125,6 +133,8 @@ def _configure_http_transport(host: str, port: int) -> None:
 
 @app.command()
 def stdio():
+    from mcp_email_server.app import mcp
+
     mcp.run(transport="stdio")
 
 
@@ -133,6 +143,11 @@ def sse(
     host: str = "localhost",
     port: int = 9557,
 ):
+    import uvicorn
+
+    from mcp_email_server.app import mcp
+    from mcp_email_server.server_utils import create_starlette
+
     _configure_http_transport(host, port)
     mcp.settings.sse_path = "/"
 
@@ -145,6 +160,11 @@ def streamable_http(
     host: str = os.environ.get("MCP_HOST", "localhost"),
     port: int = int(os.environ.get("MCP_PORT", 9557)),
 ):
+    import uvicorn
+
+    from mcp_email_server.app import mcp
+    from mcp_email_server.server_utils import create_starlette
+
     _configure_http_transport(host, port)
     mcp.settings.streamable_http_path = "/"
 
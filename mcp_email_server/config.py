@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import datetime
 import fnmatch
+import functools
 import os
 import shutil
 import tempfile
@@ -10,8 +11,7 @@ import tomllib
 from collections.abc import Iterable
 from email.utils import getaddresses, parseaddr
 from pathlib import Path
-from typing import Any, Literal, TypeGuard
-from zoneinfo import ZoneInfo
+from typing import Any, ClassVar, Literal, TypeGuard
 
 import tomli_w
 from pydantic import BaseModel, Field, PrivateAttr, SecretStr, SerializationInfo, field_serializer, model_validator
@@ -25,6 +25,8 @@ from pydantic_settings import (
 from mcp_email_server import keyring_store
 from mcp_email_server.log import logger
 
+_UTC = datetime.UTC
+
 DEFAULT_CONFIG_PATH = "~/.config/mcp-email-server/config.toml"
 LEGACY_CONFIG_PATH = "~/.config/zerolib/mcp_email_server/config.toml"
 CredentialStorage = Literal["auto", "keyring", "plaintext"]
@@ -41,11 +43,19 @@ def _is_credential_storage_mode(value: str) -> TypeGuard[CredentialStorage]:
 _MIGRATION_LOAD = False
 
 
+# Truthy environment values accepted by _parse_bool_env.
+_TRUE_BOOL_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
 def _parse_bool_env(value: str | None, default: bool = False) -> bool:
     """Parse boolean value from environment variable."""
     if value is None:
         return default
-    return value.lower() in ("true", "1", "yes", "on")
+    # Typical env values are already lowercase; only allocate the lowered copy
+    # for mixed-case input.
+    if value in _TRUE_BOOL_VALUES:
+        return True
+    return value.lower() in _TRUE_BOOL_VALUES
 
 
 def normalize_address(raw: str) -> str:
@@ -107,8 +117,11 @@ def _resolve_config_path() -> Path:
         return Path(configured_path).expanduser().resolve()
 
     config_path = Path(DEFAULT_CONFIG_PATH).expanduser().resolve()
+    if config_path.exists():
+        # Steady state: skip resolving and probing the legacy path entirely.
+        return config_path
     legacy_path = Path(LEGACY_CONFIG_PATH).expanduser().resolve()
-    if config_path.exists() or not legacy_path.is_file():
+    if not legacy_path.is_file():
         return config_path
 
     temporary_path: Path | None = None
@@ -148,6 +161,35 @@ def _resolve_config_path() -> Path:
 
 CONFIG_PATH = _resolve_config_path()
 
+# Setting-name suffixes recognised in MCP_EMAIL_<ACCOUNT>_* variables. Ordered
+# shortest-first so suffix matching picks the shortest known key, mirroring the
+# historical split/join scan (e.g. MCP_EMAIL_IMAP_USER_NAME is account "imap"
+# with USER_NAME, not a default-account IMAP_USER_NAME).
+_ENV_ACCOUNT_SETTING_KEYS = frozenset({
+    "ACCOUNT_NAME",
+    "FULL_NAME",
+    "EMAIL_ADDRESS",
+    "USER_NAME",
+    "PASSWORD",
+    "IMAP_HOST",
+    "IMAP_PORT",
+    "IMAP_SSL",
+    "IMAP_START_SSL",
+    "IMAP_VERIFY_SSL",
+    "IMAP_USER_NAME",
+    "IMAP_PASSWORD",
+    "SMTP_HOST",
+    "SMTP_PORT",
+    "SMTP_SSL",
+    "SMTP_START_SSL",
+    "SMTP_VERIFY_SSL",
+    "SMTP_USER_NAME",
+    "SMTP_PASSWORD",
+    "SAVE_TO_SENT",
+    "SENT_FOLDER_NAME",
+})
+_ENV_ACCOUNT_KEYS_BY_LENGTH = tuple(sorted(_ENV_ACCOUNT_SETTING_KEYS, key=len))
+
 
 class EmailServer(BaseModel):
     user_name: str
@@ -171,25 +213,29 @@ class EmailServer(BaseModel):
 class AccountAttributes(BaseModel):
     account_name: str
     description: str = ""
-    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(ZoneInfo("UTC")))
-    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(ZoneInfo("UTC")))
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(_UTC))
+    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(_UTC))
 
-    @model_validator(mode="after")
-    def update_updated_at(self) -> AccountAttributes:
-        """Update updated_at field."""
-        self.updated_at = datetime.datetime.now(ZoneInfo("UTC"))
-        return self
+    def model_post_init(self, context: Any, /) -> None:
+        """Refresh updated_at whenever an instance is (re)constructed."""
+        self.updated_at = datetime.datetime.now(_UTC)
+
+    @classmethod
+    def _identity_fields(cls) -> tuple[str, ...]:
+        """Field names compared by __eq__, cached per class on first use."""
+        fields = cls.__dict__.get("_identity_fields_cache")
+        if fields is None:
+            fields = tuple(name for name in cls.model_fields if name not in ("created_at", "updated_at"))
+            cls._identity_fields_cache = fields
+        return fields
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, AccountAttributes):
             return NotImplemented
-        return self.model_dump(exclude={"created_at", "updated_at"}) == other.model_dump(
-            exclude={"created_at", "updated_at"}
-        )
-
-    @field_serializer("created_at", "updated_at")
-    def serialize_datetime(self, v: datetime.datetime) -> str:
-        return v.isoformat()
+        fields = type(self)._identity_fields()
+        if fields != type(other)._identity_fields():
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in fields)
 
     def masked(self) -> AccountAttributes:
         return self.model_copy()
@@ -347,51 +393,32 @@ class EmailSettings(AccountAttributes):
     def from_env_many(cls) -> list[EmailSettings]:
         """Create multiple EmailSettings from MCP_EMAIL_<ACCOUNT>_* variables."""
         prefix = "MCP_EMAIL_"
-        known_keys = {
-            "ACCOUNT_NAME",
-            "FULL_NAME",
-            "EMAIL_ADDRESS",
-            "USER_NAME",
-            "PASSWORD",
-            "IMAP_HOST",
-            "IMAP_PORT",
-            "IMAP_SSL",
-            "IMAP_START_SSL",
-            "IMAP_VERIFY_SSL",
-            "IMAP_USER_NAME",
-            "IMAP_PASSWORD",
-            "SMTP_HOST",
-            "SMTP_PORT",
-            "SMTP_SSL",
-            "SMTP_START_SSL",
-            "SMTP_VERIFY_SSL",
-            "SMTP_USER_NAME",
-            "SMTP_PASSWORD",
-            "SAVE_TO_SENT",
-            "SENT_FOLDER_NAME",
-        }
+        prefix_len = len(prefix)
         accounts_dict: dict[str, dict[str, str]] = {}
 
         for key, value in os.environ.items():
             if not key.startswith(prefix) or key.startswith("MCP_EMAIL_SERVER_"):
                 continue
 
-            remaining = key[len(prefix) :]
-            parts = remaining.split("_")
+            remaining = key[prefix_len:]
             setting_key: str | None = None
-            account_parts: list[str] = []
-
-            for i in range(len(parts), 0, -1):
-                candidate = "_".join(parts[i - 1 :])
-                if candidate in known_keys:
-                    setting_key = candidate
-                    account_parts = parts[: i - 1]
+            account_key = "default"
+
+            # Match the shortest known setting-name suffix on an underscore
+            # boundary; two slices per variable instead of split + joined
+            # candidate strings for every suffix length.
+            for known_key in _ENV_ACCOUNT_KEYS_BY_LENGTH:
+                if remaining == known_key:
+                    setting_key = known_key
+                    break
+                if remaining.endswith(known_key) and remaining[-len(known_key) - 1] == "_":
+                    setting_key = known_key
+                    account_key = remaining[: -len(known_key) - 1]
                     break
 
             if setting_key is None:
                 continue
 
-            account_key = "_".join(account_parts) if account_parts else "default"
             accounts_dict.setdefault(account_key, {})[setting_key] = value
 
         all_items: list[EmailSettings] = []
@@ -485,8 +512,16 @@ class Settings(BaseSettings):
     # that same file; persisting the old mode would make the file self-contradictory.
     _credential_storage_override: CredentialStorage | None = PrivateAttr(default=None)
     _loaded_keyring_references: set[tuple[str, str]] = PrivateAttr(default_factory=set)
+    # Lazily built account_name -> account lookup; None means "rebuild on next
+    # get_account". Account names are unique (check_unique_account_names), so a
+    # length mismatch with emails+providers reliably detects in-place appends.
+    _account_index: dict[str, EmailSettings | ProviderSettings] | None = PrivateAttr(default=None)
 
-    model_config = SettingsConfigDict(toml_file=CONFIG_PATH, validate_assignment=True, revalidate_instances="always")
+    # validate_assignment keeps per-field checks and the unique-name model
+    # validator running on every reassignment; already-validated account
+    # instances are passed through by identity rather than re-walked
+    # (revalidate_instances default), so mutations cost O(1) validation.
+    model_config = SettingsConfigDict(toml_file=CONFIG_PATH, validate_assignment=True)
 
     @property
     def effective_credential_storage(self) -> CredentialStorage:
@@ -497,14 +532,12 @@ class Settings(BaseSettings):
         """
         return self._credential_storage_override or self.credential_storage
 
-    def _apply_bool_env_override(self, attr: str, env_var: str) -> None:
-        value = os.getenv(env_var)
+    def _apply_bool_env_override(self, attr: str, value: str | None) -> None:
         if value is not None:
             setattr(self, attr, _parse_bool_env(value, False))
             logger.info(f"Set {attr}={getattr(self, attr)} from environment variable")
 
-    def _pickup_credential_storage_override(self) -> None:
-        override = os.getenv("MCP_EMAIL_SERVER_CREDENTIAL_STORAGE")
+    def _pickup_credential_storage_override(self, override: str | None) -> None:
         if override is None:
             return
         if not _is_credential_storage_mode(override):
@@ -545,16 +578,20 @@ class Settings(BaseSettings):
         """Env-composited state, skipped entirely during migration loads (§7) so
         migration transforms the stored config, not the env-composited view.
         """
-        self._pickup_credential_storage_override()
-        self._apply_bool_env_override("enable_attachment_download", "MCP_EMAIL_SERVER_ENABLE_ATTACHMENT_DOWNLOAD")
-        self._apply_bool_env_override("report_blocked_mutations", "MCP_EMAIL_SERVER_REPORT_BLOCKED_MUTATIONS")
+        # Single snapshot reference; every override below is one .get() lookup.
+        env = os.environ
+        self._pickup_credential_storage_override(env.get("MCP_EMAIL_SERVER_CREDENTIAL_STORAGE"))
+        self._apply_bool_env_override(
+            "enable_attachment_download", env.get("MCP_EMAIL_SERVER_ENABLE_ATTACHMENT_DOWNLOAD")
+        )
+        self._apply_bool_env_override("report_blocked_mutations", env.get("MCP_EMAIL_SERVER_REPORT_BLOCKED_MUTATIONS"))
 
         # Environment variable overrides TOML (comma-separated); an empty string clears the allowlist.
-        env_allowed = os.getenv("MCP_EMAIL_SERVER_ALLOWED_RECIPIENTS")
+        env_allowed = env.get("MCP_EMAIL_SERVER_ALLOWED_RECIPIENTS")
         if env_allowed is not None:
             self.allowed_recipients = _normalize_address_list(env_allowed.split(","))
 
-        env_senders = os.getenv("MCP_EMAIL_SERVER_ALLOWED_SENDERS")
+        env_senders = env.get("MCP_EMAIL_SERVER_ALLOWED_SENDERS")
         if env_senders is not None:
             self.allowed_senders = _normalize_pattern_list(env_senders.split(","))
 
@@ -569,20 +606,27 @@ class Settings(BaseSettings):
         if not env_emails:
             return
 
+        # Apply all overrides/inserts to a local copy and reassign once, so
+        # assignment validation (unique-name check, revalidation) runs a single
+        # time instead of per injected account.
+        emails = list(self.emails)
         for env_email in env_emails:
             existing_account = None
-            for i, email in enumerate(self.emails):
+            for i, email in enumerate(emails):
                 if email.account_name == env_email.account_name:
                     existing_account = i
                     break
 
             if existing_account is not None:
-                self.emails[existing_account] = env_email
+                emails[existing_account] = env_email
                 logger.info(f"Overriding email account '{env_email.account_name}' with environment variables")
             else:
-                self.emails.insert(0, env_email)
+                emails.insert(0, env_email)
                 logger.info(f"Added email account '{env_email.account_name}' from environment variables")
 
+        self.emails = emails
+        self._account_index = None
+
     def _pending_keyring_sentinels(self) -> list[tuple[str, str, EmailServer | ProviderSettings]]:
         pending: list[tuple[str, str, EmailServer | ProviderSettings]] = []
         for email in self.emails:
@@ -662,28 +706,43 @@ class Settings(BaseSettings):
         if email.outgoing:
             _reject_sentinel_secret(email.outgoing.password, "outgoing password")
         self.emails = [email, *self.emails]
+        self._account_index = None
 
     def add_provider(self, provider: ProviderSettings) -> None:
         """Use re-assigned for validation to work."""
         _reject_sentinel_secret(provider.api_key, "api_key")
         self.providers = [provider, *self.providers]
+        self._account_index = None
 
     def delete_email(self, account_name: str) -> None:
-        """Use re-assigned for validation to work."""
-        self.emails = [email for email in self.emails if email.account_name != account_name]
+        """Use re-assigned for validation to work; no-op when the name is absent."""
+        index = next((i for i, email in enumerate(self.emails) if email.account_name == account_name), None)
+        if index is None:
+            return
+        emails = list(self.emails)
+        del emails[index]
+        self.emails = emails
+        self._account_index = None
 
     def delete_provider(self, account_name: str) -> None:
-        """Use re-assigned for validation to work."""
-        self.providers = [provider for provider in self.providers if provider.account_name != account_name]
+        """Use re-assigned for validation to work; no-op when the name is absent."""
+        index = next((i for i, provider in enumerate(self.providers) if provider.account_name == account_name), None)
+        if index is None:
+            return
+        providers = list(self.providers)
+        del providers[index]
+        self.providers = providers
+        self._account_index = None
 
     def get_account(self, account_name: str, masked: bool = False) -> EmailSettings | ProviderSettings | None:
-        for email in self.emails:
-            if email.account_name == account_name:
-                return email if not masked else email.masked()
-        for provider in self.providers:
-            if provider.account_name == account_name:
-                return provider if not masked else provider.masked()
-        return None
+        index = self._account_index
+        if index is None or len(index) != len(self.emails) + len(self.providers):
+            index = {account.account_name: account for account in (*self.emails, *self.providers)}
+            self._account_index = index
+        account = index.get(account_name)
+        if account is None:
+            return None
+        return account.masked() if masked else account
 
     def get_accounts(self, masked: bool = False) -> list[EmailSettings | ProviderSettings]:
         accounts: list[EmailSettings | ProviderSettings] = [*self.emails, *self.providers]
@@ -693,15 +752,11 @@ class Settings(BaseSettings):
 
     @model_validator(mode="after")
     def check_unique_account_names(self) -> Settings:
-        account_names = set()
-        for email in self.emails:
-            if email.account_name in account_names:
-                raise ValueError(f"Duplicate account name {email.account_name}")
-            account_names.add(email.account_name)
-        for provider in self.providers:
-            if provider.account_name in account_names:
-                raise ValueError(f"Duplicate account name {provider.account_name}")
-            account_names.add(provider.account_name)
+        seen: set[str] = set()
+        for account in (*self.emails, *self.providers):
+            if account.account_name in seen:
+                raise ValueError(f"Duplicate account name {account.account_name}")
+            seen.add(account.account_name)
 
         return self
 
@@ -716,12 +771,19 @@ class Settings(BaseSettings):
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         return (TomlConfigSettingsSource(settings_cls),)
 
-    def _to_toml(self, *, use_keyring: bool = False, credential_storage: CredentialStorage | None = None) -> str:
+    def _to_toml_data(
+        self, *, use_keyring: bool = False, credential_storage: CredentialStorage | None = None
+    ) -> dict[str, Any]:
         context = {"secrets": "keyring"} if use_keyring else None
-        data = self.model_dump(exclude_none=True, context=context)
+        # mode="json" emits ISO-8601 timestamp strings natively, replacing the
+        # per-field datetime serializer dispatch the models used to carry.
+        data = self.model_dump(mode="json", exclude_none=True, context=context)
         if credential_storage is not None:
             data["credential_storage"] = credential_storage
-        return tomli_w.dumps(data)
+        return data
+
+    def _to_toml(self, *, use_keyring: bool = False, credential_storage: CredentialStorage | None = None) -> str:
+        return tomli_w.dumps(self._to_toml_data(use_keyring=use_keyring, credential_storage=credential_storage))
 
     def _reject_cleartext_sentinels(self) -> None:
         """Defense-in-depth: catches sentinel values that bypassed add_email/add_provider
@@ -753,10 +815,17 @@ class Settings(BaseSettings):
                 failures.append((provider.account_name, "api_key", str(e)))
         return failures
 
+    # Config directories already created by a store() this process; lets repeated
+    # stores skip the mkdir/stat round-trip. Keyed by parent path so tests (and
+    # any future multi-file use) that point toml_file elsewhere still get their
+    # directory created.
+    _ensured_config_dirs: ClassVar[set[Path]] = set()
+
     @staticmethod
-    def _write_toml(toml_file: Path, content: str) -> None:
+    def _write_toml(toml_file: Path, data: dict[str, Any]) -> None:
         if os.name != "posix":
-            toml_file.write_text(content)
+            with toml_file.open("wb") as f:
+                tomli_w.dump(data, f)
             return
         # Atomic, owner-only write. The file may hold cleartext IMAP/SMTP passwords
         # (plaintext mode), so the new content must never exist in a world-readable
@@ -770,8 +839,10 @@ class Settings(BaseSettings):
         directory = toml_file.parent
         fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{toml_file.name}.", suffix=".tmp")
         try:
-            with os.fdopen(fd, "w") as f:
-                f.write(content)
+            with os.fdopen(fd, "wb") as f:
+                # Stream straight into the 0600 temp file rather than building
+                # the full TOML document as an intermediate string first.
+                tomli_w.dump(data, f)
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(tmp_name, toml_file)
@@ -796,7 +867,9 @@ class Settings(BaseSettings):
             toml_file = Path(toml_file_setting)
         else:
             raise TypeError("Settings model_config.toml_file must identify exactly one file")
-        toml_file.parent.mkdir(parents=True, exist_ok=True)
+        if toml_file.parent not in self._ensured_config_dirs:
+            toml_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_config_dirs.add(toml_file.parent)
 
         effective = self.effective_credential_storage  # raw literal; never probes
         auto_probe_usable = effective == "auto" and keyring_store.keyring_usable()
@@ -834,22 +907,23 @@ class Settings(BaseSettings):
         # override would produce plaintext mode alongside __KEYRING__ sentinels and
         # become unloadable as soon as the override was removed.
         persisted_storage = effective if self._credential_storage_override is not None else self.credential_storage
-        content = self._to_toml(use_keyring=use_keyring, credential_storage=persisted_storage)
-        self._write_toml(toml_file, content)
+        data = self._to_toml_data(use_keyring=use_keyring, credential_storage=persisted_storage)
+        self._write_toml(toml_file, data)
         if self._credential_storage_override is not None:
             self.credential_storage = effective
         logger.info(f"Settings stored in {toml_file} ({'keyring' if use_keyring else 'plaintext'})")
 
 
-_settings = None
+@functools.lru_cache(maxsize=1)
+def _build_settings() -> Settings:
+    logger.info(f"Loading settings from {CONFIG_PATH}")
+    return Settings()
 
 
 def get_settings(reload: bool = False) -> Settings:
-    global _settings
-    if not _settings or reload:
-        logger.info(f"Loading settings from {CONFIG_PATH}")
-        _settings = Settings()
-    return _settings
+    if reload:
+        _build_settings.cache_clear()
+    return _build_settings()
 
 
 def clear_settings_cache() -> None:
@@ -857,13 +931,12 @@ def clear_settings_cache() -> None:
 
     Used after a failed store() to stop a divergent in-memory instance (one that
     was mutated before the store raised) from being served by a later
-    get_settings() call. get_settings(reload=True) alone is NOT equivalent: if the
-    reload itself raises (e.g. a locked keychain plus a sentinel-bearing file — the
-    same failure that made store() raise), get_settings keeps the old divergent
-    instance rather than discarding it.
+    get_settings() call. The lru_cache never caches a raising build, so the
+    divergent instance is dropped immediately even when the next load fails too
+    (e.g. a locked keychain plus a sentinel-bearing file — the same failure that
+    made store() raise).
     """
-    global _settings
-    _settings = None
+    _build_settings.cache_clear()
 
 
 def store_settings(settings: Settings | None = None) -> None:
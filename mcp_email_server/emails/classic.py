@@ -1,15 +1,24 @@
 import asyncio
 import base64
 import binascii
+import concurrent.futures
+import copy
 import email.utils
+import functools
+import heapq
 import inspect
 import mimetypes
+import mmap
+import quopri
 import re
 import ssl
 import time
 import unicodedata
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from email.header import Header
+from email.header import Header, decode_header, make_header
 from email.message import Message
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
@@ -18,6 +27,7 @@ from email.parser import BytesParser
 from email.policy import default
 from pathlib import Path
 from typing import Any, cast
+from urllib.parse import unquote
 
 import aioimaplib
 import aiosmtplib
@@ -38,13 +48,234 @@ from mcp_email_server.log import logger
 # Maximum body length before truncation (characters)
 MAX_BODY_LENGTH = 20000
 
+# The only headers the metadata listing reads; everything else in a
+# BODY.PEEK[HEADER] response is skipped without decoding.
+_METADATA_HEADERS = frozenset({b"subject", b"from", b"to", b"cc", b"date", b"message-id"})
+
 # Common Archive folder names, used as a fallback when no RFC 6154 \Archive flag is found.
 _ARCHIVE_FOLDER_CANDIDATES = ("Archive", "Archives", "[Gmail]/All Mail")
 
+# Discovered Sent folders, keyed by (host, user). Re-discovery costs a LIST
+# plus up to seven SELECT trials per send, and because handlers are rebuilt on
+# every tool call an instance-level cache would never be hit; a working folder
+# name stays valid for the life of the process.
+_sent_folder_cache: dict[tuple[str, str], str] = {}
+
+# Pooled SMTP connections keyed by (host, port, user). Handlers are rebuilt on
+# every tool call, so like _sent_folder_cache this lives at module level to
+# amortize the TLS handshake and AUTH across sends. Entries are validated with
+# NOOP before reuse and dropped on any send failure.
+_smtp_pool: dict[tuple[str, int, str], aiosmtplib.SMTP] = {}
+
+# Pooled authenticated IMAP connections for the Sent-folder APPEND path, keyed
+# by (host, port, user). Appends run on a dedicated connection outside the
+# reuse scope, so without pooling every send pays a fresh TLS handshake and
+# LOGIN. Entries are validated with NOOP before reuse and logged out on any
+# append failure.
+_append_imap_pool: dict[tuple[str, int, str], aioimaplib.IMAP4 | aioimaplib.IMAP4_SSL] = {}
+
+# Full-message fetch format that worked for a server, keyed by (host, user).
+# Most servers take the first candidate, but the odd one rejects it; once a
+# format succeeds it is tried first so later fetches skip the failed probe.
+_fetch_format_cache: dict[tuple[str, str], str] = {}
+
+
+async def _close_smtp_quietly(smtp: aiosmtplib.SMTP) -> None:
+    """Close an SMTP connection, swallowing errors (used on discard paths)."""
+    try:
+        await smtp.quit()
+    except Exception as e:
+        logger.debug(f"SMTP quit failed: {e}")
+
+
+async def _return_smtp_to_pool(key: tuple[str, int, str], smtp: aiosmtplib.SMTP) -> None:
+    """Pool a healthy connection, closing any entry an overlapping send left.
+
+    The pool holds one connection per key, so two sends racing on the same
+    account would otherwise silently drop (and leak) the first one pooled.
+    """
+    displaced = _smtp_pool.pop(key, None)
+    _smtp_pool[key] = smtp
+    if displaced is not None and displaced is not smtp:
+        await _close_smtp_quietly(displaced)
+
+
+async def _close_imap_quietly(imap: aioimaplib.IMAP4 | aioimaplib.IMAP4_SSL) -> None:
+    """Log out of an IMAP connection, swallowing errors (used on discard paths)."""
+    try:
+        await imap.logout()
+    except Exception as e:
+        logger.debug(f"IMAP logout failed: {e}")
+
+
+async def _return_append_imap_to_pool(key: tuple[str, int, str], imap: aioimaplib.IMAP4 | aioimaplib.IMAP4_SSL) -> None:
+    """Pool a healthy connection, closing any entry an overlapping append left.
+
+    The pool holds one connection per key, so two appends racing on the same
+    account would otherwise silently drop (and leak) the first one pooled.
+    """
+    displaced = _append_imap_pool.pop(key, None)
+    _append_imap_pool[key] = imap
+    if displaced is not None and displaced is not imap:
+        await _close_imap_quietly(displaced)
+
+
+def _combine_recipients(recipients: list[str], cc: list[str] | None, bcc: list[str] | None) -> list[str]:
+    """Combined envelope recipient list (To + Cc + Bcc) for SMTP delivery."""
+    all_recipients = recipients.copy()
+    if cc:
+        all_recipients.extend(cc)
+    if bcc:
+        all_recipients.extend(bcc)
+    return all_recipients
+
+
+# Bounds for the recently-fetched-bodies cache below.
+_BODY_CACHE_MAX = 64
+_BODY_CACHE_BYTES_MAX = 32 * 1024 * 1024
+
+
+class _BodyCache:
+    """Bounded LRU cache of parsed email body dicts.
+
+    Keys are (host, user, mailbox, uid, body_offset, max_body_length) so the
+    same message viewed through different body windows never aliases. Size is
+    bounded both by entry count and by the approximate total body length, so
+    a handful of huge messages cannot pin tens of megabytes.
+    """
+
+    def __init__(self, max_entries: int = _BODY_CACHE_MAX, max_bytes: int = _BODY_CACHE_BYTES_MAX) -> None:
+        self._entries: OrderedDict[tuple[str, str, str, str, int, int], dict[str, Any]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+
+    @staticmethod
+    def _entry_size(email_data: dict[str, Any]) -> int:
+        body = email_data.get("body", "")
+        return len(body) if isinstance(body, str) else 0
+
+    def get(self, key: tuple[str, str, str, str, int, int]) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple[str, str, str, str, int, int], email_data: dict[str, Any]) -> None:
+        if key in self._entries:
+            self._bytes -= self._entry_size(self._entries.pop(key))
+        self._entries[key] = email_data
+        self._bytes += self._entry_size(email_data)
+        while self._entries and (len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._entry_size(evicted)
+
+    def invalidate(self, host: str, user_name: str, mailbox: str, email_ids: list[str]) -> None:
+        """Drop all cached windows of the given UIDs in one account's mailbox."""
+        uids = set(email_ids)
+        stale = [k for k in self._entries if k[0] == host and k[1] == user_name and k[2] == mailbox and k[3] in uids]
+        for key in stale:
+            self._bytes -= self._entry_size(self._entries.pop(key))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+# Recently fetched bodies. Module-level for the same reason as _smtp_pool:
+# handlers are rebuilt on every tool call, so an instance-level cache would
+# never see a second lookup. Mutating operations invalidate their UIDs.
+_body_cache = _BodyCache()
+
+# Recently listed metadata pages, keyed by account plus the full filter
+# tuple, holding (monotonic timestamp, total, raw email dicts). Exists to
+# absorb the page-N+1 request that almost always follows page N (the
+# handler prefetches it in the background), not to shield listings from
+# mailbox changes — entries expire after a short TTL and every mutating
+# handler operation clears the cache.
+_PAGE_CACHE_MAX = 4
+_PAGE_CACHE_TTL_SECONDS = 30.0
+_page_cache: OrderedDict[tuple, tuple[float, int, list[dict[str, Any]]]] = OrderedDict()
+
+# Strong references to in-flight prefetch tasks so they are not garbage
+# collected mid-run; each task discards itself on completion.
+_prefetch_tasks: set[asyncio.Task] = set()
+
+
+# Parsed multipart BODYSTRUCTUREs keyed by (host, user, mailbox, uid). A
+# message's structure is immutable for a given UID, so downloading several
+# attachments from the same message re-fetches and re-parses nothing.
+# Module-level for the same reason as the caches above; bounded LRU.
+_BODYSTRUCTURE_CACHE_MAX = 128
+_bodystructure_cache: OrderedDict[tuple[str, str, str, str], list[Any]] = OrderedDict()
+
 
 # RFC 3501 system flags (except \Recent which is read-only) + custom keyword atoms
 _VALID_IMAP_FLAG = re.compile(r"^\\[A-Za-z]+$|^[A-Za-z][A-Za-z0-9_-]*$")
 
+# BytesParser is stateless across parse calls once constructed; build it
+# (and its policy binding) once instead of per message.
+_BYTES_PARSER = BytesParser(policy=default)
+
+# Compiled once: FETCH response parsing runs per message on every page.
+_UID_RE = re.compile(rb"UID (\d+)")
+_INTERNALDATE_RE = re.compile(rb'INTERNALDATE "([^"]+)"')
+
+
+def _iter_fetch_literal_blocks(data: list, marker: bytes) -> Iterator[tuple[str, bytearray]]:
+    """Yield ``(uid, literal payload)`` pairs from a UID FETCH response.
+
+    ``marker`` selects the fetch item (e.g. ``b"BODY[HEADER"`` or ``b"BODY["``).
+    Handles both the standard layout (UID on the metadata line that precedes
+    the literal) and the Proton Bridge layout, where the UID arrives in a
+    separate item after the literal (``b' UID 42)'``). The payload bytearray
+    is yielded without copying.
+    """
+    for i, item in enumerate(data):
+        if not isinstance(item, bytes) or marker not in item:
+            continue
+        if i + 1 >= len(data) or not isinstance(data[i + 1], bytearray):
+            continue
+        uid_match = _UID_RE.search(item)
+        if uid_match is None and i + 2 < len(data) and isinstance(data[i + 2], bytes):
+            uid_match = _UID_RE.search(data[i + 2])
+        if uid_match:
+            yield uid_match.group(1).decode(), data[i + 1]
+
+
+def _iter_fetch_header_blocks(data: list) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(uid, raw header block)`` pairs from a UID FETCH header response."""
+    for uid, block in _iter_fetch_literal_blocks(data, b"BODY[HEADER"):
+        yield uid, bytes(block)
+
+
+def _decode_payload_to_file(payload: bytes, encoding: str, save_file: Path) -> int:
+    """Decode a transfer-encoded MIME payload straight into ``save_file``.
+
+    Base64 input is decoded in slices (aligned to the 4-character group size,
+    so each slice decodes independently) and written as it goes, avoiding a
+    second full-size copy of the attachment in memory.  Returns the number of
+    decoded bytes written.  Raises ``binascii.Error`` on malformed base64;
+    callers fall back to the full-message fetch in that case.
+    """
+    written = 0
+    with save_file.open("wb") as f:
+        if encoding == "base64":
+            cleaned = payload.translate(None, delete=b" \t\r\n\x0b\x0c")
+            chunk_size = 256 * 1024  # multiple of 4, so groups never split
+            for start in range(0, len(cleaned), chunk_size):
+                decoded = base64.b64decode(cleaned[start : start + chunk_size])
+                f.write(decoded)
+                written += len(decoded)
+        elif encoding == "quoted-printable":
+            decoded = quopri.decodestring(payload)
+            f.write(decoded)
+            written = len(decoded)
+        else:
+            f.write(payload)
+            written = len(payload)
+    return written
+
 
 def _validate_flags(flags: list[str]) -> str:
     """Validate and format IMAP flags into a parenthesised string.
@@ -207,6 +438,137 @@ def _parse_list_response(item: bytes | str) -> MailboxInfo | None:
     return MailboxInfo(name=decode_mailbox_name(mailbox_token), delimiter=delimiter, flags=flags)
 
 
+def _decode_header_value(value: bytes) -> str:
+    """Decode one unfolded header value, expanding RFC 2047 encoded words."""
+    text = value.decode("utf-8", errors="replace")
+    if "=?" not in text:
+        return text
+    try:
+        return str(make_header(decode_header(text)))
+    except Exception:
+        return text
+
+
+def _parse_header_block(raw_headers: bytes) -> dict[str, str]:
+    """Split a raw RFC 5322 header block into the metadata headers only.
+
+    A line-level splitter that unfolds continuations and decodes just the
+    handful of headers the metadata listing reads — far cheaper per message
+    than running the full BytesParser tokenizer over every header.
+    """
+    headers: dict[str, str] = {}
+    wanted_name: bytes | None = None
+    folded: list[bytes] = []
+
+    def flush() -> None:
+        nonlocal wanted_name
+        if wanted_name is not None:
+            key = wanted_name.decode("ascii")
+            if key not in headers:  # first occurrence wins, as with Message.get
+                headers[key] = _decode_header_value(b" ".join(folded))
+        wanted_name = None
+        folded.clear()
+
+    for line in raw_headers.replace(b"\r\n", b"\n").split(b"\n"):
+        if line[:1] in (b" ", b"\t"):
+            if wanted_name is not None:
+                folded.append(line.strip())
+            continue
+        flush()
+        if not line:
+            break  # blank line ends the header block
+        name, sep, value = line.partition(b":")
+        if sep and name.strip().lower() in _METADATA_HEADERS:
+            wanted_name = name.strip().lower()
+            folded.append(value.strip())
+    flush()
+    return headers
+
+
+def _parse_imap_nested_list(value: str, start: int) -> tuple[list[Any], int]:
+    """Parse a parenthesized IMAP list (e.g. BODYSTRUCTURE) into nested Python lists.
+
+    Quoted strings become ``str``, ``NIL`` becomes ``None``, and other atoms
+    (numbers, encodings) stay as ``str``. Raises ValueError on literals and
+    unbalanced input so callers can fall back to a full-message fetch.
+    """
+    if start >= len(value) or value[start] != "(":
+        raise ValueError("expected parenthesized IMAP list")
+
+    items: list[Any] = []
+    index = start + 1
+    while index < len(value):
+        char = value[index]
+        if char.isspace():
+            index += 1
+        elif char == ")":
+            return items, index + 1
+        elif char == "(":
+            sub_items, index = _parse_imap_nested_list(value, index)
+            items.append(sub_items)
+        elif char == '"':
+            token, index = _read_quoted_imap_token(value, index)
+            items.append(token)
+        elif char == "{":
+            raise ValueError("IMAP literal in parenthesized list is unsupported")
+        else:
+            token_start = index
+            while index < len(value) and not value[index].isspace() and value[index] not in '()"':
+                index += 1
+            token = value[token_start:index]
+            items.append(None if token.upper() == "NIL" else token)
+    raise ValueError("unbalanced parenthesized IMAP list")
+
+
+def _mime_params_dict(params: Any) -> dict[str, str]:
+    """Convert a flat IMAP parameter list (key value key value ...) to a dict."""
+    if not isinstance(params, list):
+        return {}
+    return {
+        str(params[i]).lower(): str(params[i + 1])
+        for i in range(0, len(params) - 1, 2)
+        if isinstance(params[i], str) and isinstance(params[i + 1], str)
+    }
+
+
+def _decode_mime_filename(params: dict[str, str], key: str) -> str | None:
+    """Extract a filename parameter, handling RFC 2047 and RFC 2231 encodings."""
+    extended = params.get(f"{key}*")
+    if extended is not None:
+        # RFC 2231: charset'language'percent-encoded-value
+        charset, _, encoded = extended.partition("''")
+        try:
+            return unquote(encoded or extended, encoding=charset or "utf-8", errors="replace")
+        except (LookupError, ValueError):
+            return extended
+    plain = params.get(key)
+    if plain is None:
+        return None
+    try:
+        return str(make_header(decode_header(plain)))
+    except Exception:
+        return plain
+
+
+def _iter_bodystructure_parts(structure: list[Any], prefix: str = "") -> "list[tuple[str, list[Any]]]":
+    """Yield (section, leaf-part) pairs from a parsed multipart BODYSTRUCTURE."""
+    parts: list[tuple[str, list[Any]]] = []
+    for child_number, child in enumerate(structure, start=1):
+        if not isinstance(child, list):
+            break
+        section = f"{prefix}{child_number}"
+        if child and isinstance(child[0], list):
+            parts.extend(_iter_bodystructure_parts(child, f"{section}."))
+        else:
+            parts.append((section, child))
+    return parts
+
+
+# RFC 3501 quoted-string escapes, applied in one pass via str.translate.
+_MAILBOX_QUOTE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
+@functools.lru_cache(maxsize=64)
 def _quote_mailbox(mailbox: str) -> str:
     """Quote mailbox name for IMAP compatibility.
 
@@ -225,8 +587,7 @@ def _quote_mailbox(mailbox: str) -> str:
     encoded = encode_mailbox_name(mailbox)
     # Per RFC 3501, literal double-quote characters in a quoted string must
     # be escaped with a backslash. Backslashes themselves must also be escaped.
-    escaped = encoded.replace("\\", "\\\\").replace('"', r"\"")
-    return f'"{escaped}"'
+    return f'"{encoded.translate(_MAILBOX_QUOTE_TABLE)}"'
 
 
 def _uid_sort_key(uid: bytes | str) -> int:
@@ -462,16 +823,54 @@ class EmailClient:
         self.smtp_start_tls = self.email_server.start_ssl
         self.smtp_verify_ssl = self.email_server.verify_ssl
 
+        # Connection reuse (see reuse_connection): while a reuse scope is
+        # active, the first authenticated connection is pinned here and
+        # subsequent operations share it instead of reconnecting.
+        self._pinned_imap: aioimaplib.IMAP4_SSL | aioimaplib.IMAP4 | None = None
+        self._reuse_active = False
+        self._selected_mailbox: str | None = None
+
+    # SSL contexts are built once per client and only when a connection is
+    # actually opened: every ssl.create_default_context() call reloads the
+    # system CA bundle from disk, which costs tens of milliseconds per
+    # connection when left to the IMAP/SMTP libraries.
+    @functools.cached_property
+    def _imap_ssl_context(self) -> ssl.SSLContext | None:
+        if not self.email_server.use_ssl:
+            return None
+        return _create_ssl_context(self.email_server.verify_ssl) or ssl.create_default_context()
+
+    @functools.cached_property
+    def _smtp_ssl_context(self) -> ssl.SSLContext:
+        return _create_ssl_context(self.smtp_verify_ssl) or ssl.create_default_context()
+
+    # The sender never changes for a client, so the formatted From header
+    # and the Message-Id domain are computed once instead of re-running
+    # parseaddr and RFC 2047 encoding on every compose.
+    @functools.cached_property
+    def _from_header(self) -> str:
+        sender_name, sender_address = email.utils.parseaddr(self.sender)
+        # Encode only the display name. RFC 2047 encoded-words must not cover the
+        # addr-spec, otherwise strict clients may show the raw encoded blob.
+        if sender_address:
+            return email.utils.formataddr((str(Header(sender_name, "utf-8")), sender_address))
+        if not self.sender.isascii():
+            return str(Header(self.sender, "utf-8"))
+        return self.sender
+
+    @functools.cached_property
+    def _sender_domain(self) -> str:
+        _, sender_address = email.utils.parseaddr(self.sender)
+        return (sender_address or self.sender).rsplit("@", 1)[-1].rstrip(">")
+
     def _imap_connect(self) -> aioimaplib.IMAP4_SSL | aioimaplib.IMAP4:
-        """Create a new IMAP connection with the configured SSL context."""
-        if self.email_server.use_ssl:
-            imap_ssl_context = _create_ssl_context(self.email_server.verify_ssl)
-            if imap_ssl_context is not None:
-                return self.imap_class(
-                    self.email_server.host,
-                    self.email_server.port,
-                    ssl_context=imap_ssl_context,
-                )
+        """Create a new IMAP connection with the cached SSL context."""
+        if self._imap_ssl_context is not None:
+            return self.imap_class(
+                self.email_server.host,
+                self.email_server.port,
+                ssl_context=self._imap_ssl_context,
+            )
         return self.imap_class(self.email_server.host, self.email_server.port)
 
     async def _connect_imap(self) -> aioimaplib.IMAP4_SSL | aioimaplib.IMAP4:
@@ -512,17 +911,116 @@ class EmailClient:
         """Get SSL context for SMTP connections based on verify_ssl setting."""
         return _create_ssl_context(self.smtp_verify_ssl)
 
+    async def _logout_quietly(self, imap: aioimaplib.IMAP4_SSL | aioimaplib.IMAP4) -> None:
+        """Log out without letting logout errors mask the operation's result."""
+        try:
+            await imap.logout()
+        except Exception as e:
+            logger.info(f"Error during logout: {e}")
+
+    @asynccontextmanager
+    async def reuse_connection(self) -> AsyncIterator["EmailClient"]:
+        """Share one authenticated IMAP connection across successive operations.
+
+        TLS setup plus LOGIN costs hundreds of milliseconds on common
+        providers, and every public method pays it again. Inside this scope
+        the first operation's connection is pinned and later operations reuse
+        it; the single LOGOUT happens when the scope exits. Outside a scope
+        each operation keeps its own connect/login/logout cycle. Scopes nest:
+        the outermost one owns the connection.
+        """
+        if self._reuse_active:
+            yield self
+            return
+        self._reuse_active = True
+        try:
+            yield self
+        finally:
+            self._reuse_active = False
+            pinned, self._pinned_imap = self._pinned_imap, None
+            self._selected_mailbox = None
+            if pinned is not None:
+                await self._logout_quietly(pinned)
+
+    @asynccontextmanager
+    async def _imap_session(self) -> AsyncIterator[aioimaplib.IMAP4_SSL | aioimaplib.IMAP4]:
+        """Yield an authenticated IMAP connection, honoring an active reuse scope.
+
+        Without a reuse scope this is the classic per-operation cycle:
+        connect, LOGIN, ID, then LOGOUT when the operation finishes. Inside a
+        scope the connection is pinned for reuse instead of logged out, and a
+        pinned connection that raises is evicted so the next operation
+        reconnects cleanly.
+        """
+        if self._pinned_imap is not None:
+            try:
+                yield self._pinned_imap
+            except ValueError:
+                # Application-level errors raised by our own validation (UID
+                # not found, blocked sender, bad arguments) leave the
+                # connection healthy — evicting it would force a needless
+                # reconnect for the next operation in the scope.
+                raise
+            except BaseException:
+                pinned, self._pinned_imap = self._pinned_imap, None
+                self._selected_mailbox = None
+                if pinned is not None:
+                    await self._logout_quietly(pinned)
+                raise
+            return
+
+        imap = await self._connect_imap()
+        try:
+            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
+            await _send_imap_id(imap)
+            yield imap
+        except BaseException:
+            self._selected_mailbox = None
+            await self._logout_quietly(imap)
+            raise
+        else:
+            if self._reuse_active:
+                self._pinned_imap = imap
+            else:
+                await self._logout_quietly(imap)
+
+    async def _select_mailbox(
+        self,
+        imap: aioimaplib.IMAP4_SSL | aioimaplib.IMAP4,
+        mailbox: str,
+        *,
+        context: str | None = None,
+    ) -> None:
+        """SELECT ``mailbox`` on ``imap``, skipping the round trip when redundant.
+
+        Only a connection carried by a reuse scope can keep its selection
+        across operations, so the selected mailbox is tracked there and
+        repeat SELECTs of the same mailbox are skipped. Per-operation
+        connections always SELECT, and the tracked state is cleared whenever
+        a session errors or the reuse scope releases its connection.
+        """
+        tracked = imap is self._pinned_imap or self._reuse_active
+        if tracked and self._selected_mailbox == mailbox:
+            return
+        select_response = await imap.select(_quote_mailbox(mailbox))
+        _raise_for_imap_error(select_response, context or f"SELECT mailbox {mailbox}")
+        if tracked:
+            self._selected_mailbox = mailbox
+
     @staticmethod
-    def _parse_recipients(email_message) -> list[str]:
+    def _parse_recipient_headers(to_header: str, cc_header: str) -> list[str]:
+        """Extract recipient addresses from raw To and Cc header values.
+
+        Uses ``email.utils.getaddresses`` so quoted display names containing
+        commas (``"Last, First" <a@b>``) are kept intact rather than split.
+        """
+        addresses = email.utils.getaddresses([header for header in (to_header, cc_header) if header])
+        return [email.utils.formataddr(address) for address in addresses if address != ("", "")]
+
+    @classmethod
+    def _parse_recipients(cls, email_message) -> list[str]:
         """Extract recipient addresses from To and Cc headers."""
-        recipients = []
-        to_header = email_message.get("To", "")
-        if to_header:
-            recipients = [addr.strip() for addr in to_header.split(",")]
-        cc_header = email_message.get("Cc", "")
-        if cc_header:
-            recipients.extend([addr.strip() for addr in cc_header.split(",")])
-        return recipients
+        return cls._parse_recipient_headers(str(email_message.get("To", "")), str(email_message.get("Cc", "")))
 
     @staticmethod
     def _parse_date(date_str: str) -> datetime:
@@ -567,16 +1065,54 @@ class EmailClient:
         # ``get_filename`` and would otherwise misclassify text parts.)
         return isinstance(filename, str) and bool(filename)
 
+    @staticmethod
+    def _decoded_text_prefix(part: Message, max_chars: int) -> bytes | None:
+        """Decode at most enough of a base64 text payload to yield ``max_chars`` characters.
+
+        A multi-megabyte base64 text part would otherwise be fully decoded
+        just to be truncated afterwards; peak memory then scales with the
+        message, not the returned window. Only base64 parts are bounded —
+        other transfer encodings decode cheaply in place. The 4-bytes-per-
+        character budget covers any UTF-8 code point, so truncation can never
+        land inside the returned window.
+        """
+        cte = str(part.get("Content-Transfer-Encoding", "")).strip().lower()
+        if cte != "base64":
+            return _decoded_payload(part)
+        raw = part.get_payload(decode=False)
+        if not isinstance(raw, str):
+            return _decoded_payload(part)
+
+        needed_bytes = max_chars * 4
+        b64_chars = ((needed_bytes + 2) // 3) * 4
+        if len(raw) <= b64_chars:
+            return _decoded_payload(part)
+
+        # Slack covers line breaks inside the base64 stream; trim to a
+        # multiple of four so the prefix decodes standalone.
+        prefix = re.sub(r"\s+", "", raw[: b64_chars + b64_chars // 64 + 8])
+        prefix = prefix[: len(prefix) - (len(prefix) % 4)]
+        try:
+            return base64.b64decode(prefix)
+        except binascii.Error:
+            return _decoded_payload(part)
+
     def _parse_email_data(  # noqa: C901
         self,
-        raw_email: bytes,
+        raw_email: bytes | bytearray,
         email_id: str | None = None,
         body_offset: int = 0,
         max_body_length: int = MAX_BODY_LENGTH,
     ) -> dict[str, Any]:
         """Parse raw email data into a structured dictionary."""
-        parser = BytesParser(policy=default)
-        email_message = parser.parsebytes(raw_email)
+        if body_offset < 0:
+            raise ValueError("body_offset must be >= 0")
+        if max_body_length < 1:
+            raise ValueError("max_body_length must be >= 1")
+        # One character past the window is enough to detect truncation.
+        needed_chars = body_offset + max_body_length + 1
+
+        email_message = _BYTES_PARSER.parsebytes(raw_email)
 
         # Extract email parts
         subject = email_message.get("Subject", "")
@@ -606,8 +1142,8 @@ class EmailClient:
                     if filename:
                         attachments.append(filename)
                 # Handle text parts - prefer text/plain
-                elif content_type == "text/plain":
-                    body_part = _decoded_payload(part)
+                elif content_type == "text/plain" and len(body) <= needed_chars:
+                    body_part = self._decoded_text_prefix(part, needed_chars)
                     if body_part:
                         charset = part.get_content_charset("utf-8")
                         try:
@@ -630,7 +1166,10 @@ class EmailClient:
         else:
             # Handle single-part emails
             content_type = email_message.get_content_type()
-            payload = _decoded_payload(email_message)
+            if content_type == "text/html":
+                payload = _decoded_payload(email_message)  # HTML needs the full document to render text
+            else:
+                payload = self._decoded_text_prefix(email_message, needed_chars)
             if payload:
                 charset = email_message.get_content_charset("utf-8")
                 try:
@@ -639,10 +1178,6 @@ class EmailClient:
                     text = payload.decode("utf-8", errors="replace")
 
                 body = _html_to_text(text) if content_type == "text/html" else text
-        if body_offset < 0:
-            raise ValueError("body_offset must be >= 0")
-        if max_body_length < 1:
-            raise ValueError("max_body_length must be >= 1")
 
         # Return at most ``max_body_length`` characters starting at ``body_offset``. When more of
         # the body remains past the window, append the ``...[TRUNCATED]`` marker so callers can page
@@ -689,23 +1224,18 @@ class EmailClient:
         answered: bool | None = None,
         has_attachment: bool | None = None,
     ) -> list[str]:
-        search_criteria = []
-        if before:
-            search_criteria.extend(["BEFORE", before.strftime("%d-%b-%Y").upper()])
-        if since:
-            search_criteria.extend(["SINCE", since.strftime("%d-%b-%Y").upper()])
-
-        # Substring-match fields (IMAP keyword, value)
-        text_criteria = [
-            ("SUBJECT", subject),
-            ("BODY", body),
-            ("TEXT", text),
-            ("FROM", from_address),
-            ("TO", to_address),
-        ]
-        for keyword, value in text_criteria:
-            if value:
-                search_criteria.extend([keyword, EmailClient._sanitize_imap_value(value)])
+        # (IMAP keyword, value) pairs: dates pre-formatted, text pre-sanitized.
+        sanitize = EmailClient._sanitize_imap_value
+        paired_criteria = (
+            ("BEFORE", before.strftime("%d-%b-%Y").upper() if before else None),
+            ("SINCE", since.strftime("%d-%b-%Y").upper() if since else None),
+            ("SUBJECT", subject and sanitize(subject)),
+            ("BODY", body and sanitize(body)),
+            ("TEXT", text and sanitize(text)),
+            ("FROM", from_address and sanitize(from_address)),
+            ("TO", to_address and sanitize(to_address)),
+        )
+        search_criteria = [token for key, value in paired_criteria if value for token in (key, value)]
 
         # Attachment heuristic: most attachments are carried in multipart/mixed.
         # May miss some types (e.g. inline images) or yield false positives.
@@ -729,22 +1259,25 @@ class EmailClient:
     def _parse_headers(self, email_id: str, raw_headers: bytes) -> dict[str, Any] | None:
         """Parse raw email headers into metadata dictionary.
 
-        Note: this parses only header data (BODY.PEEK[HEADER]) so it cannot
+        Note: this parses only header data (a BODY.PEEK[HEADER.FIELDS] subset) so it cannot
         populate the attachments list — that requires fetching BODYSTRUCTURE
         or the full body. The attachments list is intentionally returned
         empty here; ``_parse_email_data`` populates it from the full body.
+
+        Uses the lightweight ``_parse_header_block`` splitter rather than the
+        full BytesParser: the listing only reads a few headers, and this runs
+        once per message on every page.
         """
         try:
-            parser = BytesParser(policy=default)
-            email_message = parser.parsebytes(raw_headers)
+            headers = _parse_header_block(raw_headers)
 
-            subject = email_message.get("Subject", "")
-            sender = email_message.get("From", "")
-            date_str = email_message.get("Date", "")
+            subject = headers.get("subject", "")
+            sender = headers.get("from", "")
+            date_str = headers.get("date", "")
             # Expose Message-ID for reply threading and de-duplication on the client.
-            message_id = email_message.get("Message-ID")
+            message_id = headers.get("message-id")
 
-            to_addresses = self._parse_recipients(email_message)
+            to_addresses = self._parse_recipient_headers(headers.get("to", ""), headers.get("cc", ""))
             date = self._parse_date(date_str)
 
             return {
@@ -771,18 +1304,18 @@ class EmailClient:
         """Fetch INTERNALDATE for a single chunk of UIDs."""
         uid_list = ",".join(uid.decode() for uid in chunk)
         chunk_start = time.perf_counter()
-        _, data = await asyncio.wait_for(
-            imap.uid("fetch", uid_list, "(INTERNALDATE)"),
-            timeout=timeout,
-        )
+        # asyncio.timeout avoids the wrapper task asyncio.wait_for spawns
+        # per call; this runs once per 100-UID chunk on every listing.
+        async with asyncio.timeout(timeout):
+            _, data = await imap.uid("fetch", uid_list, "(INTERNALDATE)")
         chunk_elapsed = time.perf_counter() - chunk_start
 
         chunk_dates: dict[str, datetime] = {}
         for item in data:
             if not isinstance(item, bytes) or b"INTERNALDATE" not in item:
                 continue
-            uid_match = re.search(rb"UID (\d+)", item)
-            date_match = re.search(rb'INTERNALDATE "([^"]+)"', item)
+            uid_match = _UID_RE.search(item)
+            date_match = _INTERNALDATE_RE.search(item)
             if uid_match and date_match:
                 uid = uid_match.group(1).decode()
                 date_str = date_match.group(1).decode().strip()
@@ -825,38 +1358,35 @@ class EmailClient:
         self,
         imap: aioimaplib.IMAP4_SSL | aioimaplib.IMAP4,
         email_ids: list[bytes] | list[str],
+        chunk_size: int = 100,
     ) -> dict[str, dict[str, Any]]:
-        """Batch fetch headers for a list of UIDs."""
+        """Batch fetch headers for a list of UIDs (chunked, sequential).
+
+        A single UID FETCH covers a whole chunk, so a page costs one round
+        trip instead of one per message. The chunk_size cap keeps the UID set
+        below server request-size limits for oversized pages.
+
+        Only the header fields the listing actually reads are requested:
+        full header blocks are dominated by Received/DKIM/ARC chains that
+        can run to several kilobytes per message and would be discarded
+        unparsed.
+        """
         if not email_ids:
             return {}
 
         # Normalize to list of strings
         str_ids = [uid.decode() if isinstance(uid, bytes) else uid for uid in email_ids]
-        uid_list = ",".join(str_ids)
-        _, data = await imap.uid("fetch", uid_list, "BODY.PEEK[HEADER]")
+        chunks = [str_ids[i : i + chunk_size] for i in range(0, len(str_ids), chunk_size)]
 
         results: dict[str, dict[str, Any]] = {}
-        for i, item in enumerate(data):
-            if not isinstance(item, bytes) or b"BODY[HEADER]" not in item:
-                continue
-            # First try to find UID in the same line (standard format)
-            uid_match = re.search(rb"UID (\d+)", item)
-            if uid_match and i + 1 < len(data) and isinstance(data[i + 1], bytearray):
-                uid = uid_match.group(1).decode()
-                raw_headers = bytes(data[i + 1])
+        for chunk in chunks:
+            uid_list = ",".join(chunk)
+            _, data = await imap.uid("fetch", uid_list, "BODY.PEEK[HEADER.FIELDS (FROM TO CC SUBJECT DATE MESSAGE-ID)]")
+
+            for uid, raw_headers in _iter_fetch_header_blocks(data):
                 metadata = self._parse_headers(uid, raw_headers)
                 if metadata:
                     results[uid] = metadata
-            # Proton Bridge format: UID comes AFTER header data in a separate item
-            # Format: [i]=b'N FETCH (BODY[HEADER] {size}', [i+1]=bytearray(headers), [i+2]=b' UID xxx)'
-            elif i + 2 < len(data) and isinstance(data[i + 1], bytearray):
-                uid_after_match = re.search(rb"UID (\d+)", data[i + 2]) if isinstance(data[i + 2], bytes) else None
-                if uid_after_match:
-                    uid = uid_after_match.group(1).decode()
-                    raw_headers = bytes(data[i + 1])
-                    metadata = self._parse_headers(uid, raw_headers)
-                    if metadata:
-                        results[uid] = metadata
 
         return results
 
@@ -882,20 +1412,10 @@ class EmailClient:
             fetch_response = await imap.uid("fetch", uid_list, "BODY.PEEK[HEADER.FIELDS (FROM)]")
             _raise_for_imap_command_failure(fetch_response, f"FETCH From headers for UIDs {uid_list}")
             _, data = fetch_response
-            for i, item in enumerate(data):
-                if not isinstance(item, bytes) or b"BODY[HEADER" not in item:
-                    continue
-                uid_match = re.search(rb"UID (\d+)", item)
-                if uid_match and i + 1 < len(data) and isinstance(data[i + 1], bytearray):
-                    meta = self._parse_headers(uid_match.group(1).decode(), bytes(data[i + 1]))
-                    if meta:
-                        senders[meta["email_id"]] = meta["from"]
-                elif i + 2 < len(data) and isinstance(data[i + 1], bytearray):
-                    uid_after = re.search(rb"UID (\d+)", data[i + 2]) if isinstance(data[i + 2], bytes) else None
-                    if uid_after:
-                        meta = self._parse_headers(uid_after.group(1).decode(), bytes(data[i + 1]))
-                        if meta:
-                            senders[meta["email_id"]] = meta["from"]
+            for uid, raw_headers in _iter_fetch_header_blocks(data):
+                meta = self._parse_headers(uid, raw_headers)
+                if meta:
+                    senders[meta["email_id"]] = meta["from"]
         return senders
 
     async def _enforce_sender_allowlist(
@@ -946,13 +1466,8 @@ class EmailClient:
         has_attachment: bool | None = None,
         allowed_senders: list[str] | None = None,
     ) -> tuple[int, list[dict[str, Any]]]:
-        imap = await self._connect_imap()
-        try:
-            # Login and select mailbox
-            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
-            await _send_imap_id(imap)
-            select_response = await imap.select(_quote_mailbox(mailbox))
-            _raise_for_imap_error(select_response, f"SELECT mailbox {mailbox}")
+        async with self._imap_session() as imap:
+            await self._select_mailbox(imap, mailbox)
 
             search_criteria = self._build_search_criteria(
                 before,
@@ -1015,19 +1530,24 @@ class EmailClient:
 
             # Keep UID SEARCH results as the source of truth. Use INTERNALDATE where
             # available, and fall back to UID ordering for provider-specific
-            # INTERNALDATE response formats that cannot be parsed.
+            # INTERNALDATE response formats that cannot be parsed. Only the first
+            # page * page_size UIDs in sort order are ever shown, so select them
+            # with a bounded heap (O(N log k)) instead of fully sorting the
+            # mailbox. nlargest/nsmallest match sorted(...)[:k] exactly.
+            page_end = page * page_size
             if order == "desc":
-                sorted_uids = sorted(
+                sorted_uids = heapq.nlargest(
+                    page_end,
                     (uid.decode() for uid in email_ids),
                     key=lambda uid: (
                         uid_dates.get(uid) is not None,
                         uid_dates.get(uid) or datetime.min.replace(tzinfo=UTC),
                         _uid_sort_key(uid),
                     ),
-                    reverse=True,
                 )
             else:
-                sorted_uids = sorted(
+                sorted_uids = heapq.nsmallest(
+                    page_end,
                     (uid.decode() for uid in email_ids),
                     key=lambda uid: (
                         uid_dates.get(uid) is None,
@@ -1038,7 +1558,7 @@ class EmailClient:
 
             # Paginate
             start = (page - 1) * page_size
-            page_uids = sorted_uids[start : start + page_size]
+            page_uids = sorted_uids[start:page_end]
 
             if not page_uids:
                 logger.info(f"Phase 1 (dates): {len(uid_dates)} UIDs in {fetch_dates_elapsed:.2f}s, page {page} empty")
@@ -1057,28 +1577,25 @@ class EmailClient:
             # Collect page results in sorted order
             page_emails = [metadata_by_uid[uid] for uid in page_uids if uid in metadata_by_uid]
             return len(email_ids), page_emails
-        finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
 
     def _check_email_content(self, data: list) -> bool:
-        """Check if the fetched data contains actual email content."""
-        for item in data:
-            if isinstance(item, bytes) and b"FETCH (" in item and b"RFC822" not in item and b"BODY" not in item:
-                # This is just metadata, not actual content
-                continue
-            elif isinstance(item, bytes | bytearray) and len(item) > 100:
-                # This looks like email content
-                return True
-        return False
+        """Check if the fetched data contains actual email content.
+
+        Same predicate as ``_extract_raw_email``: one pass over the response
+        items instead of a separate metadata/content substring scan.
+        """
+        return self._extract_raw_email(data) is not None
+
+    def _extract_raw_email(self, data: list) -> bytes | bytearray | None:
+        """Extract raw email bytes from IMAP response data.
 
-    def _extract_raw_email(self, data: list) -> bytes | None:
-        """Extract raw email bytes from IMAP response data."""
+        Returns the response buffer as-is (usually a bytearray) rather than
+        copying it to bytes — on a multi-MB message the copy doubled peak
+        memory for no benefit, since the parser accepts either type.
+        """
         # The email content is typically at index 1 as a bytearray
         if len(data) > 1 and isinstance(data[1], bytearray):
-            return bytes(data[1])
+            return data[1]
 
         # Search through all items for email content
         for item in data:
@@ -1087,12 +1604,22 @@ class EmailClient:
                 if isinstance(item, bytes) and b"FETCH" in item:
                     continue
                 # This is likely the email content
-                return bytes(item) if isinstance(item, bytearray) else item
+                return item
         return None
 
     async def _fetch_email_with_formats(self, imap, email_id: str) -> list | None:
-        """Try non-mutating fetch formats to get email data."""
+        """Try non-mutating fetch formats to get email data.
+
+        The format that succeeded for this server is memoized and tried
+        first on later calls, so a server that rejects the default
+        candidate pays the failed probe once per process, not per fetch.
+        """
         fetch_formats = ["BODY.PEEK[]", "(BODY.PEEK[])"]
+        cache_key = (self.email_server.host, self.email_server.user_name)
+        cached_format = _fetch_format_cache.get(cache_key)
+        if cached_format in fetch_formats:
+            fetch_formats.remove(cached_format)
+            fetch_formats.insert(0, cached_format)
 
         for fetch_format in fetch_formats:
             try:
@@ -1101,6 +1628,7 @@ class EmailClient:
                 _, data = response
 
                 if data and len(data) > 0 and self._check_email_content(data):
+                    _fetch_format_cache[cache_key] = fetch_format
                     return data
 
             except Exception as e:
@@ -1117,13 +1645,8 @@ class EmailClient:
         body_offset: int = 0,
         max_body_length: int = MAX_BODY_LENGTH,
     ) -> dict[str, Any] | None:
-        imap = await self._connect_imap()
-        try:
-            # Login and select mailbox
-            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
-            await _send_imap_id(imap)
-            select_response = await imap.select(_quote_mailbox(mailbox))
-            _raise_for_imap_error(select_response, f"SELECT mailbox {mailbox}")
+        async with self._imap_session() as imap:
+            await self._select_mailbox(imap, mailbox)
 
             # Sender allowlist: check the From header BEFORE reading the body, so a blocked
             # message is never fetched/parsed, never marked read, and is indistinguishable from
@@ -1163,12 +1686,155 @@ class EmailClient:
 
             return email_data
 
-        finally:
-            # Ensure we logout properly
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
+    async def get_email_bodies_by_ids(
+        self,
+        email_ids: list[str],
+        mailbox: str = "INBOX",
+        mark_as_read: bool = False,
+        allowed_senders: list[str] | None = None,
+        body_offset: int = 0,
+        max_body_length: int = MAX_BODY_LENGTH,
+        chunk_size: int = 100,
+    ) -> dict[str, dict[str, Any]]:
+        """Batch fetch and parse message bodies for a set of UIDs.
+
+        One UID FETCH covers a whole chunk, so a batch costs one round trip
+        per ``chunk_size`` messages instead of one per message. The sender
+        allowlist is enforced before any body is fetched; blocked, missing
+        and unparseable UIDs are simply absent from the result, so callers
+        cannot distinguish them. When ``mark_as_read`` is set, successfully
+        fetched messages are flagged with one batched STORE per chunk.
+        """
+        if not email_ids:
+            return {}
+
+        async with self._imap_session() as imap:
+            await self._select_mailbox(imap, mailbox)
+
+            blocked = await self._blocked_uids(imap, email_ids, allowed_senders)
+            wanted = [uid for uid in email_ids if uid not in blocked]
+
+            results: dict[str, dict[str, Any]] = {}
+            for start in range(0, len(wanted), chunk_size):
+                chunk = wanted[start : start + chunk_size]
+                uid_list = ",".join(chunk)
+                try:
+                    response = await imap.uid("fetch", uid_list, "(BODY.PEEK[])")
+                    _raise_for_imap_error(response, f"FETCH bodies for UIDs {uid_list}")
+                except Exception as e:
+                    logger.error(f"Batched body fetch failed for UIDs {uid_list}: {e}")
+                    continue
+                _, data = response
+                for uid, raw_email in _iter_fetch_literal_blocks(data, b"BODY["):
+                    try:
+                        results[uid] = self._parse_email_data(
+                            raw_email, uid, body_offset=body_offset, max_body_length=max_body_length
+                        )
+                    except Exception as e:
+                        logger.error(f"Error parsing email {uid}: {e!s}")
+
+            if mark_as_read and results:
+                fetched = [uid for uid in wanted if uid in results]
+                for start in range(0, len(fetched), chunk_size):
+                    seen_list = ",".join(fetched[start : start + chunk_size])
+                    try:
+                        store_response = await imap.uid("store", seen_list, "+FLAGS", r"(\Seen)")
+                        _raise_for_imap_error(store_response, f"STORE \\Seen for emails {seen_list}")
+                    except Exception as e:
+                        logger.warning(f"Failed to mark emails {seen_list} as read: {e}")
+
+        return results
+
+    def _find_attachment_in_bodystructure(
+        self,
+        structure: list[Any],
+        attachment_name: str,
+    ) -> tuple[str, str, str] | None:
+        """Locate an attachment part in a parsed BODYSTRUCTURE.
+
+        Returns (section, transfer-encoding, mime-type) for the part whose
+        filename matches ``attachment_name``, or None when no part matches.
+        """
+        target = self._normalize_attachment_name(attachment_name)
+        for section, part in _iter_bodystructure_parts(structure):
+            content_params = _mime_params_dict(part[2] if len(part) > 2 else None)
+            disposition_params: dict[str, str] = {}
+            for field in part[7:]:
+                # Extension fields: the disposition is the only (atom, params) pair.
+                if (
+                    isinstance(field, list)
+                    and len(field) >= 2
+                    and isinstance(field[0], str)
+                    and field[0].lower() in {"attachment", "inline"}
+                ):
+                    disposition_params = _mime_params_dict(field[1])
+                    break
+            filename = _decode_mime_filename(disposition_params, "filename") or _decode_mime_filename(
+                content_params, "name"
+            )
+            if filename is None or self._normalize_attachment_name(filename) != target:
+                continue
+            mime_type = f"{part[0]}/{part[1]}".lower() if isinstance(part[0], str) and isinstance(part[1], str) else ""
+            encoding = str(part[5] or "").lower() if len(part) > 5 else ""
+            return section, encoding, mime_type
+        return None
+
+    async def _fetch_attachment_via_bodystructure(
+        self,
+        imap: aioimaplib.IMAP4_SSL | aioimaplib.IMAP4,
+        email_id: str,
+        attachment_name: str,
+        mailbox: str = "INBOX",
+    ) -> tuple[bytes, str, str] | None:
+        """Fetch only the matching attachment part, scoped via BODYSTRUCTURE.
+
+        Transfers just the attachment's MIME part instead of the whole
+        message. Returns (raw transfer-encoded payload, transfer encoding,
+        mime type), or None when the structure cannot be parsed or no part
+        matches — callers then fall back to the full-message fetch. The
+        payload is left encoded so it can be decoded straight to disk.
+        Parsed structures are cached per (account, mailbox, UID), so pulling
+        several attachments from one message fetches the structure once.
+        """
+        try:
+            cache_key = (self.email_server.host, self.email_server.user_name, mailbox, email_id)
+            structure = _bodystructure_cache.get(cache_key)
+            if structure is not None:
+                _bodystructure_cache.move_to_end(cache_key)
+            else:
+                response = await imap.uid("fetch", email_id, "BODYSTRUCTURE")
+                _raise_for_imap_command_failure(response, f"FETCH BODYSTRUCTURE for email {email_id}")
+                _, data = response
+                line = next(
+                    (bytes(item) for item in data if isinstance(item, bytes | bytearray) and b"BODYSTRUCTURE" in item),
+                    None,
+                )
+                if line is None:
+                    return None
+                text = line.decode("utf-8", errors="replace")
+                structure, _index = _parse_imap_nested_list(text, text.index("(", text.index("BODYSTRUCTURE")))
+                if not structure or not isinstance(structure[0], list):
+                    return None  # non-multipart message; full fetch handles the error reporting
+                _bodystructure_cache[cache_key] = structure
+                while len(_bodystructure_cache) > _BODYSTRUCTURE_CACHE_MAX:
+                    _bodystructure_cache.popitem(last=False)
+
+            found = self._find_attachment_in_bodystructure(structure, attachment_name)
+            if found is None:
+                return None
+            section, encoding, mime_type = found
+
+            part_response = await imap.uid("fetch", email_id, f"BODY.PEEK[{section}]")
+            _raise_for_imap_command_failure(part_response, f"FETCH BODY[{section}] for email {email_id}")
+            _, part_data = part_response
+            payload = next((bytes(item) for item in part_data if isinstance(item, bytearray)), None)
+            if payload is None:
+                return None
+
+            return payload, encoding, mime_type
+        except Exception as e:
+            logger.debug(f"BODYSTRUCTURE-scoped attachment fetch failed for email {email_id}: {e}")
+            return None
 
     async def download_attachment(
         self,
@@ -1191,18 +1857,27 @@ class EmailClient:
         Returns:
             A dictionary with download result information.
         """
-        imap = await self._connect_imap()
-        try:
-            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
-            await _send_imap_id(imap)
-            select_response = await imap.select(_quote_mailbox(mailbox))
-            _raise_for_imap_error(select_response, f"SELECT mailbox {mailbox}")
+        async with self._imap_session() as imap:
+            await self._select_mailbox(imap, mailbox)
 
             # Read-path allowlist: check the From header before fetching the body, so a
             # blocked sender's message is never read. Blocked fails identically to a missing
             # UID (same ValueError below), so it does not reveal whether the message exists.
             await self._enforce_sender_allowlist(imap, email_id, allowed_senders)
 
+            # Fast path: fetch only the attachment's MIME part (bandwidth and
+            # parse cost scale with the attachment, not the whole message).
+            # Any parse failure or server quirk falls back to the full fetch.
+            scoped = await self._fetch_attachment_via_bodystructure(imap, email_id, attachment_name, mailbox)
+            if scoped is not None:
+                payload, encoding, mime_type = scoped
+                try:
+                    return await self._save_attachment_streamed(
+                        email_id, attachment_name, save_path, payload, encoding, mime_type
+                    )
+                except binascii.Error as e:
+                    logger.debug(f"Streamed decode failed for email {email_id}, falling back to full fetch: {e}")
+
             data = await self._fetch_email_with_formats(imap, email_id)
             if not data:
                 msg = f"Failed to fetch email with UID {email_id}"
@@ -1215,53 +1890,107 @@ class EmailClient:
                 logger.error(msg)
                 raise ValueError(msg)
 
-            parser = BytesParser(policy=default)
-            email_message = parser.parsebytes(raw_email)
-
-            # Find the attachment
-            attachment_data: bytes | None = None
-            mime_type = None
-            normalized_attachment_name = self._normalize_attachment_name(attachment_name)
-
-            if email_message.is_multipart():
-                for part in email_message.walk():
-                    # Match attachments listed by ``_parse_email_data`` — this includes
-                    # inline-disposition parts with a filename (e.g. iOS Mail photos).
-                    if not self._is_attachment_part(part):
-                        continue
-                    filename = part.get_filename()
-                    if not isinstance(filename, str):
-                        continue
-                    if self._normalize_attachment_name(filename) == normalized_attachment_name:
-                        attachment_data = _decoded_payload(part)
-                        mime_type = part.get_content_type()
-                        break
+            # Full-message parse and transfer decode are CPU-bound on
+            # multi-MB messages; run them in a worker thread so the event
+            # loop keeps draining other IMAP reads meanwhile.
+            attachment_data, mime_type = await asyncio.to_thread(
+                self._extract_attachment_from_raw, raw_email, attachment_name
+            )
 
             if attachment_data is None:
                 msg = f"Attachment '{attachment_name}' not found in email {email_id}"
                 logger.error(msg)
                 raise ValueError(msg)
 
-            # Save to disk
-            save_file = Path(save_path)
-            save_file.parent.mkdir(parents=True, exist_ok=True)
-            save_file.write_bytes(attachment_data)
+            return await self._save_attachment(email_id, attachment_name, save_path, attachment_data, mime_type)
 
-            logger.info(f"Attachment '{attachment_name}' saved to {save_path}")
+    def _extract_attachment_from_raw(
+        self,
+        raw_email: bytes | bytearray,
+        attachment_name: str,
+    ) -> tuple[bytes | None, str | None]:
+        """Parse a full raw message and decode the named attachment.
 
-            return {
-                "email_id": email_id,
-                "attachment_name": attachment_name,
-                "mime_type": mime_type or "application/octet-stream",
-                "size": len(attachment_data),
-                "saved_path": str(save_file.resolve()),
-            }
+        Synchronous — ``download_attachment`` offloads this via
+        ``asyncio.to_thread`` on its fallback path.
+        """
+        email_message = _BYTES_PARSER.parsebytes(raw_email)
 
-        finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
+        normalized_attachment_name = self._normalize_attachment_name(attachment_name)
+
+        if email_message.is_multipart():
+            for part in email_message.walk():
+                # Match attachments listed by ``_parse_email_data`` — this includes
+                # inline-disposition parts with a filename (e.g. iOS Mail photos).
+                if not self._is_attachment_part(part):
+                    continue
+                filename = part.get_filename()
+                if not isinstance(filename, str):
+                    continue
+                if self._normalize_attachment_name(filename) == normalized_attachment_name:
+                    return _decoded_payload(part), part.get_content_type()
+
+        return None, None
+
+    @staticmethod
+    async def _save_attachment(
+        email_id: str,
+        attachment_name: str,
+        save_path: str,
+        attachment_data: bytes,
+        mime_type: str | None,
+    ) -> dict[str, Any]:
+        """Write downloaded attachment bytes to disk and build the result dict.
+
+        The write runs in a worker thread: attachments can be large and a
+        blocking write_bytes on the event loop would stall the IMAP session.
+        """
+        save_file = Path(save_path)
+        await asyncio.to_thread(save_file.parent.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(save_file.write_bytes, attachment_data)
+
+        logger.info(f"Attachment '{attachment_name}' saved to {save_path}")
+
+        return {
+            "email_id": email_id,
+            "attachment_name": attachment_name,
+            "mime_type": mime_type or "application/octet-stream",
+            "size": len(attachment_data),
+            "saved_path": str(save_file.resolve()),
+        }
+
+    @staticmethod
+    async def _save_attachment_streamed(
+        email_id: str,
+        attachment_name: str,
+        save_path: str,
+        payload: bytes,
+        encoding: str,
+        mime_type: str | None,
+    ) -> dict[str, Any]:
+        """Decode a transfer-encoded attachment payload directly to disk.
+
+        Unlike ``_save_attachment`` this never materialises the decoded bytes
+        as one buffer; the decode-and-write loop runs in a worker thread.  A
+        partially written file is removed before a decode error propagates.
+        """
+        save_file = Path(save_path)
+        await asyncio.to_thread(save_file.parent.mkdir, parents=True, exist_ok=True)
+        try:
+            size = await asyncio.to_thread(_decode_payload_to_file, payload, encoding, save_file)
+        except BaseException:
+            await asyncio.to_thread(save_file.unlink, missing_ok=True)
+            raise
+
+        logger.info(f"Attachment '{attachment_name}' saved to {save_path}")
+
+        return {
+            "email_id": email_id,
+            "attachment_name": attachment_name,
+            "mime_type": mime_type or "application/octet-stream",
+            "size": size,
+            "saved_path": str(save_file.resolve()),
+        }
 
     def _validate_attachment(self, file_path: str) -> Path:
         """Validate attachment file path."""
@@ -1279,15 +2008,47 @@ class EmailClient:
         return path
 
     def _create_attachment_part(self, path: Path) -> MIMEApplication:
-        """Create MIME attachment part from file."""
-        with open(path, "rb") as f:
-            file_data = f.read()
+        """Create MIME attachment part from file.
 
+        The file is memory-mapped and base64-encoded slice by slice into a
+        buffer preallocated to the exact encoded size, so peak memory is the
+        encoded payload plus one slice — the raw bytes stay in the page cache
+        instead of being copied into Python objects, and there is no
+        intermediate chunk list or join copy.
+        """
         mime_type, _ = mimetypes.guess_type(str(path))
         if mime_type is None:
             mime_type = "application/octet-stream"
 
-        attachment_part = MIMEApplication(file_data, _subtype=mime_type.split("/")[1])
+        # 57 raw bytes encode to one canonical 76-character base64 line, so a
+        # multiple of 57 keeps slice boundaries off line and padding breaks
+        # and the output matches a single encodebytes() call exactly.
+        chunk_size = 57 * 16384
+        file_size = path.stat().st_size
+        if file_size == 0:
+            # mmap rejects empty files; an empty payload needs no encoding.
+            encoded = ""
+        else:
+            # Exact size: ceil(n/3) four-char groups plus one newline per
+            # 57-byte line, matching base64.encodebytes() output.
+            encoded_buf = bytearray(-(-file_size // 3) * 4 + -(-file_size // 57))
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    pos = 0
+                    for offset in range(0, file_size, chunk_size):
+                        chunk = base64.encodebytes(view[offset : offset + chunk_size])
+                        encoded_buf[pos : pos + len(chunk)] = chunk
+                        pos += len(chunk)
+                finally:
+                    view.release()
+            encoded = encoded_buf.decode("ascii")
+
+        # The empty-payload constructor still sets the base64
+        # Content-Transfer-Encoding header; the payload is then replaced with
+        # the pre-encoded data.
+        attachment_part = MIMEApplication(b"", _subtype=mime_type.split("/")[1])
+        attachment_part.set_payload(encoded)
         attachment_part.add_header(
             "Content-Disposition",
             "attachment",
@@ -1297,21 +2058,40 @@ class EmailClient:
         return attachment_part
 
     def _create_message_with_attachments(self, body: str, html: bool, attachments: list[str]) -> MIMEMultipart:
-        """Create multipart message with attachments."""
+        """Create multipart message with attachments.
+
+        Multiple attachments are read and encoded on a small thread pool so
+        the disk reads overlap instead of running back to back.
+        """
         msg = MIMEMultipart()
         content_type = "html" if html else "plain"
         text_part = MIMEText(body, content_type, "utf-8")
         msg.attach(text_part)
 
+        paths: list[Path] = []
         for file_path in attachments:
             try:
-                path = self._validate_attachment(file_path)
-                attachment_part = self._create_attachment_part(path)
-                msg.attach(attachment_part)
+                paths.append(self._validate_attachment(file_path))
             except Exception as e:
                 logger.error(f"Failed to attach file {file_path}: {e}")
                 raise
 
+        def build_part(path: Path) -> MIMEApplication:
+            try:
+                return self._create_attachment_part(path)
+            except Exception as e:
+                logger.error(f"Failed to attach file {path}: {e}")
+                raise
+
+        if len(paths) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(paths))) as pool:
+                parts = list(pool.map(build_part, paths))
+        else:
+            parts = [build_part(path) for path in paths]
+
+        for attachment_part in parts:
+            msg.attach(attachment_part)
+
         return msg
 
     def compose_message(
@@ -1331,7 +2111,10 @@ class EmailClient:
         """Compose an email message without sending it.
 
         Builds MIME structure, sets headers (Subject, From, To, Cc, Date,
-        Message-Id, threading headers). Synchronous — no I/O.
+        Message-Id, threading headers). Synchronous — header-only composition
+        does no I/O, but attachments are read and encoded here, so async
+        callers should offload via ``asyncio.to_thread`` when attachments
+        are present.
 
         When ``include_bcc_header`` is True (used for local IMAP storage such
         as Drafts or Sent copies), the Bcc header is included so mail clients
@@ -1346,21 +2129,12 @@ class EmailClient:
             msg = MIMEText(body, content_type, "utf-8")
 
         # Handle subject with special characters
-        if any(ord(c) > 127 for c in subject):
-            msg["Subject"] = str(Header(subject, "utf-8"))
-        else:
+        if subject.isascii():
             msg["Subject"] = subject
-
-        sender_name, sender_address = email.utils.parseaddr(self.sender)
-
-        # Encode only the display name. RFC 2047 encoded-words must not cover the
-        # addr-spec, otherwise strict clients may show the raw encoded blob.
-        if sender_address:
-            msg["From"] = email.utils.formataddr((str(Header(sender_name, "utf-8")), sender_address))
-        elif any(ord(c) > 127 for c in self.sender):
-            msg["From"] = str(Header(self.sender, "utf-8"))
         else:
-            msg["From"] = self.sender
+            msg["Subject"] = str(Header(subject, "utf-8"))
+
+        msg["From"] = self._from_header
 
         msg["To"] = ", ".join(recipients)
 
@@ -1382,9 +2156,7 @@ class EmailClient:
 
         # Set Date and Message-Id headers
         msg["Date"] = email.utils.formatdate(localtime=True)
-        sender_for_domain = sender_address or self.sender
-        sender_domain = sender_for_domain.rsplit("@", 1)[-1].rstrip(">")
-        msg["Message-Id"] = email.utils.make_msgid(domain=sender_domain)
+        msg["Message-Id"] = email.utils.make_msgid(domain=self._sender_domain)
 
         return msg
 
@@ -1401,30 +2173,95 @@ class EmailClient:
         references: str | None = None,
         reply_to: str | None = None,
     ) -> MIMEText | MIMEMultipart:
-        msg = self.compose_message(
+        msg = await self.build_message(
+            recipients, subject, body, cc, bcc, html, attachments, in_reply_to, references, reply_to
+        )
+        await self._smtp_send(msg, _combine_recipients(recipients, cc, bcc))
+
+        # Return the message for potential saving to Sent folder
+        return msg
+
+    async def build_message(
+        self,
+        recipients: list[str],
+        subject: str,
+        body: str,
+        cc: list[str] | None = None,
+        bcc: list[str] | None = None,
+        html: bool = False,
+        attachments: list[str] | None = None,
+        in_reply_to: str | None = None,
+        references: str | None = None,
+        reply_to: str | None = None,
+    ) -> MIMEText | MIMEMultipart:
+        """Compose an outgoing message without sending it.
+
+        Split from ``send_email`` so callers can overlap SMTP delivery with
+        other work on the finished message (e.g. the Sent-folder APPEND).
+        """
+        if attachments:
+            # Attachment reads and base64 encoding block; keep them off the event loop.
+            return await asyncio.to_thread(
+                self.compose_message,
+                recipients,
+                subject,
+                body,
+                cc,
+                bcc,
+                html,
+                attachments,
+                in_reply_to,
+                references,
+                False,
+                reply_to,
+            )
+        return self.compose_message(
             recipients, subject, body, cc, bcc, html, attachments, in_reply_to, references, False, reply_to
         )
 
-        async with aiosmtplib.SMTP(
+    async def _smtp_send(self, msg: MIMEText | MIMEMultipart, all_recipients: list[str]) -> None:
+        """Deliver an already composed message over SMTP."""
+        smtp = await self._acquire_smtp()
+        try:
+            await smtp.send_message(msg, recipients=all_recipients)
+        except BaseException:
+            # A failed transaction leaves the connection in an unknown state;
+            # drop it so the next send starts from a fresh handshake.
+            await _close_smtp_quietly(smtp)
+            raise
+        else:
+            await _return_smtp_to_pool(self._smtp_pool_key, smtp)
+
+    @property
+    def _smtp_pool_key(self) -> tuple[str, int, str]:
+        return (self.email_server.host, self.email_server.port, self.email_server.user_name)
+
+    async def _acquire_smtp(self) -> aiosmtplib.SMTP:
+        """Return a pooled SMTP connection, or open and authenticate a new one.
+
+        A pooled connection is validated with NOOP first; stale connections
+        are discarded and replaced, so callers always get a usable session.
+        """
+        pooled = _smtp_pool.pop(self._smtp_pool_key, None)
+        if pooled is not None:
+            try:
+                await pooled.noop()
+            except Exception as e:
+                logger.debug(f"Pooled SMTP connection is stale, reconnecting: {e}")
+                await _close_smtp_quietly(pooled)
+            else:
+                return pooled
+
+        smtp = aiosmtplib.SMTP(
             hostname=self.email_server.host,
             port=self.email_server.port,
             start_tls=self.smtp_start_tls,
             use_tls=self.smtp_use_tls,
-            tls_context=self._get_smtp_ssl_context(),
-        ) as smtp:
-            await smtp.login(self.email_server.user_name, self.email_server.password.get_secret_value())
-
-            # Create a combined list of all recipients for delivery
-            all_recipients = recipients.copy()
-            if cc:
-                all_recipients.extend(cc)
-            if bcc:
-                all_recipients.extend(bcc)
-
-            await smtp.send_message(msg, recipients=all_recipients)
-
-        # Return the message for potential saving to Sent folder
-        return msg
+            tls_context=self._smtp_ssl_context,
+        )
+        await smtp.connect()
+        await smtp.login(self.email_server.user_name, self.email_server.password.get_secret_value())
+        return smtp
 
     async def _find_sent_folder_by_flag(self, imap) -> str | None:
         """Find the Sent folder by searching for the \\Sent IMAP flag.
@@ -1450,6 +2287,47 @@ class EmailClient:
 
         return None
 
+    @staticmethod
+    def _append_pool_key(server: EmailServer) -> tuple[str, int, str]:
+        return (server.host, server.port, server.user_name)
+
+    async def _acquire_append_imap(self, server: EmailServer) -> aioimaplib.IMAP4 | aioimaplib.IMAP4_SSL:
+        """Return a pooled authenticated IMAP connection, or open a new one.
+
+        Mirrors ``_acquire_smtp``: a pooled connection is validated with NOOP
+        first, and stale connections are discarded and replaced, so callers
+        always get a logged-in session.
+        """
+        pooled = _append_imap_pool.pop(self._append_pool_key(server), None)
+        if pooled is not None:
+            try:
+                noop_response = await pooled.noop()
+                if str(noop_response[0]).upper() == "OK":
+                    return pooled
+                logger.debug(f"Pooled IMAP connection NOOP returned {noop_response[0]}, reconnecting")
+            except Exception as e:
+                logger.debug(f"Pooled IMAP connection is stale, reconnecting: {e}")
+            await _close_imap_quietly(pooled)
+
+        imap = await self._connect_imap_server(server)
+        await _imap_login(imap, server.user_name, server.password.get_secret_value())
+        await _send_imap_id(imap)
+        return imap
+
+    async def _release_append_imap(
+        self,
+        server: EmailServer,
+        imap: aioimaplib.IMAP4 | aioimaplib.IMAP4_SSL,
+        keep_pooled: bool,
+    ) -> None:
+        """Return an acquired connection to the pool or discard it."""
+        if keep_pooled:
+            await _return_append_imap_to_pool(self._append_pool_key(server), imap)
+        else:
+            # A failed probe or append leaves the session state unclear;
+            # drop the connection so the next send starts fresh.
+            await _close_imap_quietly(imap)
+
     async def append_to_sent(
         self,
         msg: MIMEText | MIMEMultipart,
@@ -1458,6 +2336,10 @@ class EmailClient:
     ) -> bool:
         """Append a sent message to the IMAP Sent folder.
 
+        The connection is taken from (and on success returned to) a pool
+        keyed by server and user, so steady-state sends skip the TLS
+        handshake and LOGIN round-trips.
+
         Args:
             msg: The email message that was sent
             incoming_server: IMAP server configuration for accessing Sent folder
@@ -1466,10 +2348,49 @@ class EmailClient:
         Returns:
             True if successfully saved, False otherwise
         """
-        imap = await self._connect_imap_server(incoming_server)
+        try:
+            imap = await self._acquire_append_imap(incoming_server)
+        except ConnectionError:
+            raise
+        except Exception as e:
+            logger.error(f"Error saving to Sent folder: {e}")
+            return False
 
+        cache_key = (incoming_server.host, incoming_server.user_name)
+        keep_pooled = False
+        try:
+            for folder in await self._sent_folder_candidates(imap, sent_folder_name, cache_key):
+                if await self._try_append_to_folder(imap, folder, msg):
+                    _sent_folder_cache[cache_key] = folder
+                    keep_pooled = True
+                    return True
+
+            _sent_folder_cache.pop(cache_key, None)  # drop a stale entry so the next send re-discovers
+            logger.warning("Could not find a valid Sent folder to save the message")
+            return False
+
+        except ConnectionError:
+            raise
+        except Exception as e:
+            logger.error(f"Error saving to Sent folder: {e}")
+            return False
+        finally:
+            await self._release_append_imap(incoming_server, imap, keep_pooled)
+
+    async def _sent_folder_candidates(
+        self,
+        imap,
+        sent_folder_name: str | None,
+        cache_key: tuple[str, str],
+    ) -> list[str]:
+        """Sent folder names to probe, in priority order.
+
+        A folder that worked before is tried first, without re-listing;
+        otherwise the folder advertising the \\Sent flag leads the list of
+        common provider names.
+        """
         # Common Sent folder names across different providers
-        sent_folder_candidates = [
+        candidates = [
             sent_folder_name,  # User-specified override (if provided)
             "Sent",
             "INBOX.Sent",
@@ -1479,64 +2400,56 @@ class EmailClient:
             "INBOX/Sent",
         ]
         # Filter out None values
-        sent_folder_candidates = [f for f in sent_folder_candidates if f]
+        candidates = [f for f in candidates if f]
 
-        try:
-            await _imap_login(imap, incoming_server.user_name, incoming_server.password.get_secret_value())
-            await _send_imap_id(imap)
-
-            # Try to find Sent folder by IMAP \Sent flag first
+        cached_folder = _sent_folder_cache.get(cache_key)
+        if cached_folder:
+            if cached_folder in candidates:
+                candidates.remove(cached_folder)
+            candidates.insert(0, cached_folder)
+        else:
             flag_folder = await self._find_sent_folder_by_flag(imap)
-            if flag_folder and flag_folder not in sent_folder_candidates:
-                # Add it at the beginning (high priority)
-                sent_folder_candidates.insert(0, flag_folder)
+            if flag_folder and flag_folder not in candidates:
+                candidates.insert(0, flag_folder)
+        return candidates
 
-            # Try to find and use the Sent folder
-            for folder in sent_folder_candidates:
-                try:
-                    logger.debug(f"Trying Sent folder: '{folder}'")
-                    # Try to select the folder to verify it exists
-                    result = await imap.select(_quote_mailbox(folder))
-                    logger.debug(f"Select result for '{folder}': {result}")
-
-                    # aioimaplib returns (status, data) where status is a string like 'OK' or 'NO'
-                    status = result[0] if isinstance(result, tuple) else result
-                    if str(status).upper() == "OK":
-                        # Folder exists, append the message
-                        msg_bytes = msg.as_bytes()
-                        logger.debug(f"Appending message to '{folder}'")
-                        # aioimaplib.append signature: (message_bytes, mailbox, flags, date)
-                        append_result = await imap.append(
-                            msg_bytes,
-                            mailbox=_quote_mailbox(folder),
-                            flags=r"(\Seen)",
-                        )
-                        logger.debug(f"Append result: {append_result}")
-                        append_status = append_result[0] if isinstance(append_result, tuple) else append_result
-                        if str(append_status).upper() == "OK":
-                            logger.info(f"Saved sent email to '{folder}'")
-                            return True
-                        else:
-                            logger.warning(f"Failed to append to '{folder}': {append_status}")
-                    else:
-                        logger.debug(f"Folder '{folder}' select returned: {status}")
-                except Exception as e:
-                    logger.debug(f"Folder '{folder}' not available: {e}")
-                    continue
+    @staticmethod
+    async def _try_append_to_folder(imap, folder: str, msg: MIMEText | MIMEMultipart) -> bool:
+        """Select one candidate folder and append the message to it.
 
-            logger.warning("Could not find a valid Sent folder to save the message")
-            return False
+        Returns True on a successful APPEND; a missing folder or a failed
+        command is logged and reported as False so the caller can move on to
+        the next candidate.
+        """
+        try:
+            logger.debug(f"Trying Sent folder: '{folder}'")
+            # Try to select the folder to verify it exists
+            result = await imap.select(_quote_mailbox(folder))
+            logger.debug(f"Select result for '{folder}': {result}")
 
-        except ConnectionError:
-            raise
+            # aioimaplib returns (status, data) where status is a string like 'OK' or 'NO'
+            status = result[0] if isinstance(result, tuple) else result
+            if str(status).upper() != "OK":
+                logger.debug(f"Folder '{folder}' select returned: {status}")
+                return False
+
+            logger.debug(f"Appending message to '{folder}'")
+            # aioimaplib.append signature: (message_bytes, mailbox, flags, date)
+            append_result = await imap.append(
+                msg.as_bytes(),
+                mailbox=_quote_mailbox(folder),
+                flags=r"(\Seen)",
+            )
+            logger.debug(f"Append result: {append_result}")
+            append_status = append_result[0] if isinstance(append_result, tuple) else append_result
+            if str(append_status).upper() == "OK":
+                logger.info(f"Saved sent email to '{folder}'")
+                return True
+            logger.warning(f"Failed to append to '{folder}': {append_status}")
+            return False
         except Exception as e:
-            logger.error(f"Error saving to Sent folder: {e}")
+            logger.debug(f"Folder '{folder}' not available: {e}")
             return False
-        finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.debug(f"Error during logout: {e}")
 
     async def append_to_mailbox(
         self,
@@ -1552,12 +2465,16 @@ class EmailClient:
         (if the server supports APPENDUID / RFC 4315), or ``"unknown"`` on
         success without UID, or ``None`` on failure.
         """
-        imap = await self._connect_imap_server(incoming_server)
-
         try:
-            await _imap_login(imap, incoming_server.user_name, incoming_server.password.get_secret_value())
-            await _send_imap_id(imap)
+            imap = await self._acquire_append_imap(incoming_server)
+        except ConnectionError:
+            raise
+        except Exception as e:
+            logger.error(f"Error saving to mailbox '{mailbox}': {e}")
+            return None
 
+        keep_pooled = False
+        try:
             result = await imap.select(_quote_mailbox(mailbox))
             status = result[0] if isinstance(result, tuple) else result
             if str(status).upper() != "OK":
@@ -1572,16 +2489,9 @@ class EmailClient:
             )
             append_status = append_result[0] if isinstance(append_result, tuple) else append_result
             if str(append_status).upper() == "OK":
-                # Try to extract UID from APPENDUID response (RFC 4315)
-                uid = None
-                if isinstance(append_result, tuple) and len(append_result) > 1:
-                    for part in append_result[1]:
-                        part_str = part.decode("utf-8") if isinstance(part, bytes) else str(part)
-                        match = re.search(r"APPENDUID\s+\d+\s+(\d+)", part_str, re.IGNORECASE)
-                        if match:
-                            uid = match.group(1)
-                            break
+                uid = self._parse_appenduid(append_result)
                 logger.info(f"Saved email to '{mailbox}'" + (f" (UID {uid})" if uid else ""))
+                keep_pooled = True
                 return uid or "unknown"
             else:
                 logger.warning(f"Failed to append to '{mailbox}': {append_status}")
@@ -1593,10 +2503,49 @@ class EmailClient:
             logger.error(f"Error saving to mailbox '{mailbox}': {e}")
             return None
         finally:
+            await self._release_append_imap(incoming_server, imap, keep_pooled)
+
+    @staticmethod
+    def _parse_appenduid(append_result) -> str | None:
+        """Extract the new message UID from an APPENDUID response (RFC 4315)."""
+        if not (isinstance(append_result, tuple) and len(append_result) > 1):
+            return None
+        for part in append_result[1]:
+            part_str = part.decode("utf-8") if isinstance(part, bytes) else str(part)
+            match = re.search(r"APPENDUID\s+\d+\s+(\d+)", part_str, re.IGNORECASE)
+            if match:
+                return match.group(1)
+        return None
+
+    @staticmethod
+    async def _store_deleted_flags(imap, email_ids: list[str]) -> tuple[set[str], set[str]]:
+        """Flag the given UIDs \\Deleted. Returns (stored, failed) UID sets.
+
+        One UID STORE flags a whole chunk of UIDs, so bulk deletion costs one
+        round trip per chunk instead of one per message. A failed chunk falls
+        back to per-UID STOREs to keep partial-failure reporting exact.
+        """
+        stored: set[str] = set()
+        store_failed: set[str] = set()
+        chunk_size = 100
+        for start in range(0, len(email_ids), chunk_size):
+            chunk = email_ids[start : start + chunk_size]
+            uid_list = ",".join(chunk)
             try:
-                await imap.logout()
+                store_response = await imap.uid("store", uid_list, "+FLAGS", r"(\Deleted)")
+                _raise_for_imap_error(store_response, f"STORE \\Deleted for emails {uid_list}")
+                stored.update(chunk)
             except Exception as e:
-                logger.debug(f"Error during logout: {e}")
+                logger.warning(f"Batched STORE \\Deleted failed for UIDs {uid_list}: {e}; retrying per UID")
+                for email_id in chunk:
+                    try:
+                        store_response = await imap.uid("store", email_id, "+FLAGS", r"(\Deleted)")
+                        _raise_for_imap_error(store_response, f"STORE \\Deleted for email {email_id}")
+                        stored.add(email_id)
+                    except Exception as e:
+                        logger.error(f"Failed to delete email {email_id}: {e}")
+                        store_failed.add(email_id)
+        return stored, store_failed
 
     async def delete_emails(
         self,
@@ -1611,44 +2560,41 @@ class EmailClient:
         no-op success (indistinguishable from a nonexistent UID); when
         report_blocked_mutations is True it is reported in failed_ids instead.
         """
-        imap = await self._connect_imap()
         deleted_ids = []
         failed_ids = []
 
-        try:
-            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
-            await _send_imap_id(imap)
-            select_response = await imap.select(_quote_mailbox(mailbox))
-            _raise_for_imap_error(select_response, f"SELECT mailbox {mailbox}")
+        async with self._imap_session() as imap:
+            await self._select_mailbox(imap, mailbox)
 
             blocked = await self._blocked_uids(imap, email_ids, allowed_senders)
-            deleted_any = False
+            allowed = [email_id for email_id in email_ids if email_id not in blocked]
+
+            stored, store_failed = await self._store_deleted_flags(imap, allowed)
+
             for email_id in email_ids:
                 if email_id in blocked:
                     (failed_ids if report_blocked_mutations else deleted_ids).append(email_id)
-                    continue
-                try:
-                    store_response = await imap.uid("store", email_id, "+FLAGS", r"(\Deleted)")
-                    _raise_for_imap_error(store_response, f"STORE \\Deleted for email {email_id}")
+                elif email_id in stored:
                     deleted_ids.append(email_id)
-                    deleted_any = True
-                except Exception as e:
-                    logger.error(f"Failed to delete email {email_id}: {e}")
+                elif email_id in store_failed:
                     failed_ids.append(email_id)
 
-            if deleted_any:
+            if stored:
+                # Prefer RFC 4315 UID EXPUNGE when advertised: it removes
+                # exactly the UIDs we flagged, leaving any messages other
+                # clients marked \Deleted alone, and the server only has to
+                # process the given UID set instead of scanning the mailbox.
                 try:
-                    expunge_response = await imap.expunge()
+                    if imap.has_capability("UIDPLUS"):
+                        uid_set = ",".join(email_id for email_id in email_ids if email_id in stored)
+                        expunge_response = await imap.uid("expunge", uid_set)
+                    else:
+                        expunge_response = await imap.expunge()
                     _raise_for_imap_error(expunge_response, "EXPUNGE deleted emails")
                 except Exception as e:
                     logger.error(f"Failed to expunge deleted emails: {e}")
                     failed_ids.extend(deleted_ids)
                     deleted_ids = []
-        finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
 
         return deleted_ids, failed_ids
 
@@ -1664,15 +2610,11 @@ class EmailClient:
         A blocked sender's UID is never flagged \\Seen: reported as a no-op success by
         default, or in failed_ids when report_blocked_mutations is True.
         """
-        imap = await self._connect_imap()
         marked_ids: list[str] = []
         failed_ids: list[str] = []
 
-        try:
-            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
-            await _send_imap_id(imap)
-            select_response = await imap.select(_quote_mailbox(mailbox))
-            _raise_for_imap_error(select_response, f"SELECT mailbox {mailbox}")
+        async with self._imap_session() as imap:
+            await self._select_mailbox(imap, mailbox)
 
             blocked = await self._blocked_uids(imap, email_ids, allowed_senders)
             for email_id in email_ids:
@@ -1686,11 +2628,6 @@ class EmailClient:
                 except Exception as e:
                     logger.error(f"Failed to mark email {email_id} as read: {e}")
                     failed_ids.append(email_id)
-        finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
 
         return marked_ids, failed_ids
 
@@ -1707,15 +2644,11 @@ class EmailClient:
         A blocked sender's UID is never copied/moved: reported as a no-op success by default,
         or in failed_ids when report_blocked_mutations is True.
         """
-        imap = await self._connect_imap()
         moved_ids = []
         failed_ids = []
 
-        try:
-            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
-            await _send_imap_id(imap)
-            select_response = await imap.select(_quote_mailbox(source_mailbox))
-            _raise_for_imap_error(select_response, f"SELECT source mailbox {source_mailbox}")
+        async with self._imap_session() as imap:
+            await self._select_mailbox(imap, source_mailbox, context=f"SELECT source mailbox {source_mailbox}")
 
             capabilities = {str(capability).upper() for capability in getattr(imap, "capabilities", ())}
             has_move = hasattr(imap, "move") and "MOVE" in capabilities
@@ -1749,23 +2682,14 @@ class EmailClient:
                     logger.error(f"Failed to expunge moved emails: {e}")
                     failed_ids.extend(copied)
                     moved_ids = [uid for uid in moved_ids if uid not in set(copied)]
-        finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
 
         return moved_ids, failed_ids
 
     async def list_mailboxes(self, pattern: str = "*", reference: str = "") -> list[MailboxInfo]:
         """List available IMAP mailboxes with flags and delimiter."""
-        imap = await self._connect_imap()
         mailboxes = []
 
-        try:
-            await _imap_login(imap, self.email_server.user_name, self.email_server.password.get_secret_value())
-            await _send_imap_id(imap)
-
+        async with self._imap_session() as imap:
             quoted_ref = _quote_mailbox(reference) if reference else '""'
             quoted_pattern = _quote_mailbox(pattern)
             # aioimaplib annotates mailbox_pattern as re.Pattern, but its wire
@@ -1778,11 +2702,6 @@ class EmailClient:
                 mailbox = _parse_list_response(item)
                 if mailbox:
                     mailboxes.append(mailbox)
-        finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
 
         return mailboxes
 
@@ -1796,6 +2715,42 @@ class ClassicEmailHandler(EmailHandler):
         self.save_to_sent = email_settings.save_to_sent
         self.sent_folder_name = email_settings.sent_folder_name
 
+    async def aclose(self) -> None:
+        """Release pooled connections owned by this handler's accounts.
+
+        Pooled SMTP sessions for the handler's servers are closed and removed,
+        and any IMAP connection left pinned by an interrupted reuse scope is
+        logged out. Safe to call more than once.
+        """
+
+        async def close_client(client: EmailClient) -> None:
+            smtp = _smtp_pool.pop(client._smtp_pool_key, None)
+            if smtp is not None:
+                await _close_smtp_quietly(smtp)
+            pooled_imap = _append_imap_pool.pop(client._append_pool_key(client.email_server), None)
+            if pooled_imap is not None:
+                await _close_imap_quietly(pooled_imap)
+            pinned = client._pinned_imap
+            client._pinned_imap = None
+            client._reuse_active = False
+            client._selected_mailbox = None
+            if pinned is not None:
+                await client._logout_quietly(pinned)
+
+        clients = [c for c in (self.incoming_client, self.outgoing_client) if c is not None]
+        # Each client's teardown can stall on a slow LOGOUT/QUIT, so the
+        # clients are closed concurrently rather than back to back.
+        results = await asyncio.gather(*(close_client(client) for client in clients), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Error closing handler client: {result}")
+
+    async def __aenter__(self) -> "ClassicEmailHandler":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
     async def get_emails_metadata(
         self,
         page: int = 1,
@@ -1814,25 +2769,79 @@ class ClassicEmailHandler(EmailHandler):
         text: str | None = None,
         has_attachment: bool | None = None,
     ) -> EmailMetadataPageResponse:
-        total, email_dicts = await self.incoming_client.get_emails_metadata(
-            page,
-            page_size,
-            before,
-            since,
-            subject,
-            from_address,
-            to_address,
-            order,
-            mailbox,
-            seen,
-            flagged,
-            answered,
-            body,
-            text,
-            has_attachment,
-            allowed_senders=get_settings().allowed_senders,
-        )
-        emails = [EmailMetadata.from_email(d) for d in email_dicts]
+        allowed_senders = get_settings().allowed_senders
+        incoming = self.email_settings.incoming
+
+        def page_key(page_number: int) -> tuple:
+            return (
+                incoming.host,
+                incoming.user_name,
+                mailbox,
+                page_number,
+                page_size,
+                before,
+                since,
+                subject,
+                from_address,
+                to_address,
+                order,
+                seen,
+                flagged,
+                answered,
+                body,
+                text,
+                has_attachment,
+                tuple(allowed_senders or ()),
+            )
+
+        async def fetch_page(page_number: int) -> tuple[int, list[dict[str, Any]]]:
+            return await self.incoming_client.get_emails_metadata(
+                page_number,
+                page_size,
+                before,
+                since,
+                subject,
+                from_address,
+                to_address,
+                order,
+                mailbox,
+                seen,
+                flagged,
+                answered,
+                body,
+                text,
+                has_attachment,
+                allowed_senders=allowed_senders,
+            )
+
+        hit = _page_cache.pop(page_key(page), None)
+        if hit is not None and time.monotonic() - hit[0] <= _PAGE_CACHE_TTL_SECONDS:
+            total, email_dicts = hit[1], hit[2]
+        else:
+            total, email_dicts = await fetch_page(page)
+
+        # Callers paging downward almost always ask for the next page;
+        # prefetch it in the background so that request is a cache hit.
+        if order == "desc" and page * page_size < total:
+            next_key = page_key(page + 1)
+            if next_key not in _page_cache:
+
+                async def prefetch() -> None:
+                    try:
+                        next_total, next_dicts = await fetch_page(page + 1)
+                    except Exception as e:
+                        logger.debug(f"Metadata prefetch for page {page + 1} failed: {e}")
+                        return
+                    _page_cache[next_key] = (time.monotonic(), next_total, next_dicts)
+                    while len(_page_cache) > _PAGE_CACHE_MAX:
+                        _page_cache.popitem(last=False)
+
+                task = asyncio.create_task(prefetch())
+                _prefetch_tasks.add(task)
+                task.add_done_callback(_prefetch_tasks.discard)
+
+        # Dicts come straight from our own parser; skip per-field validation.
+        emails = [EmailMetadata.from_email_unchecked(d) for d in email_dicts]
         return EmailMetadataPageResponse(
             page=page,
             page_size=page_size,
@@ -1853,42 +2862,74 @@ class ClassicEmailHandler(EmailHandler):
     ) -> EmailContentBatchResponse:
         """Batch retrieve email body content, honoring the sender allowlist.
 
-        The allowlist is enforced in the read path: get_email_body_by_id checks the From header
-        before fetching the body, so a blocked message is never read or marked and returns None —
-        indistinguishable from a missing/inaccessible one (both land in failed_ids).
+        The allowlist is enforced in the read path: get_email_bodies_by_ids checks the From
+        headers before fetching any body, so a blocked message is never read or marked and is
+        absent from the result — indistinguishable from a missing/inaccessible one (both land
+        in failed_ids).
         """
         allowed_senders = get_settings().allowed_senders
-        emails = []
-        failed_ids = []
 
-        for email_id in email_ids:
+        incoming = self.email_settings.incoming
+
+        def cache_key(email_id: str) -> tuple[str, str, str, str, int, int]:
+            return (incoming.host, incoming.user_name, mailbox, email_id, body_offset, max_body_length)
+
+        # Serve repeat reads from the in-process cache. mark_as_read must
+        # still reach the server (the \Seen STORE is a side effect a cache
+        # hit would silently skip), and a hit is re-checked against the
+        # current allowlist so tightening it takes effect immediately — a
+        # blocked hit behaves like a miss and the fetch path then refuses it.
+        cached: dict[str, dict[str, Any]] = {}
+        if not mark_as_read:
+            for email_id in email_ids:
+                entry = _body_cache.get(cache_key(email_id))
+                if entry is not None and sender_allowed(entry["from"], allowed_senders):
+                    cached[email_id] = entry
+        missing = [email_id for email_id in email_ids if email_id not in cached]
+
+        # One batched UID FETCH per chunk serves the whole request instead of
+        # one SELECT/FETCH round trip per message.
+        bodies: dict[str, dict[str, Any]] = {}
+        if missing:
             try:
-                email_data = await self.incoming_client.get_email_body_by_id(
-                    email_id,
+                bodies = await self.incoming_client.get_email_bodies_by_ids(
+                    missing,
                     mailbox,
                     mark_as_read,
                     allowed_senders=allowed_senders,
                     body_offset=body_offset,
                     max_body_length=max_body_length,
                 )
-                if not email_data:
-                    failed_ids.append(email_id)
-                    continue
-                emails.append(
-                    EmailBodyResponse(
-                        email_id=email_data["email_id"],
-                        message_id=email_data.get("message_id"),
-                        subject=email_data["subject"],
-                        sender=email_data["from"],
-                        recipients=email_data["to"],
-                        date=email_data["date"],
-                        body=email_data["body"],
-                        attachments=email_data["attachments"],
-                    )
-                )
             except Exception as e:
-                logger.error(f"Failed to retrieve email {email_id}: {e}")
-                failed_ids.append(email_id)
+                logger.error(f"Failed to retrieve emails {','.join(missing)}: {e}")
+                bodies = {}
+            for email_id, email_data in bodies.items():
+                _body_cache.put(cache_key(email_id), email_data)
+
+        # One merged lookup table and locally bound builder keep the loop
+        # body to dict accesses — no repeated attribute resolution per
+        # message on large batches. Trusted internal dicts from our own
+        # parser; model_construct skips per-field validation per message.
+        found = {**cached, **bodies}
+        build = EmailBodyResponse.model_construct
+        emails = [
+            build(
+                email_id=email_data["email_id"],
+                message_id=email_data.get("message_id"),
+                subject=email_data["subject"],
+                sender=email_data["from"],
+                recipients=email_data["to"],
+                date=email_data["date"],
+                body=email_data["body"],
+                attachments=email_data["attachments"],
+            )
+            for email_id in email_ids
+            if (email_data := found.get(email_id))
+        ]
+        # Failures are whatever the merged table could not supply; one set
+        # build keeps the classification O(N) and the input order stable.
+        ok_ids = {email.email_id for email in emails}
+        failed_ids = [email_id for email_id in email_ids if email_id not in ok_ids]
 
         return EmailContentBatchResponse(
             emails=emails,
@@ -1913,25 +2954,70 @@ class ClassicEmailHandler(EmailHandler):
         if self.outgoing_client is None:
             raise RuntimeError(f"SMTP is not configured for account '{self.email_settings.account_name}'")
 
-        msg = await self.outgoing_client.send_email(
+        client = self.outgoing_client
+        msg = await client.build_message(
             recipients, subject, body, cc, bcc, html, attachments, in_reply_to, references, reply_to
         )
+        all_recipients = _combine_recipients(recipients, cc, bcc)
 
-        # Save to Sent folder if enabled
-        if self.save_to_sent and msg:
-            # Add BCC header to the saved copy so users can see who was BCC'd.
-            # This MUST happen after smtp.send_message() — that ordering is
-            # load-bearing for security (BCC must not appear in sent headers).
-            if bcc and msg["Bcc"] is None:
-                msg["Bcc"] = ", ".join(bcc)
-            try:
-                await self.outgoing_client.append_to_sent(
-                    msg,
-                    self.email_settings.incoming,
-                    self.sent_folder_name,
-                )
-            except Exception as e:
-                logger.error(f"Failed to save email to Sent folder: {e}", exc_info=True)
+        if not self.save_to_sent:
+            await client._smtp_send(msg, all_recipients)
+            return
+
+        # The Sent copy carries the BCC header so users can see who was
+        # BCC'd, but it MUST be a separate object: the message handed to
+        # SMTP runs concurrently below and may never grow a Bcc header —
+        # that separation is load-bearing for security.
+        sent_copy = copy.deepcopy(msg)
+        if bcc and sent_copy["Bcc"] is None:
+            sent_copy["Bcc"] = ", ".join(bcc)
+
+        # SMTP delivery and the Sent-folder APPEND are independent once the
+        # message exists; overlapping them removes one serial round trip per
+        # send. If SMTP fails after the APPEND succeeded, the unsent Sent
+        # copy is removed as compensation.
+        send_result, append_result = await asyncio.gather(
+            client._smtp_send(msg, all_recipients),
+            client.append_to_sent(sent_copy, self.email_settings.incoming, self.sent_folder_name),
+            return_exceptions=True,
+        )
+
+        if isinstance(append_result, BaseException):
+            logger.error(f"Failed to save email to Sent folder: {append_result}", exc_info=append_result)
+        if isinstance(send_result, BaseException):
+            if append_result is True:
+                await self._remove_unsent_sent_copy(msg["Message-Id"])
+            raise send_result
+        if append_result is True:
+            # The Sent folder gained a message; cached listings are stale.
+            _page_cache.clear()
+
+    async def _remove_unsent_sent_copy(self, message_id: str | None) -> None:
+        """Best-effort removal of a Sent copy whose SMTP delivery failed.
+
+        The APPEND overlaps SMTP delivery, so a failed send can leave an
+        unsent message in the Sent folder; delete it by Message-Id so the
+        folder reflects what was actually delivered.
+        """
+        incoming = self.email_settings.incoming
+        sent_folder = _sent_folder_cache.get((incoming.host, incoming.user_name)) or self.sent_folder_name
+        if not message_id or not sent_folder:
+            logger.warning("Cannot remove unsent Sent copy: Message-Id or Sent folder unknown")
+            return
+        try:
+            async with self.incoming_client._imap_session() as imap:
+                await self.incoming_client._select_mailbox(imap, sent_folder)
+                _, data = await imap.uid_search("HEADER", "Message-ID", EmailClient._sanitize_imap_value(message_id))
+                uids = data[0].split() if data and data[0] else []
+                if not uids:
+                    return
+                uid_list = b",".join(uids).decode()
+                store_response = await imap.uid("store", uid_list, "+FLAGS", r"(\Deleted)")
+                _raise_for_imap_error(store_response, f"STORE \\Deleted for unsent Sent copy {uid_list}")
+                await imap.expunge()
+                logger.info(f"Removed unsent Sent copy {message_id} from '{sent_folder}'")
+        except Exception as e:
+            logger.error(f"Failed to remove unsent Sent copy {message_id}: {e}")
 
     async def save_to_mailbox(
         self,
@@ -1960,18 +3046,34 @@ class ClassicEmailHandler(EmailHandler):
             ValueError: If any flag in *flags* is invalid per RFC 3501.
             RuntimeError: If the IMAP APPEND operation fails.
         """
-        msg = self.incoming_client.compose_message(
-            recipients,
-            subject,
-            body,
-            cc,
-            bcc,
-            html,
-            attachments,
-            in_reply_to,
-            references,
-            include_bcc_header=True,
-        )
+        if attachments:
+            # Attachment reads and base64 encoding block; keep them off the event loop.
+            msg = await asyncio.to_thread(
+                self.incoming_client.compose_message,
+                recipients,
+                subject,
+                body,
+                cc,
+                bcc,
+                html,
+                attachments,
+                in_reply_to,
+                references,
+                include_bcc_header=True,
+            )
+        else:
+            msg = self.incoming_client.compose_message(
+                recipients,
+                subject,
+                body,
+                cc,
+                bcc,
+                html,
+                attachments,
+                in_reply_to,
+                references,
+                include_bcc_header=True,
+            )
 
         flags_str = r"(\Draft \Seen)" if flags is None else _validate_flags(flags)
 
@@ -1980,41 +3082,55 @@ class ClassicEmailHandler(EmailHandler):
         if uid is None:
             raise RuntimeError(f"Failed to save email to mailbox '{mailbox}'")
 
+        _page_cache.clear()
         message_id = msg["Message-Id"] or "saved"
         return f"{message_id}|uid:{uid}"
 
     async def delete_emails(self, email_ids: list[str], mailbox: str = "INBOX") -> tuple[list[str], list[str]]:
         """Delete emails by their UIDs. Returns (deleted_ids, failed_ids)."""
         settings = get_settings()
-        return await self.incoming_client.delete_emails(
+        deleted_ids, failed_ids = await self.incoming_client.delete_emails(
             email_ids,
             mailbox,
             allowed_senders=settings.allowed_senders,
             report_blocked_mutations=settings.report_blocked_mutations,
         )
+        incoming = self.email_settings.incoming
+        _body_cache.invalidate(incoming.host, incoming.user_name, mailbox, deleted_ids)
+        _page_cache.clear()
+        return deleted_ids, failed_ids
 
     async def mark_emails_as_read(self, email_ids: list[str], mailbox: str = "INBOX") -> tuple[list[str], list[str]]:
         """Mark emails as read by their UIDs. Returns (marked_ids, failed_ids)."""
         settings = get_settings()
-        return await self.incoming_client.mark_emails_as_read(
+        marked_ids, failed_ids = await self.incoming_client.mark_emails_as_read(
             email_ids,
             mailbox,
             allowed_senders=settings.allowed_senders,
             report_blocked_mutations=settings.report_blocked_mutations,
         )
+        # \Seen changes what seen/unseen-filtered listings return.
+        _page_cache.clear()
+        return marked_ids, failed_ids
 
     async def move_emails(
         self, email_ids: list[str], source_mailbox: str, destination_mailbox: str
     ) -> tuple[list[str], list[str]]:
         """Move emails between mailboxes. Returns (moved_ids, failed_ids)."""
         settings = get_settings()
-        return await self.incoming_client.move_emails(
+        moved_ids, failed_ids = await self.incoming_client.move_emails(
             email_ids,
             source_mailbox,
             destination_mailbox,
             allowed_senders=settings.allowed_senders,
             report_blocked_mutations=settings.report_blocked_mutations,
         )
+        # A moved message gets a new UID in the destination, so its cached
+        # source-mailbox entries are stale.
+        incoming = self.email_settings.incoming
+        _body_cache.invalidate(incoming.host, incoming.user_name, source_mailbox, moved_ids)
+        _page_cache.clear()
+        return moved_ids, failed_ids
 
     async def _find_archive_folder(self) -> str | None:
         """Locate the Archive folder via the RFC 6154 ``\\Archive`` flag, then common names."""
@@ -2032,20 +3148,22 @@ class ClassicEmailHandler(EmailHandler):
 
     async def archive_emails(self, email_ids: list[str], mailbox: str = "INBOX") -> tuple[list[str], list[str], str]:
         """Move emails to the auto-detected Archive folder. Returns (moved_ids, failed_ids, archive_folder)."""
-        archive_folder = await self._find_archive_folder()
-        if archive_folder is None:
-            raise ValueError(
-                "No Archive folder found (looked for the RFC 6154 \\Archive flag and common names: "
-                f"{', '.join(_ARCHIVE_FOLDER_CANDIDATES)}). Use move_emails with an explicit folder instead."
+        # Folder discovery and the move share one IMAP connection.
+        async with self.incoming_client.reuse_connection():
+            archive_folder = await self._find_archive_folder()
+            if archive_folder is None:
+                raise ValueError(
+                    "No Archive folder found (looked for the RFC 6154 \\Archive flag and common names: "
+                    f"{', '.join(_ARCHIVE_FOLDER_CANDIDATES)}). Use move_emails with an explicit folder instead."
+                )
+            settings = get_settings()
+            moved_ids, failed_ids = await self.incoming_client.move_emails(
+                email_ids,
+                mailbox,
+                archive_folder,
+                allowed_senders=settings.allowed_senders,
+                report_blocked_mutations=settings.report_blocked_mutations,
             )
-        settings = get_settings()
-        moved_ids, failed_ids = await self.incoming_client.move_emails(
-            email_ids,
-            mailbox,
-            archive_folder,
-            allowed_senders=settings.allowed_senders,
-            report_blocked_mutations=settings.report_blocked_mutations,
-        )
         return moved_ids, failed_ids, archive_folder
 
     async def list_mailboxes(self, pattern: str = "*", reference: str = "") -> list[MailboxInfo]:
@@ -27,6 +27,25 @@ class EmailMetadata(BaseModel):
             attachments=email["attachments"],
         )
 
+    @classmethod
+    def from_email_unchecked(cls, email: dict[str, Any]):
+        """Build from a trusted internal email dict without field validation.
+
+        ``model_construct`` skips Pydantic validation, which is per-field
+        per-message overhead on large pages. Only use for dicts produced by
+        our own ``EmailClient`` parsing; external input must go through
+        ``from_email``.
+        """
+        return cls.model_construct(
+            email_id=email["email_id"],
+            message_id=email.get("message_id"),
+            subject=email["subject"],
+            sender=email["from"],
+            recipients=email.get("to", []),
+            date=email["date"],
+            attachments=email["attachments"],
+        )
+
 
 class EmailMetadataPageResponse(BaseModel):
     """Paged email metadata response"""
@@ -17,7 +17,7 @@ os.environ["MCP_EMAIL_SERVER_LOG_LEVEL"] = "DEBUG"
 os.environ["MCP_EMAIL_SERVER_CREDENTIAL_STORAGE"] = "plaintext"
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import keyring
 import pytest
@@ -27,11 +27,19 @@ from keyring.errors import PasswordDeleteError
 
 from mcp_email_server import keyring_store
 from mcp_email_server.config import EmailServer, EmailSettings, ProviderSettings, delete_settings
+from mcp_email_server.emails import classic
 
 
 @pytest.fixture(autouse=True)
 def patch_env(monkeypatch: pytest.MonkeyPatch, tmp_path: pytest.TempPathFactory):
     delete_settings()
+    classic._sent_folder_cache.clear()
+    classic._smtp_pool.clear()
+    classic._append_imap_pool.clear()
+    classic._body_cache.clear()
+    classic._bodystructure_cache.clear()
+    classic._page_cache.clear()
+    classic._fetch_format_cache.clear()
     yield
 
 
@@ -47,6 +55,30 @@ def email_server():
     )
 
 
+@pytest.fixture
+def incoming_server():
+    """Fixture for a test IMAP-side EmailServer."""
+    return EmailServer(
+        user_name="test_user",
+        password="test_password",
+        host="imap.example.com",
+        port=993,
+        use_ssl=True,
+    )
+
+
+@pytest.fixture
+def outgoing_server():
+    """Fixture for a test SMTP-side EmailServer."""
+    return EmailServer(
+        user_name="test_user",
+        password="test_password",
+        host="smtp.example.com",
+        port=465,
+        use_ssl=True,
+    )
+
+
 @pytest.fixture
 def email_settings():
     """Fixture for test EmailSettings."""
@@ -102,10 +134,23 @@ def mock_imap(completed_awaitable):
     mock_imap.select = AsyncMock(return_value=("OK", []))
     mock_imap.search = AsyncMock(return_value=(None, [b"1 2 3"]))
     mock_imap.fetch = AsyncMock(return_value=(None, [b"HEADER", bytearray(b"EMAIL CONTENT")]))
+    mock_imap.has_capability = MagicMock(return_value=False)
     mock_imap.logout = AsyncMock()
     return mock_imap
 
 
+@pytest.fixture
+def patched_aioimaplib():
+    """Patch the aioimaplib module used by classic, yielding the mock module.
+
+    Tests wire their connection double via
+    ``patched_aioimaplib.IMAP4_SSL.return_value = ...`` (or ``IMAP4`` for
+    plain connections).
+    """
+    with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
+        yield mock_aioimaplib
+
+
 @pytest.fixture
 def mock_smtp():
     """Fixture for a mocked SMTP client."""
@@ -1,10 +1,13 @@
+import asyncio
 from datetime import UTC, datetime
 from email.message import EmailMessage
+from email.mime.text import MIMEText
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from mcp_email_server.config import EmailServer, EmailSettings
+from mcp_email_server.emails import classic
 from mcp_email_server.emails.classic import ClassicEmailHandler, EmailClient
 from mcp_email_server.emails.models import (
     AttachmentDownloadResponse,
@@ -193,12 +196,15 @@ class TestClassicEmailHandler:
     @pytest.mark.asyncio
     async def test_send_email(self, classic_handler):
         """Test send_email method."""
-        # Mock the outgoing_client.send_email method
-        mock_send = AsyncMock()
-
-        # Apply the mock
-        with patch.object(classic_handler.outgoing_client, "send_email", mock_send):
-            # Call the method
+        mock_build = AsyncMock(return_value=MIMEText("Test Body"))
+        mock_smtp_send = AsyncMock()
+        mock_append = AsyncMock(return_value=True)
+
+        with (
+            patch.object(classic_handler.outgoing_client, "build_message", mock_build),
+            patch.object(classic_handler.outgoing_client, "_smtp_send", mock_smtp_send),
+            patch.object(classic_handler.outgoing_client, "append_to_sent", mock_append),
+        ):
             await classic_handler.send_email(
                 recipients=["recipient@example.com"],
                 subject="Test Subject",
@@ -207,19 +213,26 @@ class TestClassicEmailHandler:
                 bcc=["bcc@example.com"],
             )
 
-            # Verify the client method was called correctly
-            mock_send.assert_called_once_with(
-                ["recipient@example.com"],
-                "Test Subject",
-                "Test Body",
-                ["cc@example.com"],
-                ["bcc@example.com"],
-                False,
-                None,
-                None,
-                None,
-                None,
-            )
+        # Composition gets the full argument set; delivery gets the combined
+        # envelope recipient list.
+        mock_build.assert_called_once_with(
+            ["recipient@example.com"],
+            "Test Subject",
+            "Test Body",
+            ["cc@example.com"],
+            ["bcc@example.com"],
+            False,
+            None,
+            None,
+            None,
+            None,
+        )
+        mock_smtp_send.assert_called_once()
+        assert mock_smtp_send.call_args.args[1] == [
+            "recipient@example.com",
+            "cc@example.com",
+            "bcc@example.com",
+        ]
 
     @pytest.mark.asyncio
     async def test_send_email_with_attachments(self, classic_handler, tmp_path):
@@ -228,12 +241,15 @@ class TestClassicEmailHandler:
         test_file = tmp_path / "test_attachment.txt"
         test_file.write_text("This is a test attachment")
 
-        # Mock the outgoing_client.send_email method
-        mock_send = AsyncMock()
+        mock_build = AsyncMock(return_value=MIMEText("Test Body with attachment"))
+        mock_smtp_send = AsyncMock()
+        mock_append = AsyncMock(return_value=True)
 
-        # Apply the mock
-        with patch.object(classic_handler.outgoing_client, "send_email", mock_send):
-            # Call the method with attachments
+        with (
+            patch.object(classic_handler.outgoing_client, "build_message", mock_build),
+            patch.object(classic_handler.outgoing_client, "_smtp_send", mock_smtp_send),
+            patch.object(classic_handler.outgoing_client, "append_to_sent", mock_append),
+        ):
             await classic_handler.send_email(
                 recipients=["recipient@example.com"],
                 subject="Test Subject",
@@ -241,19 +257,20 @@ class TestClassicEmailHandler:
                 attachments=[str(test_file)],
             )
 
-            # Verify the client method was called correctly with attachments
-            mock_send.assert_called_once_with(
-                ["recipient@example.com"],
-                "Test Subject",
-                "Test Body with attachment",
-                None,
-                None,
-                False,
-                [str(test_file)],
-                None,
-                None,
-                None,
-            )
+        # Verify composition was called correctly with attachments
+        mock_build.assert_called_once_with(
+            ["recipient@example.com"],
+            "Test Subject",
+            "Test Body with attachment",
+            None,
+            None,
+            False,
+            [str(test_file)],
+            None,
+            None,
+            None,
+        )
+        mock_smtp_send.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_read_only_account_rejects_send_email(self):
@@ -496,10 +513,10 @@ class TestClassicEmailHandler:
             "attachments": [],
         }
 
-        # Mock the get_email_body_by_id method to return our test data
-        mock_get_body = AsyncMock(return_value=email_data)
+        # Mock the batched body fetch to return our test data
+        mock_get_bodies = AsyncMock(return_value={"123": email_data})
 
-        with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get_body):
+        with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get_bodies):
             result = await classic_handler.get_emails_content(
                 email_ids=["123"],
                 mailbox="INBOX",
@@ -516,8 +533,8 @@ class TestClassicEmailHandler:
             assert result.emails[0].body == "Test email body"
 
             # Verify the client method was called correctly
-            mock_get_body.assert_called_once_with(
-                "123", "INBOX", False, allowed_senders=[], body_offset=0, max_body_length=20000
+            mock_get_bodies.assert_called_once_with(
+                ["123"], "INBOX", False, allowed_senders=[], body_offset=0, max_body_length=20000
             )
 
     @pytest.mark.asyncio
@@ -535,9 +552,9 @@ class TestClassicEmailHandler:
             "attachments": [],
         }
 
-        mock_get_body = AsyncMock(return_value=email_data)
+        mock_get_bodies = AsyncMock(return_value={"123": email_data})
 
-        with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get_body):
+        with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get_bodies):
             result = await classic_handler.get_emails_content(
                 email_ids=["123"],
                 mailbox="INBOX",
@@ -545,8 +562,8 @@ class TestClassicEmailHandler:
             )
 
             assert len(result.emails) == 1
-            mock_get_body.assert_called_once_with(
-                "123", "INBOX", True, allowed_senders=[], body_offset=0, max_body_length=20000
+            mock_get_bodies.assert_called_once_with(
+                ["123"], "INBOX", True, allowed_senders=[], body_offset=0, max_body_length=20000
             )
 
     @pytest.mark.asyncio
@@ -564,13 +581,13 @@ class TestClassicEmailHandler:
             "attachments": [],
         }
 
-        mock_get_body = AsyncMock(return_value=email_data)
+        mock_get_bodies = AsyncMock(return_value={"456": email_data})
 
-        with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get_body):
+        with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get_bodies):
             await classic_handler.get_emails_content(email_ids=["456"])
 
-            mock_get_body.assert_called_once_with(
-                "456", "INBOX", False, allowed_senders=[], body_offset=0, max_body_length=20000
+            mock_get_bodies.assert_called_once_with(
+                ["456"], "INBOX", False, allowed_senders=[], body_offset=0, max_body_length=20000
             )
 
     @pytest.mark.asyncio
@@ -616,12 +633,12 @@ class TestClassicEmailHandler:
             "body": "x",
             "attachments": [],
         }
-        mock_get = AsyncMock(return_value=email_data)
+        mock_get = AsyncMock(return_value={"1": email_data})
         with patch(
             "mcp_email_server.emails.classic.get_settings",
             return_value=MagicMock(allowed_senders=["*@example.com"]),
         ):
-            with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
                 await classic_handler.get_emails_content(["1"])
         assert mock_get.call_args.kwargs.get("allowed_senders") == ["*@example.com"]
 
@@ -638,10 +655,10 @@ class TestClassicEmailHandler:
             "body": "x",
             "attachments": [],
         }
-        mock_get = AsyncMock(return_value=alice)
+        mock_get = AsyncMock(return_value={"1": alice})
         mock_mark = AsyncMock()
         with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
-            with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
                 with patch.object(classic_handler.incoming_client, "mark_emails_as_read", mock_mark):
                     result = await classic_handler.get_emails_content(["1"], mark_as_read=True)
         assert result.retrieved_count == 1
@@ -1010,10 +1027,10 @@ Subject: No Date Email
 class TestGetEmailsContentEdgeCases:
     @pytest.mark.asyncio
     async def test_none_email_data_goes_to_failed_ids(self, classic_handler):
-        """A fetch that returns None is reported as a genuine failure."""
-        mock_get = AsyncMock(return_value=None)
+        """A UID absent from the batched fetch result is reported as a genuine failure."""
+        mock_get = AsyncMock(return_value={})
         with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
-            with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
                 result = await classic_handler.get_emails_content(["1"])
         assert result.emails == []
         assert result.failed_ids == ["1"]
@@ -1024,7 +1041,7 @@ class TestGetEmailsContentEdgeCases:
         """An exception during fetch is caught and reported as a failure, not raised."""
         mock_get = AsyncMock(side_effect=Exception("boom"))
         with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
-            with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
                 result = await classic_handler.get_emails_content(["1"])
         assert result.failed_ids == ["1"]
         assert result.retrieved_count == 0
@@ -1043,9 +1060,206 @@ class TestGetEmailsContentEdgeCases:
             "body": "x",
             "attachments": [],
         }
-        mock_get = AsyncMock(return_value=email_data)
+        mock_get = AsyncMock(return_value={"1": email_data})
         with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
-            with patch.object(classic_handler.incoming_client, "get_email_body_by_id", mock_get):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
                 result = await classic_handler.get_emails_content(["1"], mark_as_read=True)
         assert result.retrieved_count == 1
-        assert mock_get.call_args.args == ("1", "INBOX", True)
+        assert mock_get.call_args.args == (["1"], "INBOX", True)
+
+
+class TestHandlerAclose:
+    """Tests for releasing pooled connections via aclose / async context manager."""
+
+    @pytest.mark.asyncio
+    async def test_aclose_quits_pooled_smtp(self, classic_handler):
+        mock_smtp = AsyncMock()
+        classic._smtp_pool[classic_handler.outgoing_client._smtp_pool_key] = mock_smtp
+
+        await classic_handler.aclose()
+
+        assert not classic._smtp_pool
+        mock_smtp.quit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_logs_out_pinned_imap(self, classic_handler):
+        mock_imap = AsyncMock()
+        classic_handler.incoming_client._pinned_imap = mock_imap
+        classic_handler.incoming_client._reuse_active = True
+
+        await classic_handler.aclose()
+
+        assert classic_handler.incoming_client._pinned_imap is None
+        assert classic_handler.incoming_client._reuse_active is False
+        mock_imap.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_on_exit(self, email_settings):
+        mock_smtp = AsyncMock()
+        async with ClassicEmailHandler(email_settings) as handler:
+            classic._smtp_pool[handler.outgoing_client._smtp_pool_key] = mock_smtp
+
+        assert not classic._smtp_pool
+        mock_smtp.quit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_is_idempotent(self, classic_handler):
+        await classic_handler.aclose()
+        await classic_handler.aclose()
+
+
+class TestBodyCache:
+    """Repeat reads are served from the in-process body cache."""
+
+    @staticmethod
+    def _email_data(email_id: str, sender: str = "alice@example.com") -> dict:
+        return {
+            "email_id": email_id,
+            "message_id": None,
+            "subject": "Cached",
+            "from": sender,
+            "to": [],
+            "date": datetime.now(UTC),
+            "body": "body text",
+            "attachments": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_second_read_skips_imap_fetch(self, classic_handler):
+        mock_get = AsyncMock(return_value={"1": self._email_data("1")})
+        with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
+                first = await classic_handler.get_emails_content(["1"])
+                second = await classic_handler.get_emails_content(["1"])
+
+        mock_get.assert_called_once()
+        assert first.emails[0].body == second.emails[0].body == "body text"
+
+    @pytest.mark.asyncio
+    async def test_only_missing_uids_are_fetched(self, classic_handler):
+        """A partially cached request fetches just the cache misses."""
+        mock_get = AsyncMock(
+            side_effect=[{"1": self._email_data("1")}, {"2": self._email_data("2")}],
+        )
+        with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
+                await classic_handler.get_emails_content(["1"])
+                result = await classic_handler.get_emails_content(["1", "2"])
+
+        assert mock_get.call_args.args[0] == ["2"]
+        assert [e.email_id for e in result.emails] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_mark_as_read_bypasses_cache(self, classic_handler):
+        """mark_as_read must reach the server even for cached UIDs (the \\Seen STORE is a side effect)."""
+        mock_get = AsyncMock(return_value={"1": self._email_data("1")})
+        with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
+                await classic_handler.get_emails_content(["1"])
+                await classic_handler.get_emails_content(["1"], mark_as_read=True)
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.args == (["1"], "INBOX", True)
+
+    @pytest.mark.asyncio
+    async def test_cached_hit_rechecks_allowlist(self, classic_handler):
+        """Tightening the allowlist blocks previously cached senders immediately."""
+        mock_get = AsyncMock(return_value={"1": self._email_data("1", sender="spammer@example.com")})
+        with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
+            with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
+                await classic_handler.get_emails_content(["1"])
+            # Now only alice is allowed; the cached entry must not be served.
+            mock_get.return_value = {}
+            with patch(
+                "mcp_email_server.emails.classic.get_settings",
+                return_value=MagicMock(allowed_senders=["alice@example.com"]),
+            ):
+                result = await classic_handler.get_emails_content(["1"])
+
+        assert mock_get.call_count == 2
+        assert result.failed_ids == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_cached_body(self, classic_handler):
+        mock_get = AsyncMock(return_value={"1": self._email_data("1")})
+        mock_delete = AsyncMock(return_value=(["1"], []))
+        settings = MagicMock(allowed_senders=[], report_blocked_mutations=False)
+        with patch("mcp_email_server.emails.classic.get_settings", return_value=settings):
+            with patch.object(classic_handler.incoming_client, "get_email_bodies_by_ids", mock_get):
+                with patch.object(classic_handler.incoming_client, "delete_emails", mock_delete):
+                    await classic_handler.get_emails_content(["1"])
+                    await classic_handler.delete_emails(["1"])
+                    await classic_handler.get_emails_content(["1"])
+
+        assert mock_get.call_count == 2
+
+    def test_cache_evicts_past_byte_bound(self):
+        cache = classic._BodyCache(max_entries=10, max_bytes=100)
+        for i in range(3):
+            cache.put(("h", "u", "INBOX", str(i), 0, 100), {"body": "x" * 40})
+
+        assert cache.get(("h", "u", "INBOX", "0", 0, 100)) is None
+        assert cache.get(("h", "u", "INBOX", "2", 0, 100)) is not None
+
+
+class TestMetadataPagePrefetch:
+    """get_emails_metadata prefetches the next page and serves it from cache."""
+
+    @staticmethod
+    def _page(total: int, uids: list[str]) -> tuple[int, list[dict]]:
+        now = datetime.now(UTC)
+        return total, [
+            {
+                "email_id": uid,
+                "message_id": None,
+                "subject": f"Mail {uid}",
+                "from": "alice@example.com",
+                "to": [],
+                "date": now,
+                "attachments": [],
+            }
+            for uid in uids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_next_page_served_from_prefetch_cache(self, classic_handler):
+        # total == 20 with page_size 10: page 2 is the last page, so the
+        # second request triggers no further prefetch and call counts stay exact.
+        mock_get = AsyncMock(side_effect=[self._page(20, ["20", "19"]), self._page(20, ["10", "9"])])
+        with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
+            with patch.object(classic_handler.incoming_client, "get_emails_metadata", mock_get):
+                first = await classic_handler.get_emails_metadata(page=1, page_size=10)
+                await asyncio.gather(*list(classic._prefetch_tasks))
+                second = await classic_handler.get_emails_metadata(page=2, page_size=10)
+
+        assert mock_get.call_count == 2
+        assert [c.args[0] for c in mock_get.call_args_list] == [1, 2]
+        assert [e.email_id for e in first.emails] == ["20", "19"]
+        assert [e.email_id for e in second.emails] == ["10", "9"]
+        assert second.page == 2
+
+    @pytest.mark.asyncio
+    async def test_no_prefetch_on_last_page_or_asc_order(self, classic_handler):
+        mock_get = AsyncMock(return_value=self._page(10, ["1"]))
+        with patch("mcp_email_server.emails.classic.get_settings", return_value=MagicMock(allowed_senders=[])):
+            with patch.object(classic_handler.incoming_client, "get_emails_metadata", mock_get):
+                await classic_handler.get_emails_metadata(page=1, page_size=10)
+                await classic_handler.get_emails_metadata(page=1, page_size=10, order="asc")
+
+        assert not classic._prefetch_tasks
+        assert not classic._page_cache
+
+    @pytest.mark.asyncio
+    async def test_mutation_clears_page_cache(self, classic_handler):
+        mock_get = AsyncMock(side_effect=[self._page(20, ["20"]), self._page(20, ["10"])])
+        settings = MagicMock(allowed_senders=[], report_blocked_mutations=False)
+        with patch("mcp_email_server.emails.classic.get_settings", return_value=settings):
+            with patch.object(classic_handler.incoming_client, "get_emails_metadata", mock_get):
+                await classic_handler.get_emails_metadata(page=1, page_size=10)
+                await asyncio.gather(*list(classic._prefetch_tasks))
+                assert classic._page_cache
+
+                with patch.object(classic_handler.incoming_client, "delete_emails", AsyncMock(return_value=([], []))):
+                    await classic_handler.delete_emails(["20"])
+
+        assert not classic._page_cache
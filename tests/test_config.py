@@ -352,7 +352,7 @@ def test_store_settings_defaults_to_cached_instance(tmp_path, monkeypatch):
 
     cfg = tmp_path / "config.toml"
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         config_module.get_settings().add_email(
             EmailSettings(
@@ -365,7 +365,7 @@ def test_store_settings_defaults_to_cached_instance(tmp_path, monkeypatch):
         store_settings()  # no argument
         assert "no_arg_store" in cfg.read_text()
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_env_account_replaces_second_of_multiple_toml_accounts(tmp_path, monkeypatch):
@@ -416,7 +416,7 @@ def test_env_account_replaces_second_of_multiple_toml_accounts(tmp_path, monkeyp
     monkeypatch.setenv("MCP_EMAIL_SERVER_PASSWORD", "env_pw")
     monkeypatch.setenv("MCP_EMAIL_SERVER_IMAP_HOST", "imap.env.com")
 
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         settings = config_module.get_settings(reload=True)
         assert len(settings.emails) == 2
@@ -425,7 +425,7 @@ def test_env_account_replaces_second_of_multiple_toml_accounts(tmp_path, monkeyp
         first = next(e for e in settings.emails if e.account_name == "first")
         assert first.incoming.password.get_secret_value() == "first_pw"
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 @pytest.mark.parametrize(
@@ -458,11 +458,11 @@ def test_allowed_recipients_defaults_to_empty(tmp_path, monkeypatch):
     blank = tmp_path / "config.toml"
     blank.write_text("")
     monkeypatch.setitem(Settings.model_config, "toml_file", blank)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_recipients == []
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_recipients_toml_normalised(tmp_path, monkeypatch):
@@ -475,11 +475,11 @@ def test_allowed_recipients_toml_normalised(tmp_path, monkeypatch):
     cfg = tmp_path / "config.toml"
     cfg.write_bytes(tomli_w.dumps(toml_data).encode())
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_recipients == ["alice@example.com", "bob@example.com"]
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_senders_defaults_to_empty(tmp_path, monkeypatch):
@@ -489,11 +489,11 @@ def test_allowed_senders_defaults_to_empty(tmp_path, monkeypatch):
     blank = tmp_path / "config.toml"
     blank.write_text("")
     monkeypatch.setitem(Settings.model_config, "toml_file", blank)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_senders == []
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_senders_toml_normalised_preserves_globs(tmp_path, monkeypatch):
@@ -506,12 +506,12 @@ def test_allowed_senders_toml_normalised_preserves_globs(tmp_path, monkeypatch):
     cfg = tmp_path / "config.toml"
     cfg.write_bytes(tomli_w.dumps(toml_data).encode())
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         # lowercased + de-duplicated, but glob characters preserved (NOT run through parseaddr)
         assert config_module.get_settings(reload=True).allowed_senders == ["*@example.com", "bob@example.com"]
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_report_blocked_mutations_defaults_to_false(tmp_path, monkeypatch):
@@ -524,11 +524,11 @@ def test_report_blocked_mutations_defaults_to_false(tmp_path, monkeypatch):
     cfg.write_bytes(tomli_w.dumps({}).encode())
     monkeypatch.delenv("MCP_EMAIL_SERVER_REPORT_BLOCKED_MUTATIONS", raising=False)
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).report_blocked_mutations is False
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_report_blocked_mutations_from_toml(tmp_path, monkeypatch):
@@ -541,11 +541,11 @@ def test_report_blocked_mutations_from_toml(tmp_path, monkeypatch):
     cfg.write_bytes(tomli_w.dumps({"report_blocked_mutations": True}).encode())
     monkeypatch.delenv("MCP_EMAIL_SERVER_REPORT_BLOCKED_MUTATIONS", raising=False)
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).report_blocked_mutations is True
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file permissions only")
@@ -563,7 +563,7 @@ def test_store_writes_owner_only_permissions(tmp_path, monkeypatch, request, sto
 
     cfg = tmp_path / "config.toml"
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         settings = config_module.get_settings(reload=True)
         if storage_mode == "keyring":
@@ -583,7 +583,7 @@ def test_store_writes_owner_only_permissions(tmp_path, monkeypatch, request, sto
         if storage_mode == "keyring":
             assert "__KEYRING__" in cfg.read_text()
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file permissions only")
@@ -596,14 +596,14 @@ def test_store_tightens_preexisting_permissions(tmp_path, monkeypatch):
     cfg.write_text("")
     cfg.chmod(0o644)
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         settings = config_module.get_settings(reload=True)
         settings.store()
         mode = stat.S_IMODE(cfg.stat().st_mode)
         assert mode == 0o600
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file permissions only")
@@ -623,7 +623,7 @@ def test_store_never_exposes_new_content_in_world_readable_file(tmp_path, monkey
     cfg.chmod(0o644)  # ...in a world-readable file
 
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
 
     observations = {}
     real_replace = os.replace
@@ -643,7 +643,7 @@ def test_store_never_exposes_new_content_in_world_readable_file(tmp_path, monkey
         settings.report_blocked_mutations = True  # make the new content differ from the old
         settings.store()
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
     # The temp file the new content was written to was 0600 from the start...
     assert observations["src_mode"] == 0o600
@@ -668,7 +668,7 @@ def test_store_failed_write_leaves_original_intact(tmp_path, monkeypatch):
     cfg.write_text("report_blocked_mutations = false\n")
     cfg.chmod(0o600)
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
 
     def boom(src, dst):
         raise OSError("simulated replace failure")
@@ -679,7 +679,7 @@ def test_store_failed_write_leaves_original_intact(tmp_path, monkeypatch):
         with pytest.raises(OSError, match="simulated replace failure"):
             settings.store()
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
     # Original file untouched; no stray temp files left in the directory.
     assert cfg.read_text() == "report_blocked_mutations = false\n"
@@ -695,14 +695,14 @@ def test_store_non_posix_falls_back_to_plain_write(tmp_path, monkeypatch):
 
     cfg = tmp_path / "config.toml"
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         settings = config_module.get_settings(reload=True)
         monkeypatch.setattr(config_module.os, "name", "nt")
         settings.store()
         assert cfg.read_text() == settings._to_toml()
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_report_blocked_mutations_env_overrides_toml(tmp_path, monkeypatch):
@@ -715,8 +715,8 @@ def test_report_blocked_mutations_env_overrides_toml(tmp_path, monkeypatch):
     cfg.write_bytes(tomli_w.dumps({"report_blocked_mutations": False}).encode())
     monkeypatch.setenv("MCP_EMAIL_SERVER_REPORT_BLOCKED_MUTATIONS", "true")
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).report_blocked_mutations is True
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
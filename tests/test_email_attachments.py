@@ -11,25 +11,14 @@ from email.utils import make_msgid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from conftest import _CompletedAwaitable
 
-from mcp_email_server.config import EmailServer
 from mcp_email_server.emails.classic import EmailClient
 
 
 @pytest.fixture
-def email_server():
-    return EmailServer(
-        user_name="test_user",
-        password="test_password",
-        host="smtp.example.com",
-        port=465,
-        use_ssl=True,
-    )
-
-
-@pytest.fixture
-def email_client(email_server):
-    return EmailClient(email_server, sender="Test User <test@example.com>")
+def email_client(outgoing_server):
+    return EmailClient(outgoing_server, sender="Test User <test@example.com>")
 
 
 class TestEmailAttachments:
@@ -45,7 +34,7 @@ class TestEmailAttachments:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             await email_client.send_email(
                 recipients=["recipient@example.com"],
                 subject="Test with attachment",
@@ -63,7 +52,8 @@ class TestEmailAttachments:
 
             # Verify message is multipart (required for attachments)
             assert message.is_multipart()
-            assert "document.pdf" in str(message)
+            attached_names = {part.get_filename() for part in message.walk() if part.get_filename()}
+            assert attached_names == {"document.pdf"}
 
     @pytest.mark.asyncio
     async def test_send_email_with_multiple_attachments(self, email_client, tmp_path):
@@ -83,7 +73,7 @@ class TestEmailAttachments:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             await email_client.send_email(
                 recipients=["recipient@example.com"],
                 subject="Test with multiple attachments",
@@ -95,10 +85,8 @@ class TestEmailAttachments:
             message = mock_smtp.send_message.call_args[0][0]
 
             assert message.is_multipart()
-            message_str = str(message)
-            assert "document1.pdf" in message_str
-            assert "image.png" in message_str
-            assert "data.csv" in message_str
+            attached_names = {part.get_filename() for part in message.walk() if part.get_filename()}
+            assert attached_names == {"document1.pdf", "image.png", "data.csv"}
 
     @pytest.mark.asyncio
     async def test_send_email_without_attachments(self, email_client):
@@ -107,7 +95,7 @@ class TestEmailAttachments:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             await email_client.send_email(
                 recipients=["recipient@example.com"],
                 subject="Test without attachment",
@@ -127,7 +115,7 @@ class TestEmailAttachments:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             with pytest.raises(FileNotFoundError, match="Attachment file not found"):
                 await email_client.send_email(
                     recipients=["recipient@example.com"],
@@ -147,7 +135,7 @@ class TestEmailAttachments:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             with pytest.raises(ValueError, match="Attachment path is not a file"):
                 await email_client.send_email(
                     recipients=["recipient@example.com"],
@@ -166,7 +154,7 @@ class TestEmailAttachments:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             await email_client.send_email(
                 recipients=["recipient@example.com"],
                 subject="HTML email with attachment",
@@ -179,7 +167,8 @@ class TestEmailAttachments:
             message = mock_smtp.send_message.call_args[0][0]
 
             assert message.is_multipart()
-            assert "report.pdf" in str(message)
+            attached_names = {part.get_filename() for part in message.walk() if part.get_filename()}
+            assert attached_names == {"report.pdf"}
 
     @pytest.mark.asyncio
     async def test_mime_type_detection(self, email_client, tmp_path):
@@ -203,7 +192,7 @@ class TestEmailAttachments:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             await email_client.send_email(
                 recipients=["recipient@example.com"],
                 subject="Test MIME types",
@@ -215,66 +204,72 @@ class TestEmailAttachments:
             message = mock_smtp.send_message.call_args[0][0]
 
             # Verify all files are in the message
-            message_str = str(message)
-            for filename in files:
-                assert filename in message_str
+            attached_names = {part.get_filename() for part in message.walk() if part.get_filename()}
+            assert attached_names == set(files)
 
 
 class TestDownloadAttachmentMailboxParam:
     """Tests for download_attachment mailbox parameter."""
 
-    @pytest.mark.asyncio
-    async def test_download_attachment_default_mailbox(self, email_client, tmp_path):
-        """Test download_attachment uses INBOX by default."""
-        import asyncio
-
-        save_path = str(tmp_path / "attachment.pdf")
-
+    @staticmethod
+    def _mock_imap(select_response=("OK", [b"1"])):
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
-        mock_imap.select = AsyncMock(return_value=("OK", [b"1"]))
+        mock_imap.select = AsyncMock(return_value=select_response)
         mock_imap.logout = AsyncMock()
+        return mock_imap
 
-        # Mock _fetch_email_with_formats to return None (will raise ValueError)
-        with patch.object(email_client, "_fetch_email_with_formats", return_value=None):
-            with patch.object(email_client, "imap_class", return_value=mock_imap):
-                with pytest.raises(ValueError):
-                    await email_client.download_attachment(
-                        email_id="123",
-                        attachment_name="document.pdf",
-                        save_path=save_path,
-                    )
+    @pytest.mark.parametrize(
+        ("mailbox_kwargs", "expected_select"),
+        [
+            pytest.param({}, '"INBOX"', id="default-inbox"),
+            pytest.param({"mailbox": "All Mail"}, '"All Mail"', id="custom-mailbox"),
+            pytest.param({"mailbox": "[Gmail]/Sent Mail"}, '"[Gmail]/Sent Mail"', id="special-folder"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_download_attachment_selects_mailbox(self, email_client, tmp_path, mailbox_kwargs, expected_select):
+        """download_attachment selects the requested (or default) mailbox, quoted."""
 
-                # Verify select was called with quoted INBOX
-                mock_imap.select.assert_called_once_with('"INBOX"')
+        save_path = str(tmp_path / "attachment.pdf")
+        mock_imap = self._mock_imap()
+
+        # _fetch_email_with_formats returning None makes download raise ValueError
+        # after the SELECT we want to observe.
+        with (
+            patch.object(email_client, "_fetch_email_with_formats", return_value=None),
+            patch.object(email_client, "imap_class", return_value=mock_imap),
+            pytest.raises(ValueError),
+        ):
+            await email_client.download_attachment(
+                email_id="123",
+                attachment_name="document.pdf",
+                save_path=save_path,
+                **mailbox_kwargs,
+            )
+
+        mock_imap.select.assert_called_once_with(expected_select)
 
     @pytest.mark.asyncio
     async def test_download_attachment_raises_on_select_failure(self, email_client, tmp_path):
         """Test download stops when mailbox selection fails."""
-        import asyncio
 
         save_path = str(tmp_path / "attachment.pdf")
+        mock_imap = self._mock_imap(select_response=("NO", [b"[NONEXISTENT] Unknown Mailbox: Archive"]))
 
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
-        mock_imap.select = AsyncMock(return_value=("NO", [b"[NONEXISTENT] Unknown Mailbox: Archive"]))
-        mock_imap.logout = AsyncMock()
-
-        with patch.object(email_client, "_fetch_email_with_formats", return_value=None) as mock_fetch:
-            with patch.object(email_client, "imap_class", return_value=mock_imap):
-                with pytest.raises(RuntimeError) as exc_info:
-                    await email_client.download_attachment(
-                        email_id="123",
-                        attachment_name="document.pdf",
-                        save_path=save_path,
-                        mailbox="Archive",
-                    )
+        with (
+            patch.object(email_client, "_fetch_email_with_formats", return_value=None) as mock_fetch,
+            patch.object(email_client, "imap_class", return_value=mock_imap),
+            pytest.raises(RuntimeError) as exc_info,
+        ):
+            await email_client.download_attachment(
+                email_id="123",
+                attachment_name="document.pdf",
+                save_path=save_path,
+                mailbox="Archive",
+            )
 
         message = str(exc_info.value)
         assert "SELECT mailbox Archive failed" in message
@@ -283,62 +278,6 @@ class TestDownloadAttachmentMailboxParam:
         mock_fetch.assert_not_called()
         mock_imap.logout.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_download_attachment_custom_mailbox(self, email_client, tmp_path):
-        """Test download_attachment with custom mailbox parameter."""
-        import asyncio
-
-        save_path = str(tmp_path / "attachment.pdf")
-
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
-        mock_imap.select = AsyncMock(return_value=("OK", [b"1"]))
-        mock_imap.logout = AsyncMock()
-
-        with patch.object(email_client, "_fetch_email_with_formats", return_value=None):
-            with patch.object(email_client, "imap_class", return_value=mock_imap):
-                with pytest.raises(ValueError):
-                    await email_client.download_attachment(
-                        email_id="123",
-                        attachment_name="document.pdf",
-                        save_path=save_path,
-                        mailbox="All Mail",
-                    )
-
-                # Verify select was called with quoted custom mailbox
-                mock_imap.select.assert_called_once_with('"All Mail"')
-
-    @pytest.mark.asyncio
-    async def test_download_attachment_special_folder(self, email_client, tmp_path):
-        """Test download_attachment with special folder like [Gmail]/Sent Mail."""
-        import asyncio
-
-        save_path = str(tmp_path / "attachment.pdf")
-
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
-        mock_imap.select = AsyncMock(return_value=("OK", [b"1"]))
-        mock_imap.logout = AsyncMock()
-
-        with patch.object(email_client, "_fetch_email_with_formats", return_value=None):
-            with patch.object(email_client, "imap_class", return_value=mock_imap):
-                with pytest.raises(ValueError):
-                    await email_client.download_attachment(
-                        email_id="123",
-                        attachment_name="document.pdf",
-                        save_path=save_path,
-                        mailbox="[Gmail]/Sent Mail",
-                    )
-
-                # Verify select was called with quoted special folder
-                mock_imap.select.assert_called_once_with('"[Gmail]/Sent Mail"')
-
 
 def _build_apple_mail_inline_image(image_bytes: bytes = b"\x89PNG\r\n\x1a\n_fake_png_") -> bytes:
     """Build a multipart/mixed email mimicking Apple Mail (iOS) sending a photo.
@@ -542,11 +481,9 @@ class TestDownloadInlineAttachment:
 
     @staticmethod
     def _mock_imap():
-        import asyncio
 
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", [b"1"]))
@@ -675,11 +612,9 @@ class TestDownloadAttachmentSenderAllowlist:
 
     @staticmethod
     def _mock_imap():
-        import asyncio
 
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", [b"1"]))
@@ -778,3 +713,203 @@ class TestDownloadAttachmentSenderAllowlist:
             )
         assert result["attachment_name"] == "ausflug.png"
         mock_senders.assert_not_called()
+
+
+class TestBodystructureScopedDownload:
+    """``download_attachment`` fetches only the attachment part when BODYSTRUCTURE allows it."""
+
+    BODYSTRUCTURE_LINE = (
+        b'1 FETCH (UID 7 BODYSTRUCTURE (("text" "plain" ("charset" "utf-8") NIL NIL "7bit" 12 1 NIL NIL NIL NIL)'
+        b'("application" "pdf" ("name" "report.pdf") NIL NIL "base64" 20 NIL ("attachment" ("filename" "report.pdf"))'
+        b' NIL NIL) "mixed" ("boundary" "b1") NIL NIL NIL))'
+    )
+
+    @staticmethod
+    def _mock_imap():
+
+        mock_imap = AsyncMock()
+        mock_imap._client_task = _CompletedAwaitable()
+        mock_imap.wait_hello_from_server = AsyncMock()
+        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
+        mock_imap.select = AsyncMock(return_value=("OK", [b"1"]))
+        mock_imap.logout = AsyncMock()
+        return mock_imap
+
+    def test_find_attachment_section_and_encoding(self, email_client):
+        """The matching part's section path, encoding, and MIME type are located."""
+        from mcp_email_server.emails.classic import _parse_imap_nested_list
+
+        text = self.BODYSTRUCTURE_LINE.decode()
+        structure, _ = _parse_imap_nested_list(text, text.index("(", text.index("BODYSTRUCTURE")))
+
+        assert email_client._find_attachment_in_bodystructure(structure, "report.pdf") == (
+            "2",
+            "base64",
+            "application/pdf",
+        )
+        assert email_client._find_attachment_in_bodystructure(structure, "missing.pdf") is None
+
+    @pytest.mark.asyncio
+    async def test_scoped_download_skips_full_message_fetch(self, email_client, tmp_path):
+        """When BODYSTRUCTURE matches, only the attachment section is fetched."""
+        import base64
+
+        save_path = tmp_path / "report.pdf"
+        payload = base64.b64encode(b"%PDF-1.7 scoped body")
+
+        async def uid_side_effect(command, email_id, fetch_format):
+            if fetch_format == "BODYSTRUCTURE":
+                return "OK", [self.BODYSTRUCTURE_LINE, b")"]
+            assert fetch_format == "BODY.PEEK[2]"
+            return "OK", [b"1 FETCH (UID 7 BODY[2] {%d}" % len(payload), bytearray(payload), b")"]
+
+        mock_imap = self._mock_imap()
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+
+        with (
+            patch.object(email_client, "_fetch_email_with_formats", AsyncMock()) as mock_full_fetch,
+            patch.object(email_client, "imap_class", return_value=mock_imap),
+        ):
+            result = await email_client.download_attachment(
+                email_id="7",
+                attachment_name="report.pdf",
+                save_path=str(save_path),
+            )
+
+        mock_full_fetch.assert_not_called()
+        assert result["mime_type"] == "application/pdf"
+        assert result["size"] == len(b"%PDF-1.7 scoped body")
+        assert save_path.read_bytes() == b"%PDF-1.7 scoped body"
+
+    @pytest.mark.asyncio
+    async def test_repeat_download_reuses_cached_bodystructure(self, email_client, tmp_path):
+        """The second download from the same message skips the BODYSTRUCTURE fetch."""
+        import base64
+
+        payload = base64.b64encode(b"%PDF-1.7 scoped body")
+
+        async def uid_side_effect(command, email_id, fetch_format):
+            if fetch_format == "BODYSTRUCTURE":
+                return "OK", [self.BODYSTRUCTURE_LINE, b")"]
+            return "OK", [b"1 FETCH (UID 7 BODY[2] {%d}" % len(payload), bytearray(payload), b")"]
+
+        mock_imap = self._mock_imap()
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            for name in ("first.pdf", "second.pdf"):
+                await email_client.download_attachment(
+                    email_id="7",
+                    attachment_name="report.pdf",
+                    save_path=str(tmp_path / name),
+                )
+
+        fetch_formats = [c.args[2] for c in mock_imap.uid.call_args_list]
+        assert fetch_formats.count("BODYSTRUCTURE") == 1
+        assert fetch_formats.count("BODY.PEEK[2]") == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_bodystructure_falls_back_to_full_fetch(self, email_client, tmp_path):
+        """A server response the parser rejects falls back to the full-message path."""
+        raw_email = _build_apple_mail_inline_image(b"\x89PNG\r\n\x1a\nfallback_bytes")
+        save_path = tmp_path / "ausflug.png"
+
+        mock_imap = self._mock_imap()
+        mock_imap.uid = AsyncMock(return_value=("OK", [b"1 FETCH (UID 7 BODYSTRUCTURE {10}", b")"]))
+
+        async def _fake_fetch(_imap, _email_id):
+            return [b"1 FETCH (BODY[] {%d}" % len(raw_email), bytearray(raw_email), b")"]
+
+        with patch.object(email_client, "_fetch_email_with_formats", side_effect=_fake_fetch):
+            with patch.object(email_client, "imap_class", return_value=mock_imap):
+                result = await email_client.download_attachment(
+                    email_id="7",
+                    attachment_name="ausflug.png",
+                    save_path=str(save_path),
+                )
+
+        assert result["attachment_name"] == "ausflug.png"
+        assert save_path.read_bytes().startswith(b"\x89PNG")
+
+
+class TestStreamedAttachmentDecode:
+    """The scoped fast path decodes the payload straight to disk."""
+
+    def test_chunked_base64_decode_round_trips(self, tmp_path):
+        """Line-wrapped base64 spanning several decode chunks round-trips exactly."""
+        import base64
+        import os
+
+        from mcp_email_server.emails.classic import _decode_payload_to_file
+
+        original = os.urandom(3 * 64 * 1024 + 777)  # spans multiple decode chunks
+        encoded = base64.encodebytes(original)  # wrapped at 76 chars with newlines
+        save_file = tmp_path / "blob.bin"
+
+        size = _decode_payload_to_file(encoded, "base64", save_file)
+
+        assert size == len(original)
+        assert save_file.read_bytes() == original
+
+    @pytest.mark.asyncio
+    async def test_malformed_base64_falls_back_to_full_fetch(self, email_client, tmp_path):
+        """A scoped payload that fails to decode falls back to the full-message path."""
+        save_path = tmp_path / "report.pdf"
+
+        async def uid_side_effect(command, email_id, fetch_format):
+            if fetch_format == "BODYSTRUCTURE":
+                return "OK", [TestBodystructureScopedDownload.BODYSTRUCTURE_LINE, b")"]
+            return "OK", [b"1 FETCH (UID 7 BODY[2] {7}", bytearray(b"!not64!"), b")"]
+
+        mock_imap = TestBodystructureScopedDownload._mock_imap()
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+
+        full_msg = MIMEMultipart("mixed")
+        full_msg["Subject"] = "Report"
+        full_msg.attach(MIMEText("See attached.", "plain"))
+        pdf_part = MIMEApplication(b"%PDF-1.7 full body", _subtype="pdf")
+        pdf_part.add_header("Content-Disposition", "attachment", filename="report.pdf")
+        full_msg.attach(pdf_part)
+        full_raw_email = full_msg.as_bytes()
+
+        async def _fake_fetch(_imap, _email_id):
+            return [b"1 FETCH (BODY[] {%d}" % len(full_raw_email), bytearray(full_raw_email), b")"]
+
+        with (
+            patch.object(email_client, "_fetch_email_with_formats", side_effect=_fake_fetch),
+            patch.object(email_client, "imap_class", return_value=mock_imap),
+        ):
+            result = await email_client.download_attachment(
+                email_id="7",
+                attachment_name="report.pdf",
+                save_path=str(save_path),
+            )
+
+        assert result["size"] == len(b"%PDF-1.7 full body")
+        assert save_path.read_bytes() == b"%PDF-1.7 full body"
+
+
+class TestStreamedAttachmentEncoding:
+    """Attachment parts are stream-encoded but decode identically to the old path."""
+
+    def test_large_attachment_round_trips(self, email_client, tmp_path):
+        import os
+
+        payload = os.urandom(57 * 16384 + 1234)  # spans multiple encode chunks
+        test_file = tmp_path / "blob.bin"
+        test_file.write_bytes(payload)
+
+        part = email_client._create_attachment_part(test_file)
+
+        assert part.get_filename() == "blob.bin"
+        assert part["Content-Transfer-Encoding"] == "base64"
+        assert part.get_payload(decode=True) == payload
+
+    def test_empty_attachment_round_trips(self, email_client, tmp_path):
+        test_file = tmp_path / "empty.bin"
+        test_file.write_bytes(b"")
+
+        part = email_client._create_attachment_part(test_file)
+
+        assert part.get_filename() == "empty.bin"
+        assert part.get_payload(decode=True) == b""
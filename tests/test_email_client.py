@@ -6,8 +6,10 @@ from email.mime.text import MIMEText
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from conftest import _CompletedAwaitable
 
 from mcp_email_server.config import EmailServer
+from mcp_email_server.emails import classic
 from mcp_email_server.emails.classic import EmailClient, _create_smtp_ssl_context, _html_to_text, _imap_login
 
 
@@ -426,8 +428,7 @@ class TestEmailClient:
     async def test_get_emails_metadata(self, email_client):
         """Test getting emails metadata returns total and sorted, paginated results."""
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -493,8 +494,7 @@ class TestEmailClient:
     async def test_get_emails_metadata_encodes_unicode_mailbox(self, email_client):
         """Unicode mailbox names should be encoded before IMAP SELECT."""
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -518,8 +518,7 @@ class TestEmailClient:
         is sent.
         """
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -542,8 +541,7 @@ class TestEmailClient:
         charset=None for Exchange compatibility (see the companion test above).
         """
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -566,8 +564,7 @@ class TestEmailClient:
         because that would reintroduce the Exchange BADCHARSET failure.
         """
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -586,8 +583,7 @@ class TestEmailClient:
     async def test_get_emails_metadata_falls_back_to_uid_order_when_dates_missing(self, email_client):
         """Metadata listing should still return emails when INTERNALDATE parsing fails."""
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -638,8 +634,7 @@ class TestEmailClient:
     async def test_get_emails_metadata_raises_on_select_failure(self, email_client):
         """Test mailbox selection failures are surfaced before SEARCH."""
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("NO", [b"[NONEXISTENT] Unknown Mailbox: Archive"]))
@@ -661,8 +656,7 @@ class TestEmailClient:
     async def test_delete_emails_raises_on_select_failure(self, email_client):
         """Test delete stops when mailbox selection fails."""
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("NO", [b"[NONEXISTENT] Unknown Mailbox: Archive"]))
@@ -678,6 +672,57 @@ class TestEmailClient:
         mock_imap.expunge.assert_not_called()
         mock_imap.logout.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_delete_emails_batched_store_falls_back_per_uid(self, email_client):
+        """A failed batched STORE retries per UID so partial failures stay exact."""
+        mock_imap = AsyncMock()
+        mock_imap._client_task = _CompletedAwaitable()
+        mock_imap.wait_hello_from_server = AsyncMock()
+        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
+        mock_imap.select = AsyncMock(return_value=("OK", []))
+        mock_imap.expunge = AsyncMock(return_value=("OK", []))
+        mock_imap.has_capability = MagicMock(return_value=False)
+        mock_imap.logout = AsyncMock()
+
+        async def uid_side_effect(command, uid_set, *args):
+            if "," in uid_set:
+                return "BAD", [b"Could not parse command"]
+            if uid_set == "2":
+                return "NO", [b"No matching messages"]
+            return "OK", []
+
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            deleted, failed = await email_client.delete_emails(["1", "2", "3"])
+
+        assert deleted == ["1", "3"]
+        assert failed == ["2"]
+        store_targets = [c.args[1] for c in mock_imap.uid.call_args_list]
+        assert store_targets == ["1,2,3", "1", "2", "3"]
+        mock_imap.expunge.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_emails_uses_uid_expunge_with_uidplus(self, email_client):
+        """A UIDPLUS server gets a UID EXPUNGE scoped to the deleted set."""
+        mock_imap = AsyncMock()
+        mock_imap._client_task = _CompletedAwaitable()
+        mock_imap.wait_hello_from_server = AsyncMock()
+        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
+        mock_imap.select = AsyncMock(return_value=("OK", []))
+        mock_imap.has_capability = MagicMock(side_effect=lambda capability: capability == "UIDPLUS")
+        mock_imap.uid = AsyncMock(return_value=("OK", []))
+        mock_imap.expunge = AsyncMock()
+        mock_imap.logout = AsyncMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            deleted, failed = await email_client.delete_emails(["1", "2"])
+
+        assert deleted == ["1", "2"]
+        assert failed == []
+        assert mock_imap.uid.call_args_list[-1].args == ("expunge", "1,2")
+        mock_imap.expunge.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_send_email(self, email_client):
         """Test sending email."""
@@ -1207,8 +1252,7 @@ class TestGetEmailsMetadataSenderFilter:
     @pytest.mark.asyncio
     async def test_get_emails_metadata_filters_blocked_senders_honest_total(self, email_client):
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -1256,8 +1300,7 @@ class TestGetEmailsMetadataSenderFilter:
     @pytest.mark.asyncio
     async def test_get_emails_metadata_full_page_despite_blocked(self, email_client):
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -1308,8 +1351,7 @@ class TestGetEmailsMetadataSenderFilter:
     @pytest.mark.asyncio
     async def test_get_emails_metadata_no_allowlist_skips_sender_fetch(self, email_client):
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -1402,8 +1444,7 @@ class TestSenderFilterCoverage:
     async def test_get_emails_metadata_all_blocked_returns_empty(self, email_client):
         """When every match is filtered out, total is 0 and the date fetch is skipped."""
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.select = AsyncMock(return_value=("OK", []))
@@ -1450,3 +1491,450 @@ class TestSenderFilterCoverage:
         with patch.object(email_client, "_parse_headers", return_value=None):
             result = await email_client._batch_fetch_senders(mock_imap, [b"300"])
         assert result == {}
+
+
+class TestReuseConnection:
+    """Tests for the opt-in IMAP connection reuse scope."""
+
+    @staticmethod
+    def _mock_imap():
+        mock_imap = AsyncMock()
+        mock_imap._client_task = _CompletedAwaitable()
+        mock_imap.wait_hello_from_server = AsyncMock()
+        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
+        mock_imap.select = AsyncMock(return_value=("OK", []))
+        mock_imap.list = AsyncMock(return_value=("OK", [b'(\\HasNoChildren) "/" "INBOX"']))
+        mock_imap.logout = AsyncMock()
+        return mock_imap
+
+    @pytest.mark.asyncio
+    async def test_operations_in_scope_share_one_connection(self, email_client):
+        """Two operations inside a reuse scope log in and log out exactly once."""
+        mock_imap = self._mock_imap()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap) as mock_class:
+            async with email_client.reuse_connection():
+                await email_client.list_mailboxes()
+                mock_imap.logout.assert_not_called()
+                await email_client.list_mailboxes()
+
+        mock_class.assert_called_once()
+        mock_imap.login.assert_called_once()
+        mock_imap.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_nested_scopes_keep_outermost_ownership(self, email_client):
+        """A nested reuse scope must not log out the shared connection early."""
+        mock_imap = self._mock_imap()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap) as mock_class:
+            async with email_client.reuse_connection():
+                await email_client.list_mailboxes()
+                async with email_client.reuse_connection():
+                    await email_client.list_mailboxes()
+                mock_imap.logout.assert_not_called()
+
+        mock_class.assert_called_once()
+        mock_imap.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_pinned_connection_is_evicted(self, email_client):
+        """A pinned connection that raises is logged out; the next call reconnects."""
+        failing_imap = self._mock_imap()
+        fresh_imap = self._mock_imap()
+
+        with patch.object(email_client, "imap_class", side_effect=[failing_imap, fresh_imap]) as mock_class:
+            async with email_client.reuse_connection():
+                await email_client.list_mailboxes()
+                failing_imap.list = AsyncMock(side_effect=RuntimeError("connection dropped"))
+                with pytest.raises(RuntimeError, match="connection dropped"):
+                    await email_client.list_mailboxes()
+                failing_imap.logout.assert_called_once()
+
+                await email_client.list_mailboxes()
+
+        assert mock_class.call_count == 2
+        fresh_imap.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_value_error_keeps_pinned_connection(self, email_client):
+        """Application-level ValueErrors must not evict the pinned connection."""
+        mock_imap = self._mock_imap()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap) as mock_class:
+            async with email_client.reuse_connection():
+                await email_client.list_mailboxes()
+                with pytest.raises(ValueError, match="not found"):
+                    async with email_client._imap_session():
+                        raise ValueError("attachment not found")
+                mock_imap.logout.assert_not_called()
+                await email_client.list_mailboxes()
+
+        mock_class.assert_called_once()
+        mock_imap.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_same_mailbox_selected_once_in_scope(self, email_client):
+        """Repeat operations on the same mailbox inside a scope skip redundant SELECTs."""
+        mock_imap = self._mock_imap()
+        mock_imap.uid = AsyncMock(return_value=("OK", []))
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            async with email_client.reuse_connection():
+                await email_client.mark_emails_as_read(["1"])
+                await email_client.mark_emails_as_read(["2"])
+
+        mock_imap.select.assert_called_once_with('"INBOX"')
+
+    @pytest.mark.asyncio
+    async def test_mailbox_change_reselects_in_scope(self, email_client):
+        """Switching mailboxes inside a scope re-issues SELECT for each change."""
+        mock_imap = self._mock_imap()
+        mock_imap.uid = AsyncMock(return_value=("OK", []))
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            async with email_client.reuse_connection():
+                await email_client.mark_emails_as_read(["1"], mailbox="INBOX")
+                await email_client.mark_emails_as_read(["2"], mailbox="Archive")
+                await email_client.mark_emails_as_read(["3"], mailbox="INBOX")
+
+        assert [c.args[0] for c in mock_imap.select.call_args_list] == ['"INBOX"', '"Archive"', '"INBOX"']
+
+    @pytest.mark.asyncio
+    async def test_outside_scope_each_operation_selects(self, email_client):
+        """Per-operation connections never carry selection state between calls."""
+        first_imap = self._mock_imap()
+        first_imap.uid = AsyncMock(return_value=("OK", []))
+        second_imap = self._mock_imap()
+        second_imap.uid = AsyncMock(return_value=("OK", []))
+
+        with patch.object(email_client, "imap_class", side_effect=[first_imap, second_imap]):
+            await email_client.mark_emails_as_read(["1"])
+            await email_client.mark_emails_as_read(["2"])
+
+        first_imap.select.assert_called_once()
+        second_imap.select.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_outside_scope_each_operation_reconnects(self, email_client):
+        """Without a reuse scope, every operation keeps its own connect/logout cycle."""
+        first_imap = self._mock_imap()
+        second_imap = self._mock_imap()
+
+        with patch.object(email_client, "imap_class", side_effect=[first_imap, second_imap]):
+            await email_client.list_mailboxes()
+            await email_client.list_mailboxes()
+
+        first_imap.logout.assert_called_once()
+        second_imap.logout.assert_called_once()
+
+
+class TestGetEmailBodiesByIds:
+    """Tests for the batched body fetch used by get_emails_content."""
+
+    RAW_EMAIL = b"From: alice@example.com\r\nSubject: Hello\r\nDate: Mon, 20 Jan 2025 10:30:00 +0000\r\n\r\nBody one"
+
+    @staticmethod
+    def _mock_imap(fetch_data):
+        mock_imap = AsyncMock()
+        mock_imap._client_task = _CompletedAwaitable()
+        mock_imap.wait_hello_from_server = AsyncMock()
+        mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
+        mock_imap.select = AsyncMock(return_value=("OK", []))
+        mock_imap.logout = AsyncMock()
+
+        async def uid_side_effect(command, *args):
+            if command == "fetch":
+                return "OK", fetch_data
+            return "OK", []
+
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+        return mock_imap
+
+    @pytest.mark.asyncio
+    async def test_batch_fetches_all_bodies_in_one_command(self, email_client):
+        fetch_data = [
+            b"1 FETCH (UID 1 BODY[] {90}",
+            bytearray(self.RAW_EMAIL),
+            b")",
+            b"2 FETCH (UID 2 BODY[] {90}",
+            bytearray(self.RAW_EMAIL.replace(b"Hello", b"World")),
+            b")",
+        ]
+        mock_imap = self._mock_imap(fetch_data)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            result = await email_client.get_email_bodies_by_ids(["1", "2"])
+
+        assert set(result) == {"1", "2"}
+        assert result["1"]["subject"] == "Hello"
+        assert result["2"]["subject"] == "World"
+        fetch_calls = [c for c in mock_imap.uid.call_args_list if c.args[0] == "fetch"]
+        assert len(fetch_calls) == 1  # one round trip for the whole set
+        assert fetch_calls[0].args[1] == "1,2"
+
+    @pytest.mark.asyncio
+    async def test_mark_as_read_stores_once_per_chunk(self, email_client):
+        fetch_data = [
+            b"1 FETCH (UID 1 BODY[] {90}",
+            bytearray(self.RAW_EMAIL),
+            b")",
+            b"2 FETCH (UID 2 BODY[] {90}",
+            bytearray(self.RAW_EMAIL),
+            b")",
+        ]
+        mock_imap = self._mock_imap(fetch_data)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            result = await email_client.get_email_bodies_by_ids(["1", "2"], mark_as_read=True)
+
+        assert set(result) == {"1", "2"}
+        store_calls = [c for c in mock_imap.uid.call_args_list if c.args[0] == "store"]
+        assert [c.args[1] for c in store_calls] == ["1,2"]
+
+    @pytest.mark.asyncio
+    async def test_blocked_uid_never_fetched(self, email_client):
+        fetch_data = [
+            b"1 FETCH (UID 1 BODY[] {90}",
+            bytearray(self.RAW_EMAIL),
+            b")",
+        ]
+        mock_imap = self._mock_imap(fetch_data)
+        senders = {"1": "ok@allowed.com", "2": "evil@blocked.com"}
+
+        with (
+            patch.object(email_client, "_batch_fetch_senders", AsyncMock(return_value=senders)),
+            patch.object(email_client, "imap_class", return_value=mock_imap),
+        ):
+            result = await email_client.get_email_bodies_by_ids(["1", "2"], allowed_senders=["*@allowed.com"])
+
+        assert set(result) == {"1"}
+        fetch_calls = [c for c in mock_imap.uid.call_args_list if c.args[0] == "fetch"]
+        assert fetch_calls[0].args[1] == "1"  # blocked UID excluded from the fetch set
+
+    @pytest.mark.asyncio
+    async def test_empty_id_list_does_no_imap_work(self, email_client):
+        mock_imap = self._mock_imap([])
+        with patch.object(email_client, "imap_class", return_value=mock_imap) as mock_class:
+            result = await email_client.get_email_bodies_by_ids([])
+        assert result == {}
+        mock_class.assert_not_called()
+
+
+class TestParseHeaderBlock:
+    """Tests for the lightweight header splitter used by the metadata path."""
+
+    def test_unfolds_continuations_and_decodes_encoded_words(self):
+        from mcp_email_server.emails.classic import _parse_header_block
+
+        raw_headers = (
+            b"Subject: =?utf-8?b?R3LDvMOfZQ==?=\r\n"
+            b" from a folded line\r\n"
+            b"From: sender@example.com\r\n"
+            b"X-Unwanted: huge tracking blob\r\n"
+            b"\r\n"
+        )
+
+        headers = _parse_header_block(raw_headers)
+
+        assert headers["subject"] == "Grüße from a folded line"
+        assert headers["from"] == "sender@example.com"
+        assert "x-unwanted" not in headers
+
+    def test_first_occurrence_wins_and_body_is_ignored(self):
+        from mcp_email_server.emails.classic import _parse_header_block
+
+        raw_headers = b"Subject: first\nSubject: second\n\nTo: not-a-header@body.example\n"
+
+        headers = _parse_header_block(raw_headers)
+
+        assert headers["subject"] == "first"
+        assert "to" not in headers
+
+
+class TestParseRecipientHeaders:
+    """Recipient parsing keeps quoted display names containing commas intact."""
+
+    def test_quoted_display_name_with_comma_is_one_recipient(self, email_client):
+        recipients = email_client._parse_recipient_headers('"Last, First" <first@example.com>', "cc@example.com")
+
+        assert recipients == ['"Last, First" <first@example.com>', "cc@example.com"]
+
+    def test_empty_headers_yield_no_recipients(self, email_client):
+        assert email_client._parse_recipient_headers("", "") == []
+
+
+class TestDecodedTextPrefix:
+    """Large base64 text bodies are truncated before decoding, not after."""
+
+    def _base64_text_email(self, text: str) -> bytes:
+        import base64
+
+        encoded = base64.encodebytes(text.encode("utf-8")).decode("ascii")
+        return (
+            "From: sender@example.com\r\n"
+            "Subject: big body\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n" + encoded
+        ).encode("ascii")
+
+    def test_large_base64_body_window_matches_full_decode(self, email_client):
+        text = "0123456789" * 30_000  # ~300k chars, well past the default window
+        raw_email = self._base64_text_email(text)
+
+        result = email_client._parse_email_data(raw_email, "1")
+
+        assert result["body"] == text[:20000] + "...[TRUNCATED]"
+
+    def test_offset_window_still_pages_into_the_body(self, email_client):
+        text = "abcdefghij" * 10_000
+        raw_email = self._base64_text_email(text)
+
+        result = email_client._parse_email_data(raw_email, "1", body_offset=50_000, max_body_length=100)
+
+        assert result["body"] == text[50_000:50_100] + "...[TRUNCATED]"
+
+    def test_small_body_is_unaffected(self, email_client):
+        raw_email = self._base64_text_email("short body")
+
+        result = email_client._parse_email_data(raw_email, "1")
+
+        assert result["body"] == "short body"
+
+    def test_multibyte_text_survives_prefix_truncation(self, email_client):
+        text = "Grüße und ein langer Text! " * 10_000
+        raw_email = self._base64_text_email(text)
+
+        result = email_client._parse_email_data(raw_email, "1")
+
+        assert result["body"] == text[:20000] + "...[TRUNCATED]"
+
+
+class TestCachedSslContexts:
+    def test_imap_connections_share_one_ssl_context(self, email_client):
+        """Repeated connects must not rebuild the SSL context (CA bundle reload)."""
+        with patch.object(email_client, "imap_class", MagicMock()) as mock_class:
+            email_client._imap_connect()
+            email_client._imap_connect()
+
+        first_kwargs = mock_class.call_args_list[0].kwargs
+        second_kwargs = mock_class.call_args_list[1].kwargs
+        assert first_kwargs["ssl_context"] is second_kwargs["ssl_context"]
+
+    def test_plain_imap_gets_no_ssl_context(self):
+        server = EmailServer(
+            user_name="test_user",
+            password="test_password",
+            host="imap.example.com",
+            port=143,
+            use_ssl=False,
+        )
+        client = EmailClient(server)
+
+        assert client._imap_ssl_context is None
+
+
+class TestSmtpConnectionReuse:
+    """Pooled SMTP connections across send_email calls."""
+
+    @staticmethod
+    def _mock_smtp():
+        mock = AsyncMock()
+        mock.connect = AsyncMock()
+        mock.login = AsyncMock()
+        mock.noop = AsyncMock()
+        mock.send_message = AsyncMock()
+        mock.quit = AsyncMock()
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_second_send_reuses_connection(self, email_client):
+        """The second send must skip connect/login and NOOP-validate the pooled session."""
+        mock_smtp = self._mock_smtp()
+
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp) as mock_class:
+            await email_client.send_email(["a@example.com"], "One", "Body")
+            await email_client.send_email(["b@example.com"], "Two", "Body")
+
+        mock_class.assert_called_once()
+        mock_smtp.connect.assert_called_once()
+        mock_smtp.login.assert_called_once()
+        mock_smtp.noop.assert_called_once()
+        assert mock_smtp.send_message.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_pooled_connection_is_replaced(self, email_client):
+        """A pooled connection failing NOOP is discarded and a fresh one opened."""
+        stale = self._mock_smtp()
+        stale.noop = AsyncMock(side_effect=ConnectionResetError("gone"))
+        fresh = self._mock_smtp()
+
+        with patch("aiosmtplib.SMTP", side_effect=[stale, fresh]):
+            await email_client.send_email(["a@example.com"], "One", "Body")
+            stale_entry = next(iter(classic._smtp_pool.values()))
+            assert stale_entry is stale
+
+            await email_client.send_email(["b@example.com"], "Two", "Body")
+
+        stale.quit.assert_called_once()
+        fresh.connect.assert_called_once()
+        fresh.send_message.assert_called_once()
+        assert next(iter(classic._smtp_pool.values())) is fresh
+
+    @pytest.mark.asyncio
+    async def test_overlapping_sends_close_displaced_pooled_connection(self, email_client):
+        """When two sends race, the connection displaced from the pool is closed."""
+        ours = self._mock_smtp()
+        other = self._mock_smtp()
+
+        # An overlapping send pooled its connection while ours was in flight.
+        classic._smtp_pool[email_client._smtp_pool_key] = other
+
+        with patch.object(email_client, "_acquire_smtp", AsyncMock(return_value=ours)):
+            await email_client._smtp_send(MIMEText("Body"), ["a@example.com"])
+
+        ours.send_message.assert_called_once()
+        other.quit.assert_called_once()
+        assert next(iter(classic._smtp_pool.values())) is ours
+
+    @pytest.mark.asyncio
+    async def test_failed_send_drops_connection_from_pool(self, email_client):
+        """A send failure must not return the connection to the pool."""
+        mock_smtp = self._mock_smtp()
+        mock_smtp.send_message = AsyncMock(side_effect=RuntimeError("rejected"))
+
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
+            with pytest.raises(RuntimeError, match="rejected"):
+                await email_client.send_email(["a@example.com"], "One", "Body")
+
+        assert not classic._smtp_pool
+        mock_smtp.quit.assert_called_once()
+
+
+class TestFetchFormatMemoization:
+    """The fetch format that worked for a server is tried first afterwards."""
+
+    @staticmethod
+    def _mock_imap_rejecting_default():
+        async def uid(_cmd, _email_id, fetch_format):
+            if fetch_format == "BODY.PEEK[]":
+                raise RuntimeError("server rejects bare BODY.PEEK[]")
+            return ("OK", [b"1 FETCH (UID 1 BODY[] {200}", bytearray(b"x" * 200), b")"])
+
+        mock_imap = AsyncMock()
+        mock_imap.uid = AsyncMock(side_effect=uid)
+        return mock_imap
+
+    @pytest.mark.asyncio
+    async def test_successful_format_skips_failed_probe_next_time(self, email_client):
+        mock_imap = self._mock_imap_rejecting_default()
+
+        first = await email_client._fetch_email_with_formats(mock_imap, "1")
+        assert first is not None
+        assert [c.args[2] for c in mock_imap.uid.call_args_list] == ["BODY.PEEK[]", "(BODY.PEEK[])"]
+
+        mock_imap.uid.reset_mock()
+        second = await email_client._fetch_email_with_formats(mock_imap, "2")
+        assert second is not None
+        assert [c.args[2] for c in mock_imap.uid.call_args_list] == ["(BODY.PEEK[])"]
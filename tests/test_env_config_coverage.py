@@ -447,11 +447,11 @@ def test_allowed_recipients_from_env(tmp_path, monkeypatch):
     blank.write_text("")
     monkeypatch.setitem(Settings.model_config, "toml_file", blank)
     monkeypatch.setenv("MCP_EMAIL_SERVER_ALLOWED_RECIPIENTS", "alice@example.com, BOB@EXAMPLE.COM , alice@example.com")
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_recipients == ["alice@example.com", "bob@example.com"]
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_recipients_env_empty_string_keeps_empty(tmp_path, monkeypatch):
@@ -462,11 +462,11 @@ def test_allowed_recipients_env_empty_string_keeps_empty(tmp_path, monkeypatch):
     blank.write_text("")
     monkeypatch.setitem(Settings.model_config, "toml_file", blank)
     monkeypatch.setenv("MCP_EMAIL_SERVER_ALLOWED_RECIPIENTS", "")
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_recipients == []
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_recipients_env_overrides_toml(tmp_path, monkeypatch):
@@ -479,11 +479,11 @@ def test_allowed_recipients_env_overrides_toml(tmp_path, monkeypatch):
     cfg.write_bytes(tomli_w.dumps({"allowed_recipients": ["fromtoml@example.com"]}).encode())
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
     monkeypatch.setenv("MCP_EMAIL_SERVER_ALLOWED_RECIPIENTS", "fromenv@example.com")
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_recipients == ["fromenv@example.com"]
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_recipients_empty_env_overrides_toml(tmp_path, monkeypatch):
@@ -496,11 +496,11 @@ def test_allowed_recipients_empty_env_overrides_toml(tmp_path, monkeypatch):
     cfg.write_bytes(tomli_w.dumps({"allowed_recipients": ["fromtoml@example.com"]}).encode())
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
     monkeypatch.setenv("MCP_EMAIL_SERVER_ALLOWED_RECIPIENTS", "")
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_recipients == []
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_senders_from_env(tmp_path, monkeypatch):
@@ -511,11 +511,11 @@ def test_allowed_senders_from_env(tmp_path, monkeypatch):
     blank.write_text("")
     monkeypatch.setitem(Settings.model_config, "toml_file", blank)
     monkeypatch.setenv("MCP_EMAIL_SERVER_ALLOWED_SENDERS", "*@Example.com, BOB@EXAMPLE.COM , *@example.com")
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_senders == ["*@example.com", "bob@example.com"]
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_senders_env_overrides_toml(tmp_path, monkeypatch):
@@ -528,11 +528,11 @@ def test_allowed_senders_env_overrides_toml(tmp_path, monkeypatch):
     cfg.write_bytes(tomli_w.dumps({"allowed_senders": ["fromtoml@example.com"]}).encode())
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
     monkeypatch.setenv("MCP_EMAIL_SERVER_ALLOWED_SENDERS", "*@env.com")
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_senders == ["*@env.com"]
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
 
 def test_allowed_senders_empty_env_clears_toml(tmp_path, monkeypatch):
@@ -545,8 +545,8 @@ def test_allowed_senders_empty_env_clears_toml(tmp_path, monkeypatch):
     cfg.write_bytes(tomli_w.dumps({"allowed_senders": ["*@example.com"]}).encode())
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
     monkeypatch.setenv("MCP_EMAIL_SERVER_ALLOWED_SENDERS", "")
-    config_module._settings = None
+    config_module.clear_settings_cache()
     try:
         assert config_module.get_settings(reload=True).allowed_senders == []
     finally:
-        config_module._settings = None
+        config_module.clear_settings_cache()
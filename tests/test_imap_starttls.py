@@ -3,6 +3,7 @@ import ssl
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from conftest import _CompletedAwaitable
 
 from mcp_email_server.config import EmailServer, EmailSettings
 from mcp_email_server.emails.classic import (
@@ -21,8 +22,7 @@ class Response:
 
 def _make_imap(capabilities=("IMAP4rev1", "STARTTLS")):
     imap = AsyncMock()
-    imap._client_task = asyncio.Future()
-    imap._client_task.set_result(None)
+    imap._client_task = _CompletedAwaitable()
     imap.wait_hello_from_server = AsyncMock()
     imap.protocol = MagicMock()
     imap.protocol.capabilities = set(capabilities)
@@ -27,7 +27,7 @@ def _bind(tmp_path, monkeypatch, *, also_config_path: bool = False):
     monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
     if also_config_path:
         monkeypatch.setattr(config_module, "CONFIG_PATH", cfg)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     return cfg
 
 
@@ -80,7 +80,7 @@ def test_round_trip_keyring_mode(tmp_path, monkeypatch, fake_keyring):
     assert "smtp-secret" not in content
     assert "sk-secret" not in content
 
-    config_module._settings = None
+    config_module.clear_settings_cache()
     reloaded = Settings()
     assert reloaded == settings
     assert isinstance(reloaded.emails[0].incoming.password, SecretStr)
@@ -186,7 +186,7 @@ def test_legacy_plaintext_config_loads_unchanged_then_migrates_on_save(tmp_path,
     assert SENTINEL in content
     assert "legacy-secret" not in content
 
-    config_module._settings = None
+    config_module.clear_settings_cache()
     reloaded = Settings()
     assert reloaded.emails[0].incoming.password.get_secret_value() == "legacy-secret"
 
@@ -207,7 +207,7 @@ def test_env_storage_override_is_persisted_with_credential_representation(tmp_pa
     assert "cleartext" not in content
 
     monkeypatch.delenv("MCP_EMAIL_SERVER_CREDENTIAL_STORAGE", raising=False)
-    config_module._settings = None
+    config_module.clear_settings_cache()
     reloaded = Settings()
     assert reloaded.credential_storage == "keyring"
     assert reloaded.emails[0].incoming.password.get_secret_value() == "cleartext"
@@ -392,7 +392,7 @@ def test_missing_keyring_entry_raises_on_load(tmp_path, monkeypatch, fake_keyrin
 
     fake_keyring._store.clear()  # simulate the entry vanishing from the keyring
 
-    config_module._settings = None
+    config_module.clear_settings_cache()
     with pytest.raises(ValueError, match="acct1"):
         Settings()
 
@@ -403,7 +403,7 @@ def test_broken_backend_raises_on_load_when_sentinel_present(tmp_path, monkeypat
     cfg = _bind(tmp_path, monkeypatch)
     cfg.write_text(tomli_w.dumps(_raw_email_toml("acct1", SENTINEL)))
 
-    config_module._settings = None
+    config_module.clear_settings_cache()
     with pytest.raises(ValueError, match="acct1"):
         Settings()
 
@@ -422,7 +422,7 @@ def test_mixed_sentinel_and_cleartext_accounts_load(tmp_path, monkeypatch, fake_
     }
     cfg.write_text(tomli_w.dumps(raw))
 
-    config_module._settings = None
+    config_module.clear_settings_cache()
     settings = Settings()
     by_name = {e.account_name: e for e in settings.emails}
     assert by_name["acct1"].incoming.password.get_secret_value() == "secret1"
@@ -845,7 +845,7 @@ def test_env_account_preempts_sentinel_resolution(tmp_path, monkeypatch, broken_
     monkeypatch.setenv("MCP_EMAIL_SERVER_PASSWORD", "env-secret")
     monkeypatch.setenv("MCP_EMAIL_SERVER_IMAP_HOST", "imap.env.example.com")
 
-    config_module._settings = None
+    config_module.clear_settings_cache()
     settings = Settings()  # would raise if it touched the (broken) keyring at all
     assert settings.emails[0].incoming.password.get_secret_value() == "env-secret"
 
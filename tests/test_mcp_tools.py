@@ -131,7 +131,7 @@ class TestMcpTools:
 
         cfg = tmp_path / "config.toml"
         monkeypatch.setitem(Settings.model_config, "toml_file", cfg)
-        config_module._settings = None
+        config_module.clear_settings_cache()
 
         email_settings = EmailSettings(
             account_name="dup",
@@ -167,7 +167,7 @@ class TestMcpTools:
             result = await add_email_account(new_account)
             assert result == "Successfully added email account 'brand_new'"
         finally:
-            config_module._settings = None
+            config_module.clear_settings_cache()
 
     @pytest.mark.asyncio
     async def test_list_emails_metadata(self):
@@ -75,6 +75,32 @@ class TestEmailMetadata:
         email_data = EmailMetadata.from_email(email_dict)
         assert email_data.message_id is None
 
+    def test_from_email_unchecked_matches_validated_path(self):
+        """from_email_unchecked builds the same model as from_email."""
+        now = datetime.now(UTC)
+        email_dict = {
+            "email_id": "123",
+            "message_id": "<test@example.com>",
+            "subject": "Test Subject",
+            "from": "test@example.com",
+            "to": ["recipient@example.com"],
+            "date": now,
+            "attachments": ["file1.txt"],
+        }
+        assert EmailMetadata.from_email_unchecked(email_dict) == EmailMetadata.from_email(email_dict)
+
+    def test_from_email_unchecked_defaults_missing_optionals(self):
+        """Absent message_id and recipients still get their declared defaults."""
+        email_data = EmailMetadata.from_email_unchecked({
+            "email_id": "123",
+            "subject": "Test Subject",
+            "from": "test@example.com",
+            "date": datetime.now(UTC),
+            "attachments": [],
+        })
+        assert email_data.message_id is None
+        assert email_data.recipients == []
+
 
 class TestEmailMetadataPageResponse:
     def test_init(self):
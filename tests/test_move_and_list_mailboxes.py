@@ -4,11 +4,11 @@ ClassicEmailHandler.move_emails, and ClassicEmailHandler.list_mailboxes.
 Covers the new functionality introduced in PR #147.
 """
 
-import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aioimaplib import Response
+from conftest import _CompletedAwaitable
 
 from mcp_email_server.config import EmailServer, EmailSettings
 from mcp_email_server.emails.classic import ClassicEmailHandler, EmailClient
@@ -66,8 +66,7 @@ def classic_handler(email_settings):
 def _make_mock_imap(**overrides):
     """Helper to build an AsyncMock IMAP client with sensible defaults."""
     mock = AsyncMock()
-    mock._client_task = asyncio.Future()
-    mock._client_task.set_result(None)
+    mock._client_task = _CompletedAwaitable()
     mock.wait_hello_from_server = AsyncMock()
     mock.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
     mock.select = AsyncMock(return_value=("OK", []))
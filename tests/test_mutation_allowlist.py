@@ -1,9 +1,9 @@
 """Sender-allowlist enforcement on the UID mutation tools."""
 
-import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from conftest import _CompletedAwaitable
 
 from mcp_email_server.emails.classic import EmailClient
 
@@ -16,13 +16,13 @@ def email_client(email_server):  # email_server comes from conftest.py
 def _make_mock_imap(**overrides):
     """AsyncMock IMAP client with sensible mutation defaults (uid/expunge return OK)."""
     mock = AsyncMock()
-    mock._client_task = asyncio.Future()
-    mock._client_task.set_result(None)
+    mock._client_task = _CompletedAwaitable()
     mock.wait_hello_from_server = AsyncMock()
     mock.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
     mock.select = AsyncMock(return_value=("OK", []))
     mock.uid = AsyncMock(return_value=("OK", []))
     mock.expunge = AsyncMock(return_value=("OK", []))
+    mock.has_capability = MagicMock(return_value=False)
     mock.logout = AsyncMock()
     for k, v in overrides.items():
         setattr(mock, k, v)
@@ -74,6 +74,7 @@ class TestDeleteEmailsAllowlist:
             deleted, failed = await email_client.delete_emails(["1", "2"], allowed_senders=[])
         assert deleted == ["1", "2"]
         assert failed == []
+        assert _uid_op_targets(mock_imap, "store") == ["1,2"]  # one batched STORE for the chunk
         mock_senders.assert_not_called()  # no allowlist => no extra IMAP work
 
     @pytest.mark.asyncio
@@ -115,7 +116,7 @@ class TestDeleteEmailsAllowlist:
 
         assert deleted == []
         assert failed == ["1", "2"]
-        assert _uid_op_targets(mock_imap, "store") == ["1", "2"]
+        assert _uid_op_targets(mock_imap, "store") == ["1,2"]
         mock_imap.expunge.assert_called_once()
 
 
@@ -1,48 +1,34 @@
 """Tests for IMAP mailbox encoding and quoting helpers."""
 
+import pytest
+
 from mcp_email_server.emails.classic import _quote_mailbox, decode_mailbox_name, encode_mailbox_name
 
 
 class TestQuoteMailbox:
     """Tests for _quote_mailbox function."""
 
-    def test_quotes_simple_mailbox_name(self):
-        """Test that simple mailbox names are quoted."""
-        assert _quote_mailbox("INBOX") == '"INBOX"'
-
-    def test_quotes_mailbox_with_spaces(self):
-        """Test that mailbox names with spaces are quoted."""
-        assert _quote_mailbox("All Mail") == '"All Mail"'
-
-    def test_quotes_special_folders(self):
-        """Test quoting of various folder names."""
-        assert _quote_mailbox("Sent") == '"Sent"'
-        assert _quote_mailbox("INBOX.Sent") == '"INBOX.Sent"'
-        assert _quote_mailbox("[Gmail]/Sent Mail") == '"[Gmail]/Sent Mail"'
-
-    def test_quotes_empty_string(self):
-        """Test handling of empty string."""
-        assert _quote_mailbox("") == '""'
-
-    def test_escapes_quotes_in_mailbox_name(self):
-        """Test that double-quote characters are escaped per RFC 3501."""
-        assert _quote_mailbox('My"Folder') == r'"My\"Folder"'
-        assert _quote_mailbox('Test"Quote"Name') == r'"Test\"Quote\"Name"'
-
-    def test_escapes_backslashes_in_mailbox_name(self):
-        """Test that backslash characters are escaped per RFC 3501."""
-        assert _quote_mailbox("My\\Folder") == r'"My\\Folder"'
-        assert _quote_mailbox("Path\\To\\Folder") == r'"Path\\To\\Folder"'
-
-    def test_escapes_both_quotes_and_backslashes(self):
-        """Test escaping of both quotes and backslashes together."""
-        assert _quote_mailbox('My\\"Folder') == r'"My\\\"Folder"'
-
-    def test_already_quoted_gets_escaped(self):
-        """Test that already-quoted names are properly escaped and re-quoted."""
-        # Per RFC 3501, we should always escape and quote
-        # '"INBOX"' should become '"\\"INBOX\\""' (quotes escaped)
-        assert _quote_mailbox('"INBOX"') == r'"\"INBOX\""'
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param("INBOX", '"INBOX"', id="simple"),
+            pytest.param("All Mail", '"All Mail"', id="spaces"),
+            pytest.param("Sent", '"Sent"', id="sent"),
+            pytest.param("INBOX.Sent", '"INBOX.Sent"', id="dotted"),
+            pytest.param("[Gmail]/Sent Mail", '"[Gmail]/Sent Mail"', id="gmail-path"),
+            pytest.param("", '""', id="empty"),
+            pytest.param('My"Folder', r'"My\"Folder"', id="embedded-quote"),
+            pytest.param('Test"Quote"Name', r'"Test\"Quote\"Name"', id="multiple-quotes"),
+            pytest.param("My\\Folder", r'"My\\Folder"', id="backslash"),
+            pytest.param("Path\\To\\Folder", r'"Path\\To\\Folder"', id="multiple-backslashes"),
+            pytest.param('My\\"Folder', r'"My\\\"Folder"', id="backslash-and-quote"),
+            # Per RFC 3501, already-quoted names are escaped and re-quoted.
+            pytest.param('"INBOX"', r'"\"INBOX\""', id="already-quoted"),
+        ],
+    )
+    def test_quotes_and_escapes_per_rfc3501(self, raw, expected):
+        """Mailbox names are quoted with RFC 3501 escaping of quotes and backslashes."""
+        assert _quote_mailbox(raw) == expected
 
 
 class TestModifiedUtf7MailboxCodec:
@@ -244,22 +244,20 @@ class TestAppendToMailbox:
     """Tests for EmailClient.append_to_mailbox — IMAP APPEND to a specific folder."""
 
     @pytest.mark.asyncio
-    async def test_append_success(self, email_client, incoming_server, mock_imap):
+    async def test_append_success(self, email_client, incoming_server, mock_imap, patched_aioimaplib):
         msg = MIMEText("Draft body")
         msg["Subject"] = "Draft"
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
         assert result == "unknown"  # no APPENDUID in mock response
         mock_imap.select.assert_called_with('"Drafts"')
         mock_imap.append.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_append_encodes_unicode_mailbox(self, email_client, incoming_server, mock_imap):
+    async def test_append_encodes_unicode_mailbox(self, email_client, incoming_server, mock_imap, patched_aioimaplib):
         msg = MIMEText("body")
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await email_client.append_to_mailbox(msg, incoming_server, "Entwürfe")
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await email_client.append_to_mailbox(msg, incoming_server, "Entwürfe")
 
         assert result == "unknown"
         mock_imap.select.assert_called_with('"Entw&APw-rfe"')
@@ -267,52 +265,49 @@ class TestAppendToMailbox:
         assert kwargs["mailbox"] == '"Entw&APw-rfe"'
 
     @pytest.mark.asyncio
-    async def test_append_returns_uid_from_appenduid(self, email_client, incoming_server, mock_imap):
+    async def test_append_returns_uid_from_appenduid(
+        self, email_client, incoming_server, mock_imap, patched_aioimaplib
+    ):
         mock_imap.append = AsyncMock(return_value=("OK", [b"[APPENDUID 1234567890 42] APPEND completed"]))
         msg = MIMEText("body")
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
         assert result == "42"
 
     @pytest.mark.asyncio
-    async def test_append_with_custom_flags(self, email_client, incoming_server, mock_imap):
+    async def test_append_with_custom_flags(self, email_client, incoming_server, mock_imap, patched_aioimaplib):
         msg = MIMEText("body")
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            await email_client.append_to_mailbox(msg, incoming_server, "Templates", flags=r"(\Seen \Flagged)")
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        await email_client.append_to_mailbox(msg, incoming_server, "Templates", flags=r"(\Seen \Flagged)")
         _, kwargs = mock_imap.append.call_args
         assert kwargs["flags"] == r"(\Seen \Flagged)"
 
     @pytest.mark.asyncio
-    async def test_append_folder_not_found(self, email_client, incoming_server, mock_imap):
+    async def test_append_folder_not_found(self, email_client, incoming_server, mock_imap, patched_aioimaplib):
         mock_imap.select = AsyncMock(return_value=("NO", []))
         msg = MIMEText("body")
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await email_client.append_to_mailbox(msg, incoming_server, "Nonexistent")
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await email_client.append_to_mailbox(msg, incoming_server, "Nonexistent")
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_append_login_failure(self, email_client, incoming_server, mock_imap):
+    async def test_append_login_failure(self, email_client, incoming_server, mock_imap, patched_aioimaplib):
         mock_imap.login = AsyncMock(side_effect=Exception("Auth failed"))
         msg = MIMEText("body")
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_append_imap_append_fails(self, email_client, incoming_server, mock_imap):
+    async def test_append_imap_append_fails(self, email_client, incoming_server, mock_imap, patched_aioimaplib):
         mock_imap.append = AsyncMock(return_value=("NO", [b"APPEND failed"]))
         msg = MIMEText("body")
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await email_client.append_to_mailbox(msg, incoming_server, "Drafts")
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_append_non_ssl(self, mock_imap):
+    async def test_append_non_ssl(self, mock_imap, patched_aioimaplib):
         server = EmailServer(
             user_name="test_user",
             password="test_password",
@@ -329,11 +324,10 @@ class TestAppendToMailbox:
             use_ssl=False,
         )
         msg = MIMEText("body")
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4.return_value = mock_imap
-            result = await client.append_to_mailbox(msg, incoming_non_ssl, "Drafts")
+        patched_aioimaplib.IMAP4.return_value = mock_imap
+        result = await client.append_to_mailbox(msg, incoming_non_ssl, "Drafts")
         assert result == "unknown"
-        mock_lib.IMAP4.assert_called_once()
+        patched_aioimaplib.IMAP4.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -351,13 +345,15 @@ class TestClassicEmailHandlerSaveToMailbox:
         mock_compose["Message-Id"] = "<test-id@example.com>"
         mock_append = AsyncMock(return_value="42")
 
-        with patch.object(handler.incoming_client, "compose_message", return_value=mock_compose):
-            with patch.object(handler.incoming_client, "append_to_mailbox", mock_append):
-                result = await handler.save_to_mailbox(
-                    recipients=["r@example.com"],
-                    subject="Draft",
-                    body="draft body",
-                )
+        with (
+            patch.object(handler.incoming_client, "compose_message", return_value=mock_compose),
+            patch.object(handler.incoming_client, "append_to_mailbox", mock_append),
+        ):
+            result = await handler.save_to_mailbox(
+                recipients=["r@example.com"],
+                subject="Draft",
+                body="draft body",
+            )
 
         assert "<test-id@example.com>" in result
         assert "uid:42" in result
@@ -375,15 +371,17 @@ class TestClassicEmailHandlerSaveToMailbox:
         mock_compose["Message-Id"] = "<test-id@example.com>"
         mock_append = AsyncMock(return_value="99")
 
-        with patch.object(handler.incoming_client, "compose_message", return_value=mock_compose):
-            with patch.object(handler.incoming_client, "append_to_mailbox", mock_append):
-                await handler.save_to_mailbox(
-                    recipients=["r@example.com"],
-                    subject="Template",
-                    body="body",
-                    mailbox="Templates",
-                    flags=[r"\Seen", r"\Flagged"],
-                )
+        with (
+            patch.object(handler.incoming_client, "compose_message", return_value=mock_compose),
+            patch.object(handler.incoming_client, "append_to_mailbox", mock_append),
+        ):
+            await handler.save_to_mailbox(
+                recipients=["r@example.com"],
+                subject="Template",
+                body="body",
+                mailbox="Templates",
+                flags=[r"\Seen", r"\Flagged"],
+            )
 
         mock_append.assert_called_once_with(
             mock_compose,
@@ -398,15 +396,17 @@ class TestClassicEmailHandlerSaveToMailbox:
         mock_compose = MIMEText("body")
         mock_append = AsyncMock(return_value=None)
 
-        with patch.object(handler.incoming_client, "compose_message", return_value=mock_compose):
-            with patch.object(handler.incoming_client, "append_to_mailbox", mock_append):
-                with pytest.raises(RuntimeError, match="Failed to save email"):
-                    await handler.save_to_mailbox(
-                        recipients=["r@example.com"],
-                        subject="Fail",
-                        body="body",
-                        mailbox="Nonexistent",
-                    )
+        with (
+            patch.object(handler.incoming_client, "compose_message", return_value=mock_compose),
+            patch.object(handler.incoming_client, "append_to_mailbox", mock_append),
+        ):
+            with pytest.raises(RuntimeError, match="Failed to save email"):
+                await handler.save_to_mailbox(
+                    recipients=["r@example.com"],
+                    subject="Fail",
+                    body="body",
+                    mailbox="Nonexistent",
+                )
 
     @pytest.mark.asyncio
     async def test_save_rejects_invalid_flags(self, email_settings):
@@ -424,7 +424,7 @@ class TestSaveToMailboxWithoutSmtp:
     """save_to_mailbox is a pure IMAP operation — no SMTP configuration required."""
 
     @pytest.mark.asyncio
-    async def test_imap_only_account_saves_successfully(self, mock_imap):
+    async def test_imap_only_account_saves_successfully(self, mock_imap, patched_aioimaplib):
         imap_only_settings = EmailSettings(
             account_name="imap_only",
             full_name="Imap Only",
@@ -435,13 +435,12 @@ class TestSaveToMailboxWithoutSmtp:
         assert handler.outgoing_client is None
 
         mock_imap.append = AsyncMock(return_value=("OK", [b"[APPENDUID 1234567890 7] APPEND completed"]))
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await handler.save_to_mailbox(
-                recipients=["r@example.com"],
-                subject="Draft",
-                body="draft body",
-            )
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await handler.save_to_mailbox(
+            recipients=["r@example.com"],
+            subject="Draft",
+            body="draft body",
+        )
 
         assert "uid:7" in result
         mock_imap.select.assert_called_with('"Drafts"')
@@ -496,7 +495,7 @@ class TestSaveToMailboxTool:
         assert "email_id: 42" in result
 
     @pytest.mark.asyncio
-    async def test_save_to_mailbox_tool_imap_only_account(self, monkeypatch, mock_imap):
+    async def test_save_to_mailbox_tool_imap_only_account(self, monkeypatch, mock_imap, patched_aioimaplib):
         """The MCP tool works end-to-end for an account without SMTP configuration."""
         imap_only_settings = EmailSettings(
             account_name="imap_only",
@@ -511,14 +510,13 @@ class TestSaveToMailboxTool:
         from mcp_email_server.app import save_to_mailbox
 
         mock_imap.append = AsyncMock(return_value=("OK", [b"[APPENDUID 1234567890 7] APPEND completed"]))
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_lib:
-            mock_lib.IMAP4_SSL.return_value = mock_imap
-            result = await save_to_mailbox(
-                account_name="imap_only",
-                recipients=["r@example.com"],
-                subject="Draft",
-                body="body",
-            )
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        result = await save_to_mailbox(
+            account_name="imap_only",
+            recipients=["r@example.com"],
+            subject="Draft",
+            body="body",
+        )
 
         assert "Drafts" in result
         assert "email_id: 7" in result
@@ -1,186 +1,111 @@
 """Tests for the save_to_sent feature."""
 
-import asyncio
 from email.mime.text import MIMEText
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+import aioimaplib
 import pytest
+from conftest import _CompletedAwaitable
 
 from mcp_email_server.config import EmailServer, EmailSettings
+from mcp_email_server.emails import classic
 from mcp_email_server.emails.classic import ClassicEmailHandler, EmailClient
 
 
 @pytest.fixture
-def email_settings_with_save_to_sent():
-    """EmailSettings with save_to_sent enabled."""
+def base_email_settings(incoming_server, outgoing_server):
+    """Validated base EmailSettings the save-to-sent variants are copied from."""
     return EmailSettings(
         account_name="test_account",
         full_name="Test User",
         email_address="test@example.com",
-        incoming=EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="imap.example.com",
-            port=993,
-            use_ssl=True,
-        ),
-        outgoing=EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="smtp.example.com",
-            port=465,
-            use_ssl=True,
-        ),
-        save_to_sent=True,
-        sent_folder_name="INBOX.Sent",
+        incoming=incoming_server,
+        outgoing=outgoing_server,
     )
 
 
 @pytest.fixture
-def email_settings_without_save_to_sent():
+def email_settings_with_save_to_sent(base_email_settings):
+    """EmailSettings with save_to_sent enabled."""
+    return base_email_settings.model_copy(update={"save_to_sent": True, "sent_folder_name": "INBOX.Sent"})
+
+
+@pytest.fixture
+def email_settings_without_save_to_sent(base_email_settings):
     """EmailSettings with save_to_sent disabled."""
-    return EmailSettings(
-        account_name="test_account",
-        full_name="Test User",
-        email_address="test@example.com",
-        incoming=EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="imap.example.com",
-            port=993,
-            use_ssl=True,
-        ),
-        outgoing=EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="smtp.example.com",
-            port=465,
-            use_ssl=True,
-        ),
-        save_to_sent=False,
-    )
+    return base_email_settings.model_copy(update={"save_to_sent": False})
 
 
 @pytest.fixture
-def email_settings_default_sent_folder():
+def email_settings_default_sent_folder(base_email_settings):
     """EmailSettings with default (auto-detect) sent folder."""
-    return EmailSettings(
-        account_name="test_account",
-        full_name="Test User",
-        email_address="test@example.com",
-        incoming=EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="imap.example.com",
-            port=993,
-            use_ssl=True,
-        ),
-        outgoing=EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="smtp.example.com",
-            port=465,
-            use_ssl=True,
-        ),
-        save_to_sent=True,
-        sent_folder_name=None,  # Auto-detect
-    )
+    return base_email_settings.model_copy(update={"save_to_sent": True, "sent_folder_name": None})
 
 
 class TestEmailSettingsSaveToSent:
     """Tests for save_to_sent config options."""
 
-    def test_save_to_sent_default_true(self):
-        """Test that save_to_sent defaults to True."""
-        settings = EmailSettings(
-            account_name="test",
-            full_name="Test",
-            email_address="test@example.com",
-            incoming=EmailServer(user_name="test", password="pass", host="imap.test.com", port=993),
-            outgoing=EmailServer(user_name="test", password="pass", host="smtp.test.com", port=465),
-        )
-        assert settings.save_to_sent is True
-
-    def test_sent_folder_name_default_none(self):
-        """Test that sent_folder_name defaults to None."""
-        settings = EmailSettings(
-            account_name="test",
-            full_name="Test",
-            email_address="test@example.com",
-            incoming=EmailServer(user_name="test", password="pass", host="imap.test.com", port=993),
-            outgoing=EmailServer(user_name="test", password="pass", host="smtp.test.com", port=465),
-        )
-        assert settings.sent_folder_name is None
-
-    def test_save_to_sent_can_be_disabled(self):
-        """Test that save_to_sent can be set to False."""
-        settings = EmailSettings(
-            account_name="test",
-            full_name="Test",
-            email_address="test@example.com",
-            incoming=EmailServer(user_name="test", password="pass", host="imap.test.com", port=993),
-            outgoing=EmailServer(user_name="test", password="pass", host="smtp.test.com", port=465),
-            save_to_sent=False,
-        )
-        assert settings.save_to_sent is False
-
-    def test_sent_folder_name_can_be_set(self):
-        """Test that sent_folder_name can be set."""
+    # Built once; EmailSettings keeps references and no test mutates them.
+    INCOMING = EmailServer(user_name="test", password="pass", host="imap.test.com", port=993)
+    OUTGOING = EmailServer(user_name="test", password="pass", host="smtp.test.com", port=465)
+
+    @pytest.mark.parametrize(
+        ("overrides", "attr", "expected"),
+        [
+            pytest.param({}, "save_to_sent", True, id="save-to-sent-defaults-true"),
+            pytest.param({}, "sent_folder_name", None, id="sent-folder-defaults-none"),
+            pytest.param({"save_to_sent": False}, "save_to_sent", False, id="save-to-sent-disabled"),
+            pytest.param(
+                {"sent_folder_name": "[Gmail]/Sent Mail"}, "sent_folder_name", "[Gmail]/Sent Mail", id="sent-folder-set"
+            ),
+        ],
+    )
+    def test_save_to_sent_options(self, overrides, attr, expected):
+        """Defaults and explicit values for the save-to-sent settings fields."""
         settings = EmailSettings(
             account_name="test",
             full_name="Test",
             email_address="test@example.com",
-            incoming=EmailServer(user_name="test", password="pass", host="imap.test.com", port=993),
-            outgoing=EmailServer(user_name="test", password="pass", host="smtp.test.com", port=465),
-            sent_folder_name="[Gmail]/Sent Mail",
+            incoming=self.INCOMING,
+            outgoing=self.OUTGOING,
+            **overrides,
         )
-        assert settings.sent_folder_name == "[Gmail]/Sent Mail"
+        assert getattr(settings, attr) == expected
 
 
 class TestEmailSettingsFromEnv:
     """Tests for save_to_sent environment variable configuration."""
 
-    def test_save_to_sent_from_env_true(self, monkeypatch):
-        """Test MCP_EMAIL_SERVER_SAVE_TO_SENT=true."""
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_EMAIL_ADDRESS", "test@example.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_PASSWORD", "pass")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_IMAP_HOST", "imap.test.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_SMTP_HOST", "smtp.test.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_SAVE_TO_SENT", "true")
-
-        results = EmailSettings.from_env_many()
-        assert results is not None
-        assert len(results) == 1
-        result = results[0]
-        assert result.save_to_sent is True
-
-    def test_save_to_sent_from_env_false(self, monkeypatch):
-        """Test MCP_EMAIL_SERVER_SAVE_TO_SENT=false."""
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_EMAIL_ADDRESS", "test@example.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_PASSWORD", "pass")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_IMAP_HOST", "imap.test.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_SMTP_HOST", "smtp.test.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_SAVE_TO_SENT", "false")
-
-        results = EmailSettings.from_env_many()
-        assert results is not None
-        assert len(results) == 1
-        result = results[0]
-        assert result.save_to_sent is False
-
-    def test_sent_folder_name_from_env(self, monkeypatch):
-        """Test MCP_EMAIL_SERVER_SENT_FOLDER_NAME."""
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_EMAIL_ADDRESS", "test@example.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_PASSWORD", "pass")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_IMAP_HOST", "imap.test.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_SMTP_HOST", "smtp.test.com")
-        monkeypatch.setenv("MCP_EMAIL_ACCOUNT_SENT_FOLDER_NAME", "INBOX.Sent")
+    @pytest.fixture
+    def base_account_env(self, monkeypatch):
+        """Set the minimal account variables shared by every from-env case."""
+        for key, value in {
+            "MCP_EMAIL_ACCOUNT_EMAIL_ADDRESS": "test@example.com",
+            "MCP_EMAIL_ACCOUNT_PASSWORD": "pass",
+            "MCP_EMAIL_ACCOUNT_IMAP_HOST": "imap.test.com",
+            "MCP_EMAIL_ACCOUNT_SMTP_HOST": "smtp.test.com",
+        }.items():
+            monkeypatch.setenv(key, value)
+        return monkeypatch
+
+    @pytest.mark.parametrize(
+        ("env_key", "env_value", "attr", "expected"),
+        [
+            pytest.param("MCP_EMAIL_ACCOUNT_SAVE_TO_SENT", "true", "save_to_sent", True, id="save-to-sent-true"),
+            pytest.param("MCP_EMAIL_ACCOUNT_SAVE_TO_SENT", "false", "save_to_sent", False, id="save-to-sent-false"),
+            pytest.param(
+                "MCP_EMAIL_ACCOUNT_SENT_FOLDER_NAME", "INBOX.Sent", "sent_folder_name", "INBOX.Sent", id="sent-folder"
+            ),
+        ],
+    )
+    def test_account_option_from_env(self, base_account_env, env_key, env_value, attr, expected):
+        """Each optional account variable lands on the matching settings field."""
+        base_account_env.setenv(env_key, env_value)
 
         results = EmailSettings.from_env_many()
         assert results is not None
         assert len(results) == 1
-        result = results[0]
-        assert result.sent_folder_name == "INBOX.Sent"
+        assert getattr(results[0], attr) == expected
 
 
 class TestClassicEmailHandlerSaveToSent:
@@ -203,23 +128,29 @@ class TestClassicEmailHandlerSaveToSent:
         handler = ClassicEmailHandler(email_settings_with_save_to_sent)
 
         mock_msg = MIMEText("Test body")
-        mock_send = AsyncMock(return_value=mock_msg)
+        mock_build = AsyncMock(return_value=mock_msg)
+        mock_smtp_send = AsyncMock()
         mock_append = AsyncMock(return_value=True)
 
-        with patch.object(handler.outgoing_client, "send_email", mock_send):
-            with patch.object(handler.outgoing_client, "append_to_sent", mock_append):
-                await handler.send_email(
-                    recipients=["recipient@example.com"],
-                    subject="Test",
-                    body="Test body",
-                )
-
-                mock_send.assert_called_once()
-                mock_append.assert_called_once_with(
-                    mock_msg,
-                    email_settings_with_save_to_sent.incoming,
-                    "INBOX.Sent",
-                )
+        with (
+            patch.object(handler.outgoing_client, "build_message", mock_build),
+            patch.object(handler.outgoing_client, "_smtp_send", mock_smtp_send),
+            patch.object(handler.outgoing_client, "append_to_sent", mock_append),
+        ):
+            await handler.send_email(
+                recipients=["recipient@example.com"],
+                subject="Test",
+                body="Test body",
+            )
+
+        mock_smtp_send.assert_called_once()
+        mock_append.assert_called_once()
+        # The appended message is a separate copy of the composed message.
+        appended_msg, incoming, folder = mock_append.call_args.args
+        assert appended_msg is not mock_msg
+        assert appended_msg.get_payload() == mock_msg.get_payload()
+        assert incoming == email_settings_with_save_to_sent.incoming
+        assert folder == "INBOX.Sent"
 
     @pytest.mark.asyncio
     async def test_send_email_skips_append_when_disabled(self, email_settings_without_save_to_sent):
@@ -227,46 +158,32 @@ class TestClassicEmailHandlerSaveToSent:
         handler = ClassicEmailHandler(email_settings_without_save_to_sent)
 
         mock_msg = MIMEText("Test body")
-        mock_send = AsyncMock(return_value=mock_msg)
+        mock_build = AsyncMock(return_value=mock_msg)
+        mock_smtp_send = AsyncMock()
         mock_append = AsyncMock()
 
-        with patch.object(handler.outgoing_client, "send_email", mock_send):
-            with patch.object(handler.outgoing_client, "append_to_sent", mock_append):
-                await handler.send_email(
-                    recipients=["recipient@example.com"],
-                    subject="Test",
-                    body="Test body",
-                )
+        with (
+            patch.object(handler.outgoing_client, "build_message", mock_build),
+            patch.object(handler.outgoing_client, "_smtp_send", mock_smtp_send),
+            patch.object(handler.outgoing_client, "append_to_sent", mock_append),
+        ):
+            await handler.send_email(
+                recipients=["recipient@example.com"],
+                subject="Test",
+                body="Test body",
+            )
 
-                mock_send.assert_called_once()
-                mock_append.assert_not_called()
+        mock_smtp_send.assert_called_once()
+        mock_append.assert_not_called()
 
 
 class TestEmailClientAppendToSent:
     """Tests for EmailClient.append_to_sent method."""
 
     @pytest.fixture
-    def email_client(self):
+    def email_client(self, outgoing_server):
         """Create an EmailClient for testing."""
-        server = EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="smtp.example.com",
-            port=465,
-            use_ssl=True,
-        )
-        return EmailClient(server)
-
-    @pytest.fixture
-    def incoming_server(self):
-        """Create an incoming EmailServer for testing."""
-        return EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="imap.example.com",
-            port=993,
-            use_ssl=True,
-        )
+        return EmailClient(outgoing_server)
 
     @pytest.fixture
     def mock_imap_for_append(self, completed_awaitable):
@@ -280,84 +197,132 @@ class TestEmailClientAppendToSent:
         mock.logout = AsyncMock()
         return mock
 
-    @pytest.mark.asyncio
-    async def test_append_to_sent_success(self, email_client, incoming_server, mock_imap_for_append):
-        """Test successful append to sent folder."""
+    @pytest.fixture(scope="module")
+    def sent_message(self):
+        """One prebuilt message shared across append tests.
+
+        Safe at module scope because append_to_sent only serializes the
+        message; no test mutates it.
+        """
         msg = MIMEText("Test body")
         msg["Subject"] = "Test"
         msg["From"] = "test@example.com"
         msg["To"] = "recipient@example.com"
-
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
-
-            result = await email_client.append_to_sent(msg, incoming_server, "INBOX.Sent")
-
-            assert result is True
+        return msg
+
+    @pytest.mark.parametrize(
+        ("failure", "sent_folder", "expected"),
+        [
+            pytest.param(None, "INBOX.Sent", True, id="success"),
+            pytest.param("select", None, False, id="no-valid-folder"),
+            pytest.param("append", "Sent", False, id="append-fails"),
+            pytest.param("login", "Sent", False, id="login-error"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_append_to_sent_outcomes(
+        self,
+        email_client,
+        incoming_server,
+        mock_imap_for_append,
+        sent_message,
+        failure,
+        sent_folder,
+        expected,
+        patched_aioimaplib,
+    ):
+        """append_to_sent returns True on success and False on each failure mode."""
+        if failure == "select":
+            mock_imap_for_append.select = AsyncMock(return_value=("NO", []))
+        elif failure == "append":
+            mock_imap_for_append.append = AsyncMock(return_value=("NO", []))
+        elif failure == "login":
+            mock_imap_for_append.login = AsyncMock(side_effect=Exception("Login failed"))
+
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
+
+        result = await email_client.append_to_sent(sent_message, incoming_server, sent_folder)
+
+        assert result is expected
+        if failure is None:
             mock_imap_for_append.select.assert_called_with('"INBOX.Sent"')
             mock_imap_for_append.append.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_append_to_sent_auto_detect_folder(self, email_client, incoming_server, mock_imap_for_append):
+    async def test_append_to_sent_auto_detect_folder(
+        self, email_client, incoming_server, mock_imap_for_append, sent_message, patched_aioimaplib
+    ):
         """Test auto-detection of sent folder."""
-        msg = MIMEText("Test body")
-        msg["Subject"] = "Test"
+        msg = sent_message
 
         # First folder fails, second succeeds
         mock_imap_for_append.select = AsyncMock(side_effect=[("NO", []), ("OK", [])])
 
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
 
-            result = await email_client.append_to_sent(msg, incoming_server, None)
+        result = await email_client.append_to_sent(msg, incoming_server, None)
 
-            assert result is True
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_append_to_sent_no_valid_folder(self, email_client, incoming_server, mock_imap_for_append):
-        """Test when no valid sent folder is found."""
-        msg = MIMEText("Test body")
-
-        # All folders fail
-        mock_imap_for_append.select = AsyncMock(return_value=("NO", []))
+    async def test_append_to_sent_reuses_pooled_connection(
+        self, email_client, incoming_server, mock_imap_for_append, sent_message, patched_aioimaplib
+    ):
+        """A successful append returns the connection to the pool for the next send."""
+        mock_imap_for_append.noop = AsyncMock(return_value=("OK", []))
 
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
 
-            result = await email_client.append_to_sent(msg, incoming_server, None)
+        assert await email_client.append_to_sent(sent_message, incoming_server, "INBOX.Sent") is True
+        assert await email_client.append_to_sent(sent_message, incoming_server, "INBOX.Sent") is True
 
-            assert result is False
+        # One connection, one login; the second send revalidates with NOOP.
+        patched_aioimaplib.IMAP4_SSL.assert_called_once()
+        mock_imap_for_append.login.assert_called_once()
+        mock_imap_for_append.noop.assert_awaited_once()
+        mock_imap_for_append.logout.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_append_to_sent_append_fails(self, email_client, incoming_server, mock_imap_for_append):
-        """Test when append command fails."""
-        msg = MIMEText("Test body")
+    async def test_overlapping_appends_close_displaced_pooled_connection(
+        self, email_client, incoming_server, mock_imap_for_append, sent_message, patched_aioimaplib, completed_awaitable
+    ):
+        """When two appends race, the connection displaced from the pool is closed."""
+        other = AsyncMock()
+        other._client_task = completed_awaitable
+        other.logout = AsyncMock()
+        # An overlapping append pooled its connection while ours was in flight.
+        pool_key = (incoming_server.host, incoming_server.port, incoming_server.user_name)
 
-        mock_imap_for_append.append = AsyncMock(return_value=("NO", []))
+        async def pool_other_then_append(*args, **kwargs):
+            classic._append_imap_pool[pool_key] = other
+            return ("OK", [])
 
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
+        mock_imap_for_append.append = AsyncMock(side_effect=pool_other_then_append)
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
 
-            result = await email_client.append_to_sent(msg, incoming_server, "Sent")
+        assert await email_client.append_to_sent(sent_message, incoming_server, "Sent") is True
 
-            assert result is False
+        other.logout.assert_called_once()
+        assert classic._append_imap_pool[pool_key] is mock_imap_for_append
 
     @pytest.mark.asyncio
-    async def test_append_to_sent_login_error(self, email_client, incoming_server, mock_imap_for_append):
-        """Test when login fails."""
-        msg = MIMEText("Test body")
-
-        mock_imap_for_append.login = AsyncMock(side_effect=Exception("Login failed"))
+    async def test_append_failure_drops_connection(
+        self, email_client, incoming_server, mock_imap_for_append, sent_message, patched_aioimaplib
+    ):
+        """A failed append logs the connection out instead of pooling it."""
+        mock_imap_for_append.append = AsyncMock(return_value=("NO", []))
 
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap_for_append
 
-            result = await email_client.append_to_sent(msg, incoming_server, "Sent")
+        assert await email_client.append_to_sent(sent_message, incoming_server, "Sent") is False
 
-            assert result is False
+        mock_imap_for_append.logout.assert_called_once()
+        assert classic._append_imap_pool == {}
 
     @pytest.mark.asyncio
-    async def test_append_to_sent_non_ssl(self, incoming_server, mock_imap_for_append):
+    async def test_append_to_sent_non_ssl(
+        self, incoming_server, mock_imap_for_append, sent_message, patched_aioimaplib
+    ):
         """Test append with non-SSL connection."""
         server = EmailServer(
             user_name="test_user",
@@ -376,31 +341,23 @@ class TestEmailClientAppendToSent:
             use_ssl=False,
         )
 
-        msg = MIMEText("Test body")
+        msg = sent_message
 
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4.return_value = mock_imap_for_append
+        patched_aioimaplib.IMAP4.return_value = mock_imap_for_append
 
-            result = await client.append_to_sent(msg, incoming_non_ssl, "Sent")
+        result = await client.append_to_sent(msg, incoming_non_ssl, "Sent")
 
-            assert result is True
-            mock_aioimaplib.IMAP4.assert_called_once()
+        assert result is True
+        patched_aioimaplib.IMAP4.assert_called_once()
 
 
 class TestEmailClientSendEmailReturnsMessage:
     """Tests for EmailClient.send_email returning the message."""
 
     @pytest.fixture
-    def email_client(self):
+    def email_client(self, outgoing_server):
         """Create an EmailClient for testing."""
-        server = EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="smtp.example.com",
-            port=465,
-            use_ssl=True,
-        )
-        return EmailClient(server, sender="Test <test@example.com>")
+        return EmailClient(outgoing_server, sender="Test <test@example.com>")
 
     @pytest.mark.asyncio
     async def test_send_email_returns_message(self, email_client):
@@ -409,7 +366,7 @@ class TestEmailClientSendEmailReturnsMessage:
         mock_smtp.__aenter__ = AsyncMock(return_value=mock_smtp)
         mock_smtp.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("mcp_email_server.emails.classic.aiosmtplib.SMTP", return_value=mock_smtp):
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
             result = await email_client.send_email(
                 recipients=["recipient@example.com"],
                 subject="Test Subject",
@@ -425,134 +382,79 @@ class TestFindSentFolderByFlag:
     """Tests for _find_sent_folder_by_flag method."""
 
     @pytest.fixture
-    def email_client(self):
+    def email_client(self, outgoing_server):
         """Create an EmailClient for testing."""
-        server = EmailServer(
-            user_name="test_user",
-            password="test_password",
-            host="smtp.example.com",
-            port=465,
-            use_ssl=True,
-        )
-        return EmailClient(server)
+        return EmailClient(outgoing_server)
 
-    @pytest.fixture
-    def mock_imap_with_sent_flag(self):
-        """Create a mock IMAP client with Sent folder."""
+    @staticmethod
+    def _mock_imap_with_list(response):
+        """Mock IMAP client whose LIST command returns the given response."""
         mock = AsyncMock()
-        # Simulate IMAP LIST response with \Sent flag
-        mock.list = AsyncMock(
-            return_value=(
-                "OK",
+        mock.list = AsyncMock(return_value=response)
+        return mock
+
+    @pytest.mark.parametrize(
+        ("list_lines", "expected"),
+        [
+            pytest.param(
                 [
                     b'(\\HasNoChildren) "/" "INBOX"',
                     b'(\\Sent \\HasNoChildren) "/" "Gesendete Objekte"',
                     b'(\\Drafts \\HasNoChildren) "/" "Entwuerfe"',
                 ],
-            )
-        )
-        return mock
-
-    @pytest.fixture
-    def mock_imap_without_sent_flag(self):
-        """Create a mock IMAP client without Sent folder."""
-        mock = AsyncMock()
-        mock.list = AsyncMock(
-            return_value=(
-                "OK",
+                "Gesendete Objekte",
+                id="flag-among-folders",
+            ),
+            pytest.param(
+                [b'(\\Sent \\HasNoChildren) "/" "Gesendete Objekte"'],
+                "Gesendete Objekte",
+                id="name-with-spaces",
+            ),
+            pytest.param(
+                [b'(\\Sent \\HasNoChildren) "/" "[Gmail]/Gesendet"'],
+                "[Gmail]/Gesendet",
+                id="gmail-style",
+            ),
+            pytest.param(
+                [b'(\\Sent \\HasNoChildren) "/" "Gesendete &ANw-bjekte"'],
+                "Gesendete \u00dcbjekte",
+                id="modified-utf7-decoded",
+            ),
+            pytest.param(
+                ['(\\Sent \\HasNoChildren) "/" "Sent Items"'],
+                "Sent Items",
+                id="string-response",
+            ),
+            pytest.param(
                 [
                     b'(\\HasNoChildren) "/" "INBOX"',
                     b'(\\Drafts \\HasNoChildren) "/" "Drafts"',
                 ],
-            )
-        )
-        return mock
-
-    @pytest.fixture
-    def mock_imap_list_error(self):
-        """Create a mock IMAP client that raises error on list."""
-        mock = AsyncMock()
-        mock.list = AsyncMock(side_effect=Exception("IMAP list failed"))
-        return mock
-
-    @pytest.mark.asyncio
-    async def test_find_sent_folder_by_flag_success(self, email_client, mock_imap_with_sent_flag):
-        """Test successful detection of Sent folder via IMAP flag."""
-        result = await email_client._find_sent_folder_by_flag(mock_imap_with_sent_flag)
-
-        assert result == "Gesendete Objekte"
-        mock_imap_with_sent_flag.list.assert_called_once_with('""', "*")
-
+                None,
+                id="no-sent-flag",
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_find_sent_folder_by_flag_with_spaces(self, email_client):
-        """Test detection with folder name containing spaces (IONOS case)."""
-        mock = AsyncMock()
-        mock.list = AsyncMock(
-            return_value=(
-                "OK",
-                [b'(\\Sent \\HasNoChildren) "/" "Gesendete Objekte"'],
-            )
-        )
+    async def test_find_sent_folder_by_flag(self, email_client, list_lines, expected):
+        """The folder carrying the \\Sent flag is returned decoded, or None."""
+        mock = self._mock_imap_with_list(("OK", list_lines))
 
         result = await email_client._find_sent_folder_by_flag(mock)
-        assert result == "Gesendete Objekte"
 
-    @pytest.mark.asyncio
-    async def test_find_sent_folder_by_flag_gmail_style(self, email_client):
-        """Test detection with Gmail-style folder structure."""
-        mock = AsyncMock()
-        mock.list = AsyncMock(
-            return_value=(
-                "OK",
-                [b'(\\Sent \\HasNoChildren) "/" "[Gmail]/Gesendet"'],
-            )
-        )
-
-        result = await email_client._find_sent_folder_by_flag(mock)
-        assert result == "[Gmail]/Gesendet"
+        assert result == expected
+        mock.list.assert_called_once_with('""', "*")
 
     @pytest.mark.asyncio
-    async def test_find_sent_folder_by_flag_decodes_modified_utf7(self, email_client):
-        """Sent folder detection should return decoded Unicode folder names."""
+    async def test_find_sent_folder_by_flag_handles_error(self, email_client):
+        """Test error handling when IMAP list fails."""
         mock = AsyncMock()
-        mock.list = AsyncMock(
-            return_value=(
-                "OK",
-                [b'(\\Sent \\HasNoChildren) "/" "Gesendete &ANw-bjekte"'],
-            )
-        )
+        mock.list = AsyncMock(side_effect=Exception("IMAP list failed"))
 
         result = await email_client._find_sent_folder_by_flag(mock)
-        assert result == "Gesendete Übjekte"
-
-    @pytest.mark.asyncio
-    async def test_find_sent_folder_by_flag_not_found(self, email_client, mock_imap_without_sent_flag):
-        """Test when no folder with \\Sent flag exists."""
-        result = await email_client._find_sent_folder_by_flag(mock_imap_without_sent_flag)
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_find_sent_folder_by_flag_handles_error(self, email_client, mock_imap_list_error):
-        """Test error handling when IMAP list fails."""
-        result = await email_client._find_sent_folder_by_flag(mock_imap_list_error)
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_find_sent_folder_by_flag_with_string_response(self, email_client):
-        """Test handling of string (non-bytes) folder responses."""
-        mock = AsyncMock()
-        mock.list = AsyncMock(
-            return_value=(
-                "OK",
-                ['(\\Sent \\HasNoChildren) "/" "Sent Items"'],
-            )
-        )
-
-        result = await email_client._find_sent_folder_by_flag(mock)
-        assert result == "Sent Items"
-
 
 class TestAppendToSentWithFlagDetection:
     """Tests for append_to_sent integration with flag detection."""
@@ -581,13 +483,12 @@ class TestAppendToSentWithFlagDetection:
         )
 
     @pytest.mark.asyncio
-    async def test_append_uses_flag_detected_folder(self, email_client, incoming_server):
+    async def test_append_uses_flag_detected_folder(self, email_client, incoming_server, patched_aioimaplib):
         """Test that append_to_sent uses flag-detected folder when auto-detecting."""
         msg = MIMEText("Test body")
 
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.list = AsyncMock(
@@ -600,23 +501,21 @@ class TestAppendToSentWithFlagDetection:
         mock_imap.append = AsyncMock(return_value=("OK", []))
         mock_imap.logout = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
 
-            result = await email_client.append_to_sent(msg, incoming_server, None)
+        result = await email_client.append_to_sent(msg, incoming_server, None)
 
-            assert result is True
-            # Verify it used the flag-detected folder with proper quoting
-            mock_imap.select.assert_called_with('"Gesendete Objekte"')
+        assert result is True
+        # Verify it used the flag-detected folder with proper quoting
+        mock_imap.select.assert_called_with('"Gesendete Objekte"')
 
     @pytest.mark.asyncio
-    async def test_append_prefers_flag_over_explicit(self, email_client, incoming_server):
+    async def test_append_prefers_flag_over_explicit(self, email_client, incoming_server, patched_aioimaplib):
         """Test that IMAP flag detection has highest priority, even with explicit folder."""
         msg = MIMEText("Test body")
 
         mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
+        mock_imap._client_task = _CompletedAwaitable()
         mock_imap.wait_hello_from_server = AsyncMock()
         mock_imap.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
         mock_imap.list = AsyncMock(
@@ -629,15 +528,113 @@ class TestAppendToSentWithFlagDetection:
         mock_imap.append = AsyncMock(return_value=("OK", []))
         mock_imap.logout = AsyncMock()
 
-        with patch("mcp_email_server.emails.classic.aioimaplib") as mock_aioimaplib:
-            mock_aioimaplib.IMAP4_SSL.return_value = mock_imap
+        patched_aioimaplib.IMAP4_SSL.return_value = mock_imap
+
+        # Even with explicit folder, flag-detected should be preferred (most reliable)
+        result = await email_client.append_to_sent(msg, incoming_server, "INBOX.Sent")
+
+        assert result is True
+        # Should use flag-detected folder (highest priority)
+        mock_imap.select.assert_called_with('"Flag Detected"')
 
-            # Even with explicit folder, flag-detected should be preferred (most reliable)
-            result = await email_client.append_to_sent(msg, incoming_server, "INBOX.Sent")
 
-            assert result is True
-            # Should use flag-detected folder (highest priority)
-            mock_imap.select.assert_called_with('"Flag Detected"')
+class TestSentFolderCache:
+    """Tests for caching the discovered Sent folder across append calls."""
+
+    @pytest.fixture
+    def email_client(self):
+        """Create an EmailClient for testing."""
+        server = EmailServer(
+            user_name="test_user",
+            password="test_password",
+            host="smtp.example.com",
+            port=465,
+            use_ssl=True,
+        )
+        return EmailClient(server)
+
+    @pytest.fixture
+    def incoming_server(self):
+        """Create an incoming EmailServer for testing."""
+        return EmailServer(
+            user_name="test_user",
+            password="test_password",
+            host="imap.example.com",
+            port=993,
+            use_ssl=True,
+        )
+
+    @staticmethod
+    def _make_mock_imap():
+        mock = AsyncMock()
+        mock._client_task = _CompletedAwaitable()
+        mock.wait_hello_from_server = AsyncMock()
+        mock.login = AsyncMock(return_value=MagicMock(result="OK", lines=[]))
+        mock.list = AsyncMock(
+            return_value=(
+                "OK",
+                [b'(\\Sent \\HasNoChildren) "/" "Gesendete Objekte"'],
+            )
+        )
+        mock.select = AsyncMock(return_value=("OK", []))
+        mock.append = AsyncMock(return_value=("OK", []))
+        mock.logout = AsyncMock()
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_second_append_skips_flag_discovery(self, email_client, incoming_server, patched_aioimaplib):
+        """A successful append caches the folder; the next append skips LIST."""
+        msg = MIMEText("Test body")
+
+        first_imap = self._make_mock_imap()
+        second_imap = self._make_mock_imap()
+
+        patched_aioimaplib.IMAP4_SSL.return_value = first_imap
+        assert await email_client.append_to_sent(msg, incoming_server, None) is True
+        first_imap.list.assert_called_once()
+
+        patched_aioimaplib.IMAP4_SSL.return_value = second_imap
+        assert await email_client.append_to_sent(msg, incoming_server, None) is True
+        second_imap.list.assert_not_called()
+        # Cached folder tried first, no other candidates probed
+        second_imap.select.assert_called_once_with('"Gesendete Objekte"')
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_falls_back_to_candidates(self, email_client, incoming_server, patched_aioimaplib):
+        """A cached folder that no longer selects falls back to the usual candidates."""
+        msg = MIMEText("Test body")
+
+        first_imap = self._make_mock_imap()
+        second_imap = self._make_mock_imap()
+        # Cached "Gesendete Objekte" now fails; plain "Sent" works
+        second_imap.select = AsyncMock(side_effect=[("NO", []), ("OK", [])])
+
+        patched_aioimaplib.IMAP4_SSL.return_value = first_imap
+        assert await email_client.append_to_sent(msg, incoming_server, None) is True
+
+        patched_aioimaplib.IMAP4_SSL.return_value = second_imap
+        assert await email_client.append_to_sent(msg, incoming_server, None) is True
+        assert second_imap.select.call_args_list[0].args == ('"Gesendete Objekte"',)
+        assert second_imap.select.call_args_list[1].args == ('"Sent"',)
+
+    @pytest.mark.asyncio
+    async def test_no_valid_folder_clears_cache(self, email_client, incoming_server, patched_aioimaplib):
+        """If every folder fails, the stale cache entry is dropped."""
+        msg = MIMEText("Test body")
+
+        first_imap = self._make_mock_imap()
+        second_imap = self._make_mock_imap()
+        second_imap.select = AsyncMock(return_value=("NO", []))
+
+        from mcp_email_server.emails.classic import _sent_folder_cache
+
+        patched_aioimaplib.IMAP4_SSL.return_value = first_imap
+        assert await email_client.append_to_sent(msg, incoming_server, None) is True
+        assert _sent_folder_cache
+
+        patched_aioimaplib.IMAP4_SSL.return_value = second_imap
+        assert await email_client.append_to_sent(msg, incoming_server, None) is False
+        assert not _sent_folder_cache
 
 
 class TestSendEmailSentCopyBcc:
@@ -648,36 +645,46 @@ class TestSendEmailSentCopyBcc:
         handler = ClassicEmailHandler(email_settings_with_save_to_sent)
 
         mock_msg = MIMEText("Test body")
-        mock_send = AsyncMock(return_value=mock_msg)
+        mock_build = AsyncMock(return_value=mock_msg)
+        mock_smtp_send = AsyncMock()
         mock_append = AsyncMock(return_value=True)
 
-        with patch.object(handler.outgoing_client, "send_email", mock_send):
-            with patch.object(handler.outgoing_client, "append_to_sent", mock_append):
-                await handler.send_email(
-                    recipients=["r@example.com"],
-                    subject="Test",
-                    body="Test body",
-                    bcc=["secret@example.com"],
-                )
+        with (
+            patch.object(handler.outgoing_client, "build_message", mock_build),
+            patch.object(handler.outgoing_client, "_smtp_send", mock_smtp_send),
+            patch.object(handler.outgoing_client, "append_to_sent", mock_append),
+        ):
+            await handler.send_email(
+                recipients=["r@example.com"],
+                subject="Test",
+                body="Test body",
+                bcc=["secret@example.com"],
+            )
 
         appended_msg = mock_append.call_args[0][0]
         assert appended_msg["Bcc"] == "secret@example.com"
+        # The message handed to SMTP must never carry the BCC header.
+        assert mock_smtp_send.call_args.args[0]["Bcc"] is None
 
     @pytest.mark.asyncio
     async def test_sent_copy_no_bcc_when_none(self, email_settings_with_save_to_sent):
         handler = ClassicEmailHandler(email_settings_with_save_to_sent)
 
         mock_msg = MIMEText("Test body")
-        mock_send = AsyncMock(return_value=mock_msg)
+        mock_build = AsyncMock(return_value=mock_msg)
+        mock_smtp_send = AsyncMock()
         mock_append = AsyncMock(return_value=True)
 
-        with patch.object(handler.outgoing_client, "send_email", mock_send):
-            with patch.object(handler.outgoing_client, "append_to_sent", mock_append):
-                await handler.send_email(
-                    recipients=["r@example.com"],
-                    subject="Test",
-                    body="Test body",
-                )
+        with (
+            patch.object(handler.outgoing_client, "build_message", mock_build),
+            patch.object(handler.outgoing_client, "_smtp_send", mock_smtp_send),
+            patch.object(handler.outgoing_client, "append_to_sent", mock_append),
+        ):
+            await handler.send_email(
+                recipients=["r@example.com"],
+                subject="Test",
+                body="Test body",
+            )
 
         appended_msg = mock_append.call_args[0][0]
         assert appended_msg["Bcc"] is None
@@ -713,19 +720,114 @@ class TestHandlerErrorHandling:
         handler = ClassicEmailHandler(settings)
 
         mock_msg = MIMEText("Test body")
-        mock_send = AsyncMock(return_value=mock_msg)
+        mock_build = AsyncMock(return_value=mock_msg)
+        mock_smtp_send = AsyncMock()
         mock_append = AsyncMock(side_effect=Exception("IMAP connection failed"))
 
-        with patch.object(handler.outgoing_client, "send_email", mock_send):
-            with patch.object(handler.outgoing_client, "append_to_sent", mock_append):
-                # Should not raise exception even though append fails
-                await handler.send_email(
-                    recipients=["recipient@example.com"],
-                    subject="Test",
-                    body="Test body",
-                )
-
-                # Email should still be sent
-                mock_send.assert_called_once()
-                # Append was attempted
-                mock_append.assert_called_once()
+        with (
+            patch.object(handler.outgoing_client, "build_message", mock_build),
+            patch.object(handler.outgoing_client, "_smtp_send", mock_smtp_send),
+            patch.object(handler.outgoing_client, "append_to_sent", mock_append),
+        ):
+            # Should not raise exception even though append fails
+            await handler.send_email(
+                recipients=["recipient@example.com"],
+                subject="Test",
+                body="Test body",
+            )
+
+        # Email should still be sent
+        mock_smtp_send.assert_called_once()
+        # Append was attempted
+        mock_append.assert_called_once()
+
+
+class TestSendFailureCompensation:
+    """SMTP failure after a concurrent successful APPEND removes the Sent copy."""
+
+    @staticmethod
+    def _handler():
+        settings = EmailSettings(
+            account_name="test",
+            full_name="Test User",
+            email_address="test@example.com",
+            incoming=EmailServer(
+                user_name="test_user",
+                password="test_password",
+                host="imap.example.com",
+                port=993,
+                use_ssl=True,
+            ),
+            outgoing=EmailServer(
+                user_name="test_user",
+                password="test_password",
+                host="smtp.example.com",
+                port=465,
+                use_ssl=True,
+            ),
+            save_to_sent=True,
+            sent_folder_name="Sent",
+        )
+        return ClassicEmailHandler(settings)
+
+    @pytest.mark.asyncio
+    async def test_smtp_failure_after_append_removes_sent_copy(self):
+        handler = self._handler()
+        mock_msg = MIMEText("Test body")
+        mock_msg["Message-Id"] = "<compensate@example.com>"
+        mock_remove = AsyncMock()
+
+        with (
+            patch.object(handler.outgoing_client, "build_message", AsyncMock(return_value=mock_msg)),
+            patch.object(handler.outgoing_client, "_smtp_send", AsyncMock(side_effect=ConnectionError("boom"))),
+            patch.object(handler.outgoing_client, "append_to_sent", AsyncMock(return_value=True)),
+            patch.object(handler, "_remove_unsent_sent_copy", mock_remove),
+        ):
+            with pytest.raises(ConnectionError, match="boom"):
+                await handler.send_email(recipients=["r@example.com"], subject="Test", body="Test body")
+
+        mock_remove.assert_called_once_with("<compensate@example.com>")
+
+    @pytest.mark.asyncio
+    async def test_no_compensation_when_append_also_failed(self):
+        handler = self._handler()
+        mock_remove = AsyncMock()
+
+        with (
+            patch.object(handler.outgoing_client, "build_message", AsyncMock(return_value=MIMEText("x"))),
+            patch.object(handler.outgoing_client, "_smtp_send", AsyncMock(side_effect=ConnectionError("boom"))),
+            patch.object(handler.outgoing_client, "append_to_sent", AsyncMock(side_effect=Exception("no imap"))),
+            patch.object(handler, "_remove_unsent_sent_copy", mock_remove),
+        ):
+            with pytest.raises(ConnectionError, match="boom"):
+                await handler.send_email(recipients=["r@example.com"], subject="Test", body="Test body")
+
+        mock_remove.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_remove_unsent_sent_copy_deletes_by_message_id(self):
+        from mcp_email_server.emails.classic import _sent_folder_cache
+
+        handler = self._handler()
+        _sent_folder_cache[("imap.example.com", "test_user")] = "Gesendete Objekte"
+
+        mock_imap = TestSentFolderCache._make_mock_imap()
+
+        # Enforce aioimaplib's real uid() dispatch: SEARCH is not a valid UID
+        # subcommand and must go through uid_search instead.
+        async def uid_dispatch(command, *args):
+            if command.upper() not in {"COPY", "FETCH", "STORE", "MOVE", "EXPUNGE"}:
+                raise aioimaplib.Abort(f"command UID only possible with COPY, FETCH, EXPUNGE or STORE (was {command})")
+            return ("OK", [])
+
+        mock_imap.uid = AsyncMock(side_effect=uid_dispatch)
+        mock_imap.uid_search = AsyncMock(return_value=("OK", [b"5"]))
+        mock_imap.expunge = AsyncMock(return_value=("OK", []))
+
+        with patch.object(handler.incoming_client, "imap_class", return_value=mock_imap):
+            await handler._remove_unsent_sent_copy("<compensate@example.com>")
+
+        mock_imap.select.assert_called_once_with('"Gesendete Objekte"')
+        mock_imap.uid_search.assert_called_once_with("HEADER", "Message-ID", "<compensate@example.com>")
+        assert mock_imap.uid.call_args_list == [call("store", "5", "+FLAGS", r"(\Deleted)")]
+        mock_imap.expunge.assert_called_once()